@@ -3,4 +3,9 @@ set -e
 
 poetry run alembic upgrade head
 
-poetry run uvicorn --host 0.0.0.0 --port 8000 src.app:app
\ No newline at end of file
+# nginx sends the caller's address in X-Forwarded-For. Only the proxy is
+# trusted to set it, so each client gets its own login rate-limit bucket
+# and direct callers cannot pick one.
+poetry run uvicorn --host 0.0.0.0 --port 8000 \
+    --proxy-headers --forwarded-allow-ips="${FORWARDED_ALLOW_IPS:-127.0.0.1}" \
+    src.app:app
\ No newline at end of file
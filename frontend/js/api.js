@@ -114,7 +114,63 @@ export async function parseErrorResponse(resp) {
   return "Ocorreu um erro inesperado. Tente novamente.";
 }
 
-export async function apiFetch(path, options = {}) {
+export function storeTokens(data) {
+  localStorage.setItem("access_token", data.access_token);
+  if (data.refresh_token) {
+    localStorage.setItem("refresh_token", data.refresh_token);
+  }
+}
+
+function clearTokens() {
+  localStorage.removeItem("access_token");
+  localStorage.removeItem("refresh_token");
+}
+
+let pendingRefresh = null;
+
+// Runs `task` holding a lock shared by every tab of the origin, where the
+// browser supports the Web Locks API.
+function withRefreshLock(task) {
+  if (!navigator.locks) return task();
+  return navigator.locks.request("refresh_token", task);
+}
+
+async function rotateRefreshToken(refreshToken) {
+  // Another tab may have rotated the token while this one waited for the
+  // lock: the stored pair is already fresh and the old token is spent.
+  if (localStorage.getItem("refresh_token") !== refreshToken) {
+    return !!localStorage.getItem("refresh_token");
+  }
+
+  const resp = await fetch(`${API_BASE}/auth/refresh`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ refresh_token: refreshToken }),
+  });
+  if (!resp.ok) return false;
+  storeTokens(await resp.json());
+  return true;
+}
+
+// Exchanges the stored refresh token for a new token pair. Concurrent
+// callers share one request, and tabs take turns through a lock, so a
+// rotated token is never presented twice.
+function refreshSession() {
+  const refreshToken = localStorage.getItem("refresh_token");
+  if (!refreshToken) return Promise.resolve(false);
+
+  if (!pendingRefresh) {
+    pendingRefresh = withRefreshLock(() => rotateRefreshToken(refreshToken))
+      .catch(() => false)
+      .finally(() => {
+        pendingRefresh = null;
+      });
+  }
+
+  return pendingRefresh;
+}
+
+export async function apiFetch(path, options = {}, retried = false) {
   const token = localStorage.getItem("access_token");
 
   const headers = {
@@ -126,7 +182,11 @@ export async function apiFetch(path, options = {}) {
   const response = await fetch(`${API_BASE}${path}`, { ...options, headers });
 
   if (response.status === 401) {
-    localStorage.removeItem("access_token");
+    if (!retried && (await refreshSession())) {
+      return apiFetch(path, options, true);
+    }
+
+    clearTokens();
     window.location.href = "/index.html";
     return;
   }
@@ -139,6 +199,21 @@ export function isAuthenticated() {
 }
 
 export function logout() {
-  localStorage.removeItem("access_token");
+  const token = localStorage.getItem("access_token");
+  const refreshToken = localStorage.getItem("refresh_token");
+  if (token) {
+    // Fire-and-forget: revoke the tokens server-side while navigating away.
+    fetch(`${API_BASE}/auth/logout`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${token}`,
+      },
+      body: refreshToken ? JSON.stringify({ refresh_token: refreshToken }) : undefined,
+      keepalive: true,
+    }).catch(() => {});
+  }
+
+  clearTokens();
   window.location.href = "/index.html";
 }
@@ -1,4 +1,4 @@
-import { isAuthenticated, parseErrorResponse } from "./api.js";
+import { isAuthenticated, parseErrorResponse, storeTokens } from "./api.js";
 
 if (isAuthenticated()) {
   window.location.href = "/dashboard.html";
@@ -65,7 +65,7 @@ loginForm.addEventListener("submit", async (e) => {
     }
 
     const data = await response.json();
-    localStorage.setItem("access_token", data.access_token);
+    storeTokens(data);
     window.location.href = "/dashboard.html";
   } catch (err) {
     loginError.textContent = err.message;
@@ -131,7 +131,7 @@ regForm.addEventListener("submit", async (e) => {
     }
 
     const tokenData = await tokenResp.json();
-    localStorage.setItem("access_token", tokenData.access_token);
+    storeTokens(tokenData);
 
     setTimeout(() => {
       window.location.href = "/dashboard.html";
@@ -191,6 +191,7 @@ btnConfirmDelete.addEventListener("click", async () => {
 
   if (resp && resp.ok) {
     localStorage.removeItem("access_token");
+    localStorage.removeItem("refresh_token");
     window.location.href = "/index.html";
   } else {
     setLoading(btnConfirmDelete, false, "Sim, excluir minha conta");
@@ -15,6 +15,7 @@ const tenderIdInput    = document.getElementById("tender-id");
 const numberInput      = document.getElementById("tender-number");
 const yearInput        = document.getElementById("tender-year");
 const bodyInput        = document.getElementById("tender-body");
+const bodySuggestions  = document.getElementById("tender-body-suggestions");
 const descInput        = document.getElementById("tender-desc");
 const modalitySelect   = document.getElementById("tender-modality");
 const formatSelect     = document.getElementById("tender-format");
@@ -280,6 +281,34 @@ deleteModalClose.addEventListener("click", closeDeleteModal);
 modalOverlay.addEventListener("click", (e) => { if (e.target === modalOverlay) closeModal(); });
 deleteOverlay.addEventListener("click", (e) => { if (e.target === deleteOverlay) closeDeleteModal(); });
 
+// ── Public body suggestions ───────────────────────────────────────────
+let suggestTimer = null;
+
+bodyInput.addEventListener("input", () => {
+  clearTimeout(suggestTimer);
+  const query = bodyInput.value.trim();
+  if (!query) {
+    bodySuggestions.replaceChildren();
+    return;
+  }
+  suggestTimer = setTimeout(() => loadBodySuggestions(query), 150);
+});
+
+async function loadBodySuggestions(query) {
+  const params = new URLSearchParams({ q: query, limit: "10" });
+  const resp = await apiFetch(`/autocomplete/public-bodies?${params}`);
+  if (!resp || !resp.ok || bodyInput.value.trim() !== query) return;
+
+  const data = await resp.json();
+  bodySuggestions.replaceChildren(
+    ...data.suggestions.map((s) => {
+      const option = document.createElement("option");
+      option.value = s.name;
+      return option;
+    })
+  );
+}
+
 // ── Save ──────────────────────────────────────────────────────────────
 tenderForm.addEventListener("submit", async (e) => {
   e.preventDefault();
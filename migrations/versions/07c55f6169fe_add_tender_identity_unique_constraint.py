@@ -0,0 +1,65 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add tender identity unique constraint
+
+Revision ID: 07c55f6169fe
+Revises: 5907d82525e1
+Create Date: 2026-10-18 07:00:29.247333
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "07c55f6169fe"
+down_revision: Union[str, Sequence[str], None] = "5907d82525e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The old SELECT-then-INSERT check was racy, so refuse to run over
+    # duplicates instead of silently picking which rows to drop.
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT count(*) FROM ("
+                " SELECT 1 FROM tenders"
+                " GROUP BY company_id, tender_number, tender_year,"
+                " public_body_name, modality, format"
+                " HAVING count(*) > 1"
+                ") AS duplicated"
+            )
+        )
+        .scalar()
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} duplicated tender identities must be merged "
+            "before uq_tenders_identity can be created."
+        )
+
+    # Batch mode lets SQLite, which cannot ALTER constraints, rebuild the
+    # table; on PostgreSQL it is a plain ALTER TABLE.
+    with op.batch_alter_table("tenders") as batch:
+        batch.create_unique_constraint(
+            "uq_tenders_identity",
+            [
+                "company_id",
+                "tender_number",
+                "tender_year",
+                "public_body_name",
+                "modality",
+                "format",
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("tenders") as batch:
+        batch.drop_constraint("uq_tenders_identity", type_="unique")
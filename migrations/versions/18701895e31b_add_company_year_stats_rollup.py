@@ -0,0 +1,196 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add company year stats rollup
+
+Revision ID: 18701895e31b
+Revises: ea9497c50b4c
+Create Date: 2026-10-18 07:38:16.771593
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "18701895e31b"
+down_revision: Union[str, Sequence[str], None] = "ea9497c50b4c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TENDER_STATUSES = (
+    "MONITORING",
+    "ANALYSIS",
+    "APPROVED",
+    "REJECTED",
+    "REGISTERED",
+    "IN_PROGRESS",
+    "APPEAL",
+    "FINISHED",
+    "SUSPENDED",
+    "CANCELED",
+)
+
+
+def _postgres_upsert(rows: str, sign: str) -> str:
+    # Frozen copy of the company_year_stats upsert in src.infra.triggers.
+    return f"""
+        INSERT INTO company_year_stats AS stats (
+            company_id, tender_year, status, tender_count, won_count, awarded_value
+        )
+        SELECT
+            company_id, tender_year, status, {sign}count(*),
+            {sign}count(*) FILTER (WHERE participation_result = 'WON'),
+            {sign}coalesce(
+                sum(awarded_value) FILTER (WHERE participation_result = 'WON'), 0
+            )
+        FROM {rows}
+        GROUP BY company_id, tender_year, status
+        ON CONFLICT (company_id, tender_year, status) DO UPDATE SET
+            tender_count = stats.tender_count + excluded.tender_count,
+            won_count = stats.won_count + excluded.won_count,
+            awarded_value = stats.awarded_value + excluded.awarded_value;
+    """
+
+
+def _sqlite_upsert(row: str, sign: int) -> str:
+    # Frozen copy of the company_year_stats upsert in src.infra.triggers.
+    return f"""
+        INSERT INTO company_year_stats (
+            company_id, tender_year, status, tender_count, won_count, awarded_value
+        )
+        VALUES (
+            {row}.company_id, {row}.tender_year, {row}.status, {sign},
+            CASE WHEN {row}.participation_result = 'WON' THEN {sign} ELSE 0 END,
+            CASE WHEN {row}.participation_result = 'WON'
+                THEN {sign} * coalesce({row}.awarded_value, 0) ELSE 0 END
+        )
+        ON CONFLICT (company_id, tender_year, status) DO UPDATE SET
+            tender_count = tender_count + excluded.tender_count,
+            won_count = won_count + excluded.won_count,
+            awarded_value = awarded_value + excluded.awarded_value;
+    """
+
+
+POSTGRES_TRIGGERS = [
+    f"""
+    CREATE OR REPLACE FUNCTION company_year_stats_apply() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            {_postgres_upsert("old_rows", "-")}
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            {_postgres_upsert("new_rows", "")}
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER tenders_stats_insert AFTER INSERT ON tenders
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION company_year_stats_apply()
+    """,
+    """
+    CREATE TRIGGER tenders_stats_update AFTER UPDATE ON tenders
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION company_year_stats_apply()
+    """,
+    """
+    CREATE TRIGGER tenders_stats_delete AFTER DELETE ON tenders
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION company_year_stats_apply()
+    """,
+]
+
+SQLITE_TRIGGERS = [
+    f"""
+    CREATE TRIGGER tenders_stats_insert AFTER INSERT ON tenders BEGIN
+        {_sqlite_upsert("new", 1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER tenders_stats_update AFTER UPDATE ON tenders BEGIN
+        {_sqlite_upsert("old", -1)}
+        {_sqlite_upsert("new", 1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER tenders_stats_delete AFTER DELETE ON tenders BEGIN
+        {_sqlite_upsert("old", -1)}
+    END
+    """,
+]
+
+BACKFILL = """
+INSERT INTO company_year_stats (
+    company_id, tender_year, status, tender_count, won_count, awarded_value
+)
+SELECT
+    company_id, tender_year, status, count(*),
+    sum(CASE WHEN participation_result = 'WON' THEN 1 ELSE 0 END),
+    coalesce(
+        sum(CASE WHEN participation_result = 'WON' THEN awarded_value END), 0
+    )
+FROM tenders
+GROUP BY company_id, tender_year, status
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    op.create_table(
+        "company_year_stats",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("tender_year", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            (
+                postgresql.ENUM(
+                    *TENDER_STATUSES, name="tenderstatus", create_type=False
+                )
+                if dialect == "postgresql"
+                else sa.Enum(*TENDER_STATUSES, name="tenderstatus")
+            ),
+            nullable=False,
+        ),
+        sa.Column("tender_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("won_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("awarded_value", sa.Numeric(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "tender_year", "status"),
+    )
+
+    # Writes are blocked while the rollup is seeded, so no tender change
+    # can land between the backfill and the triggers taking over.
+    if dialect == "postgresql":
+        op.execute("LOCK TABLE tenders IN SHARE MODE")
+
+    op.execute(BACKFILL)
+    for statement in SQLITE_TRIGGERS if dialect == "sqlite" else POSTGRES_TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    for name in (
+        "tenders_stats_insert",
+        "tenders_stats_update",
+        "tenders_stats_delete",
+    ):
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {name} ON tenders"
+            if dialect == "postgresql"
+            else f"DROP TRIGGER IF EXISTS {name}"
+        )
+    if dialect == "postgresql":
+        op.execute("DROP FUNCTION IF EXISTS company_year_stats_apply()")
+
+    op.drop_table("company_year_stats")
@@ -0,0 +1,115 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add tender full text search
+
+Revision ID: 310a38e8e888
+Revises: 07c55f6169fe
+Create Date: 2026-10-18 07:04:55.592751
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "310a38e8e888"
+down_revision: Union[str, Sequence[str], None] = "07c55f6169fe"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copies of src.infra.triggers.TENDER_SEARCH_DDL.
+SEARCH_VECTOR_COLUMN = """
+ALTER TABLE tenders ADD COLUMN search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('portuguese', object_description), 'A')
+    || setweight(to_tsvector('portuguese', public_body_name), 'B')
+) STORED
+"""
+
+SQLITE_FTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tenders_fts USING fts5(
+        object_description, public_body_name,
+        content='tenders', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER tenders_fts_ai AFTER INSERT ON tenders BEGIN
+        INSERT INTO tenders_fts(rowid, object_description, public_body_name)
+        VALUES (new.id, new.object_description, new.public_body_name);
+    END
+    """,
+    """
+    CREATE TRIGGER tenders_fts_ad AFTER DELETE ON tenders BEGIN
+        INSERT INTO tenders_fts(tenders_fts, rowid, object_description, public_body_name)
+        VALUES ('delete', old.id, old.object_description, old.public_body_name);
+    END
+    """,
+    """
+    CREATE TRIGGER tenders_fts_au AFTER UPDATE ON tenders BEGIN
+        INSERT INTO tenders_fts(tenders_fts, rowid, object_description, public_body_name)
+        VALUES ('delete', old.id, old.object_description, old.public_body_name);
+        INSERT INTO tenders_fts(rowid, object_description, public_body_name)
+        VALUES (new.id, new.object_description, new.public_body_name);
+    END
+    """,
+]
+
+TRIGRAM_INDEXES = [
+    ("ix_tenders_object_description_trgm", "object_description"),
+    ("ix_tenders_public_body_name_trgm", "public_body_name"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        for statement in SQLITE_FTS:
+            op.execute(statement)
+        op.execute("INSERT INTO tenders_fts(tenders_fts) VALUES ('rebuild')")
+        return
+
+    # Adding the stored generated column rewrites the table once; the
+    # indexes are then built without blocking writes.
+    op.execute(SEARCH_VECTOR_COLUMN)
+
+    has_trigram = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        )
+        .scalar()
+    )
+    if has_trigram:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tenders_search_vector "
+            "ON tenders USING gin (search_vector)"
+        )
+        if has_trigram:
+            for name, column in TRIGRAM_INDEXES:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                    f"ON tenders USING gin ({column} gin_trgm_ops)"
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for trigger in ("tenders_fts_ai", "tenders_fts_ad", "tenders_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS tenders_fts")
+        return
+
+    for name, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute("DROP INDEX IF EXISTS ix_tenders_search_vector")
+    op.execute("ALTER TABLE tenders DROP COLUMN search_vector")
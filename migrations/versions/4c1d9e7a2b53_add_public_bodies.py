@@ -0,0 +1,362 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add public bodies
+
+Revision ID: 4c1d9e7a2b53
+Revises: be187a1aef2b
+Create Date: 2026-10-18 09:12:41.518204
+
+"""
+import unicodedata
+from contextlib import contextmanager
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1d9e7a2b53"
+down_revision: Union[str, Sequence[str], None] = "be187a1aef2b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 10_000
+WON = "participation_result = 'WON' AND status = 'FINISHED'"
+OPERATIONS = (
+    ("insert", "NEW TABLE AS new_rows", (("new", 1),)),
+    (
+        "update",
+        "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        (("old", -1), ("new", 1)),
+    ),
+    ("delete", "OLD TABLE AS old_rows", (("old", -1),)),
+)
+
+
+def normalize_public_body_name(name: str) -> str:
+    # Frozen copy of src.services.public_body_service.normalize_public_body_name.
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def _postgres_upsert(keys: str, rows: str, sign: str) -> str:
+    # Frozen copy of the public_body_stats upsert in src.infra.triggers.
+    return f"""
+        INSERT INTO public_body_stats AS stats (
+            {keys}, tender_count, won_count, awarded_value
+        )
+        SELECT
+            {keys}, {sign}count(*),
+            {sign}count(*) FILTER (WHERE {WON}),
+            {sign}coalesce(sum(awarded_value) FILTER (WHERE {WON}), 0)
+        FROM {rows}
+        GROUP BY {keys}
+        ON CONFLICT ({keys}) DO UPDATE SET
+            tender_count = stats.tender_count + excluded.tender_count,
+            won_count = stats.won_count + excluded.won_count,
+            awarded_value = stats.awarded_value + excluded.awarded_value;
+    """
+
+
+def _sqlite_upsert(key: str, row: str, sign: int) -> str:
+    # Frozen copy of the public_body_stats upsert in src.infra.triggers.
+    is_won = f"{row}.participation_result = 'WON' AND {row}.status = 'FINISHED'"
+    return f"""
+        INSERT INTO public_body_stats (
+            company_id, tender_year, {key}, tender_count, won_count, awarded_value
+        )
+        VALUES (
+            {row}.company_id, {row}.tender_year, {row}.{key}, {sign},
+            CASE WHEN {is_won} THEN {sign} ELSE 0 END,
+            CASE WHEN {is_won}
+                THEN {sign} * coalesce({row}.awarded_value, 0) ELSE 0 END
+        )
+        ON CONFLICT (company_id, tender_year, {key}) DO UPDATE SET
+            tender_count = tender_count + excluded.tender_count,
+            won_count = won_count + excluded.won_count,
+            awarded_value = awarded_value + excluded.awarded_value;
+    """
+
+
+def create_public_body_stats(key: str, key_column: sa.Column) -> None:
+    """
+    Creates public_body_stats keyed by (company_id, tender_year, `key`),
+    seeds it from tenders and installs the triggers keeping it current.
+    Callers hold a lock blocking tender writes.
+    """
+    dialect = op.get_bind().dialect.name
+    keys = f"company_id, tender_year, {key}"
+
+    op.create_table(
+        "public_body_stats",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("tender_year", sa.Integer(), nullable=False),
+        key_column,
+        sa.Column("tender_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("won_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("awarded_value", sa.Numeric(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "tender_year", key),
+    )
+    op.execute(
+        f"""
+        INSERT INTO public_body_stats ({keys}, tender_count, won_count, awarded_value)
+        SELECT
+            {keys}, count(*),
+            sum(CASE WHEN {WON} THEN 1 ELSE 0 END),
+            coalesce(sum(CASE WHEN {WON} THEN awarded_value END), 0)
+        FROM tenders
+        GROUP BY {keys}
+        """
+    )
+
+    if dialect == "postgresql":
+        op.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION public_body_stats_apply() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    {_postgres_upsert(keys, "old_rows", "-")}
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    {_postgres_upsert(keys, "new_rows", "")}
+                END IF;
+                RETURN NULL;
+            END
+            $$
+            """
+        )
+
+    for operation, transitions, rows in OPERATIONS:
+        trigger = f"tenders_public_body_stats_{operation}"
+        if dialect == "postgresql":
+            op.execute(
+                f"""
+                CREATE TRIGGER {trigger}
+                AFTER {operation.upper()} ON tenders REFERENCING {transitions}
+                FOR EACH STATEMENT EXECUTE FUNCTION public_body_stats_apply()
+                """
+            )
+        else:
+            upserts = "".join(_sqlite_upsert(key, row, sign) for row, sign in rows)
+            op.execute(
+                f"""
+                CREATE TRIGGER {trigger}
+                AFTER {operation.upper()} ON tenders BEGIN {upserts} END
+                """
+            )
+
+
+def drop_public_body_stats() -> None:
+    dialect = op.get_bind().dialect.name
+
+    for operation, _, _ in OPERATIONS:
+        trigger = f"tenders_public_body_stats_{operation}"
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {trigger}"
+            + ("" if dialect == "sqlite" else " ON tenders")
+        )
+    if dialect == "postgresql":
+        op.execute("DROP FUNCTION IF EXISTS public_body_stats_apply()")
+
+    op.drop_table("public_body_stats")
+
+
+def backfill_public_body_ids() -> None:
+    """
+    Walks tenders in id order, BACKFILL_BATCH_SIZE rows at a time: the
+    batch's names are interned, then its rows get their ids with one
+    UPDATE per distinct name, limited to the batch's id range.
+    """
+    bind = op.get_bind()
+    last_id = 0
+
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, public_body_name FROM tenders"
+                " WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        first_spelling = {}
+        for _, name in rows:
+            first_spelling.setdefault(normalize_public_body_name(name), name)
+
+        bind.execute(
+            sa.text(
+                "INSERT INTO public_bodies (normalized_name, name)"
+                " VALUES (:normalized_name, :name)"
+                " ON CONFLICT (normalized_name) DO NOTHING"
+            ),
+            [
+                {"normalized_name": key, "name": name}
+                for key, name in first_spelling.items()
+            ],
+        )
+        body_ids = dict(
+            bind.execute(
+                sa.text(
+                    "SELECT normalized_name, id FROM public_bodies"
+                    " WHERE normalized_name IN :keys"
+                ).bindparams(sa.bindparam("keys", expanding=True)),
+                {"keys": list(first_spelling)},
+            ).all()
+        )
+        bind.execute(
+            sa.text(
+                "UPDATE tenders SET public_body_id = :body_id"
+                " WHERE id > :low AND id <= :high AND public_body_name = :name"
+            ),
+            [
+                {
+                    "body_id": body_ids[normalize_public_body_name(name)],
+                    "low": last_id,
+                    "high": rows[-1].id,
+                    "name": name,
+                }
+                for name in {name for _, name in rows}
+            ],
+        )
+        last_id = rows[-1].id
+
+
+@contextmanager
+def batch_alter_tenders():
+    """
+    op.batch_alter_table("tenders") keeping the table's triggers: SQLite
+    cannot ALTER constraints, so batch mode rebuilds the table there and
+    the triggers are dropped along with the old copy.
+    """
+    bind = op.get_bind()
+    triggers = []
+    if bind.dialect.name == "sqlite":
+        triggers = (
+            bind.execute(
+                sa.text(
+                    "SELECT sql FROM sqlite_master"
+                    " WHERE type = 'trigger' AND tbl_name = 'tenders'"
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    with op.batch_alter_table("tenders") as batch:
+        yield batch
+
+    for trigger in triggers:
+        op.execute(trigger)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    drop_public_body_stats()
+
+    op.create_table(
+        "public_bodies",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("normalized_name", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("normalized_name"),
+    )
+    # Adding the column locks tenders against writes until the end of
+    # the migration, so no tender can slip in without a body.
+    op.add_column("tenders", sa.Column("public_body_id", sa.Integer(), nullable=True))
+
+    # public_body_id feeds none of the remaining triggers (rollups, data
+    # versions), so they are skipped for the backfill's updates.
+    if dialect == "postgresql":
+        op.execute("ALTER TABLE tenders DISABLE TRIGGER USER")
+    backfill_public_body_ids()
+    if dialect == "postgresql":
+        op.execute("ALTER TABLE tenders ENABLE TRIGGER USER")
+
+    # Spellings that used to tell two tenders apart may now be one body.
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT count(*) FROM ("
+                " SELECT 1 FROM tenders"
+                " GROUP BY company_id, tender_number, tender_year,"
+                " public_body_id, modality, format"
+                " HAVING count(*) > 1"
+                ") AS duplicated"
+            )
+        )
+        .scalar()
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"{duplicates} tender identities differ only in the spelling of "
+            "the public body and must be merged before uq_tenders_identity "
+            "can use public_body_id."
+        )
+
+    with batch_alter_tenders() as batch:
+        batch.alter_column("public_body_id", nullable=False)
+        batch.create_foreign_key(
+            "tenders_public_body_id_fkey", "public_bodies", ["public_body_id"], ["id"]
+        )
+        batch.drop_constraint("uq_tenders_identity", type_="unique")
+        batch.create_unique_constraint(
+            "uq_tenders_identity",
+            [
+                "company_id",
+                "tender_number",
+                "tender_year",
+                "public_body_id",
+                "modality",
+                "format",
+            ],
+        )
+
+    create_public_body_stats(
+        "public_body_id",
+        sa.Column(
+            "public_body_id",
+            sa.Integer(),
+            sa.ForeignKey("public_bodies.id"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("LOCK TABLE tenders IN SHARE MODE")
+
+    drop_public_body_stats()
+
+    with batch_alter_tenders() as batch:
+        batch.drop_constraint("uq_tenders_identity", type_="unique")
+        batch.create_unique_constraint(
+            "uq_tenders_identity",
+            [
+                "company_id",
+                "tender_number",
+                "tender_year",
+                "public_body_name",
+                "modality",
+                "format",
+            ],
+        )
+        batch.drop_constraint("tenders_public_body_id_fkey", type_="foreignkey")
+        batch.drop_column("public_body_id")
+    op.drop_table("public_bodies")
+
+    create_public_body_stats(
+        "public_body_name",
+        sa.Column("public_body_name", sa.String(), nullable=False),
+    )
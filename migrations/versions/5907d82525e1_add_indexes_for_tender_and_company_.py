@@ -0,0 +1,53 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add indexes for tender and company filters
+
+Revision ID: 5907d82525e1
+Revises: f9c444fee691
+Create Date: 2026-10-18 06:55:51.236097
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5907d82525e1"
+down_revision: Union[str, Sequence[str], None] = "f9c444fee691"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns). Built CONCURRENTLY on PostgreSQL so that existing
+# deployments keep accepting writes while the indexes are created.
+INDEXES = [
+    ("ix_companies_user_id", "companies", ["user_id"]),
+    ("ix_tenders_company_id_tender_year", "tenders", ["company_id", "tender_year"]),
+    ("ix_tenders_company_id_session_date", "tenders", ["company_id", "session_date"]),
+    ("ix_tenders_company_id_status", "tenders", ["company_id", "status"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
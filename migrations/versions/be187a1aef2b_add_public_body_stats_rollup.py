@@ -0,0 +1,159 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add public body stats rollup
+
+Revision ID: be187a1aef2b
+Revises: e77440fe3789
+Create Date: 2026-10-18 07:57:26.308353
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "be187a1aef2b"
+down_revision: Union[str, Sequence[str], None] = "e77440fe3789"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+KEYS = "company_id, tender_year, public_body_name"
+WON = "participation_result = 'WON' AND status = 'FINISHED'"
+OPERATIONS = (
+    ("insert", "NEW TABLE AS new_rows", (("new", 1),)),
+    (
+        "update",
+        "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        (("old", -1), ("new", 1)),
+    ),
+    ("delete", "OLD TABLE AS old_rows", (("old", -1),)),
+)
+
+
+def _postgres_upsert(rows: str, sign: str) -> str:
+    # Frozen copy of the public_body_stats upsert in src.infra.triggers.
+    return f"""
+        INSERT INTO public_body_stats AS stats (
+            {KEYS}, tender_count, won_count, awarded_value
+        )
+        SELECT
+            {KEYS}, {sign}count(*),
+            {sign}count(*) FILTER (WHERE {WON}),
+            {sign}coalesce(sum(awarded_value) FILTER (WHERE {WON}), 0)
+        FROM {rows}
+        GROUP BY {KEYS}
+        ON CONFLICT ({KEYS}) DO UPDATE SET
+            tender_count = stats.tender_count + excluded.tender_count,
+            won_count = stats.won_count + excluded.won_count,
+            awarded_value = stats.awarded_value + excluded.awarded_value;
+    """
+
+
+def _sqlite_upsert(row: str, sign: int) -> str:
+    # Frozen copy of the public_body_stats upsert in src.infra.triggers.
+    is_won = f"{row}.participation_result = 'WON' AND {row}.status = 'FINISHED'"
+    return f"""
+        INSERT INTO public_body_stats (
+            {KEYS}, tender_count, won_count, awarded_value
+        )
+        VALUES (
+            {row}.company_id, {row}.tender_year, {row}.public_body_name, {sign},
+            CASE WHEN {is_won} THEN {sign} ELSE 0 END,
+            CASE WHEN {is_won}
+                THEN {sign} * coalesce({row}.awarded_value, 0) ELSE 0 END
+        )
+        ON CONFLICT ({KEYS}) DO UPDATE SET
+            tender_count = tender_count + excluded.tender_count,
+            won_count = won_count + excluded.won_count,
+            awarded_value = awarded_value + excluded.awarded_value;
+    """
+
+
+POSTGRES_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION public_body_stats_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        {_postgres_upsert("old_rows", "-")}
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        {_postgres_upsert("new_rows", "")}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+BACKFILL = f"""
+INSERT INTO public_body_stats ({KEYS}, tender_count, won_count, awarded_value)
+SELECT
+    {KEYS}, count(*),
+    sum(CASE WHEN {WON} THEN 1 ELSE 0 END),
+    coalesce(sum(CASE WHEN {WON} THEN awarded_value END), 0)
+FROM tenders
+GROUP BY {KEYS}
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    op.create_table(
+        "public_body_stats",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("tender_year", sa.Integer(), nullable=False),
+        sa.Column("public_body_name", sa.String(), nullable=False),
+        sa.Column("tender_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("won_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("awarded_value", sa.Numeric(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "tender_year", "public_body_name"),
+    )
+
+    # Writes are blocked while the rollup is seeded, so no tender change
+    # can land between the backfill and the triggers taking over.
+    if dialect == "postgresql":
+        op.execute("LOCK TABLE tenders IN SHARE MODE")
+
+    op.execute(BACKFILL)
+
+    if dialect == "postgresql":
+        op.execute(POSTGRES_FUNCTION)
+
+    for operation, transitions, rows in OPERATIONS:
+        trigger = f"tenders_public_body_stats_{operation}"
+        if dialect == "postgresql":
+            op.execute(
+                f"""
+                CREATE TRIGGER {trigger}
+                AFTER {operation.upper()} ON tenders REFERENCING {transitions}
+                FOR EACH STATEMENT EXECUTE FUNCTION public_body_stats_apply()
+                """
+            )
+        else:
+            upserts = "".join(_sqlite_upsert(row, sign) for row, sign in rows)
+            op.execute(
+                f"""
+                CREATE TRIGGER {trigger}
+                AFTER {operation.upper()} ON tenders BEGIN {upserts} END
+                """
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    for operation, _, _ in OPERATIONS:
+        trigger = f"tenders_public_body_stats_{operation}"
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {trigger}"
+            + ("" if dialect == "sqlite" else " ON tenders")
+        )
+    if dialect == "postgresql":
+        op.execute("DROP FUNCTION IF EXISTS public_body_stats_apply()")
+
+    op.drop_table("public_body_stats")
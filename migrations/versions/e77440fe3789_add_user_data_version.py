@@ -0,0 +1,125 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add user data version
+
+Revision ID: e77440fe3789
+Revises: 18701895e31b
+Create Date: 2026-10-18 07:46:50.919064
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e77440fe3789"
+down_revision: Union[str, Sequence[str], None] = "18701895e31b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+OPERATIONS = (
+    ("INSERT", "NEW TABLE AS new_rows", ("new",)),
+    ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows", ("old", "new")),
+    ("DELETE", "OLD TABLE AS old_rows", ("old",)),
+)
+
+# table -> (trigger function, owner column, users touched by the rows)
+POSTGRES_OWNERS = {
+    "companies": (
+        "companies_bump_data_version",
+        "user_id",
+        "SELECT unnest(touched)",
+    ),
+    "tenders": (
+        "tenders_bump_data_version",
+        "company_id",
+        "SELECT user_id FROM companies WHERE id = ANY(touched)",
+    ),
+}
+
+SQLITE_OWNERS = {
+    "companies": "{}.user_id",
+    "tenders": "(SELECT user_id FROM companies WHERE id = {}.company_id)",
+}
+
+
+def _postgres_function(name: str, owner: str, affected_users: str) -> str:
+    # Frozen copy of src.infra.triggers._postgres_version_function.
+    return f"""
+        CREATE OR REPLACE FUNCTION {name}() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            touched int[] := '{{}}';
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                touched := touched || ARRAY(SELECT {owner} FROM old_rows);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                touched := touched || ARRAY(SELECT {owner} FROM new_rows);
+            END IF;
+            UPDATE users SET data_version = data_version + 1
+            WHERE id IN ({affected_users});
+            RETURN NULL;
+        END
+        $$
+    """
+
+
+def _create_postgres_triggers() -> None:
+    for table, (function, owner, affected_users) in POSTGRES_OWNERS.items():
+        op.execute(_postgres_function(function, owner, affected_users))
+        for operation, transitions, _ in OPERATIONS:
+            op.execute(
+                f"""
+                CREATE TRIGGER {table}_data_version_{operation.lower()}
+                AFTER {operation} ON {table} REFERENCING {transitions}
+                FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+                """
+            )
+
+
+def _create_sqlite_triggers() -> None:
+    bump = "UPDATE users SET data_version = data_version + 1 WHERE id = {};"
+    for table, affected_user in SQLITE_OWNERS.items():
+        for operation, _, rows in OPERATIONS:
+            statements = " ".join(
+                bump.format(affected_user.format(row)) for row in rows
+            )
+            op.execute(
+                f"""
+                CREATE TRIGGER {table}_data_version_{operation.lower()}
+                AFTER {operation} ON {table} BEGIN {statements} END
+                """
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("data_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    if op.get_bind().dialect.name == "sqlite":
+        _create_sqlite_triggers()
+    else:
+        _create_postgres_triggers()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    for table, (function, _, _) in POSTGRES_OWNERS.items():
+        for operation, _, _ in OPERATIONS:
+            trigger = f"{table}_data_version_{operation.lower()}"
+            op.execute(
+                f"DROP TRIGGER IF EXISTS {trigger}"
+                + ("" if dialect == "sqlite" else f" ON {table}")
+            )
+        if dialect == "postgresql":
+            op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+
+    op.drop_column("users", "data_version")
@@ -0,0 +1,51 @@
+# pylint: disable=E1101:no-member,C0103:invalid-name
+
+"""add indexes for list sort keys
+
+Revision ID: ea9497c50b4c
+Revises: 310a38e8e888
+Create Date: 2026-10-18 07:08:51.022143
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ea9497c50b4c"
+down_revision: Union[str, Sequence[str], None] = "310a38e8e888"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns). Built CONCURRENTLY on PostgreSQL so that existing
+# deployments keep accepting writes while the indexes are created.
+INDEXES = [
+    ("ix_users_created_at", "users", ["created_at"]),
+    ("ix_tenders_company_id_created_at", "tenders", ["company_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -1,20 +1,63 @@
 import asyncio
+import logging
 import sys
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.routers import auth, companies, dashboard, tenders, users
+from src.infra.settings.database import engine
+from src.routers import (
+    analytics,
+    auth,
+    autocomplete,
+    companies,
+    dashboard,
+    metrics,
+    tenders,
+    users,
+)
 from src.schemas.common import MessageSchema
+from src.security import password_hash_pool, revocation_list
+from src.services.token_service import TokenService
 from src.settings import Settings
 
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
 settings = Settings()
 
+
+async def sync_revocations_periodically(synced_until):
+    while True:
+        await asyncio.sleep(settings.REVOCATION_SYNC_SECONDS)
+        try:
+            async with AsyncSession(engine) as session:
+                synced_until = await TokenService(session).sync(
+                    revocation_list, synced_until
+                )
+        except Exception:
+            logger.exception("Failed to sync revoked tokens")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    async with AsyncSession(engine) as session:
+        service = TokenService(session)
+        await service.prune_expired()
+        synced_until = await service.sync(revocation_list)
+
+    sync_task = asyncio.create_task(sync_revocations_periodically(synced_until))
+    yield
+    sync_task.cancel()
+    password_hash_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -28,6 +71,9 @@ app.include_router(auth.router)
 app.include_router(companies.router)
 app.include_router(tenders.router)
 app.include_router(dashboard.router)
+app.include_router(analytics.router)
+app.include_router(autocomplete.router)
+app.include_router(metrics.router)
 
 
 @app.get("/", status_code=HTTPStatus.OK, response_model=MessageSchema)
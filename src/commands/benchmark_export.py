@@ -0,0 +1,154 @@
+"""
+Measures tender export throughput and peak Python memory on PostgreSQL.
+
+    python -m src.commands.benchmark_export --rows 1000000
+
+Synthetic rows are inserted inside a transaction that is rolled back at
+the end, so the database is left untouched.
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.settings.database import engine
+from src.schemas.tender import TenderExportFilterSchema
+from src.services.export.tender_export import copy_csv_export, stream_export
+from src.services.tender_service import TenderService
+
+SEED_USER = text(
+    "INSERT INTO users (username, email, password) "
+    "VALUES ('export-benchmark', 'export-benchmark@example.com', '-') "
+    "RETURNING id"
+)
+SEED_COMPANY = text(
+    "INSERT INTO companies (name, trade_name, cnpj, user_id) "
+    "VALUES ('Export benchmark', 'Export benchmark', '00000000000000', :user_id) "
+    "RETURNING id"
+)
+SEED_PUBLIC_BODIES = text(
+    """
+    INSERT INTO public_bodies (normalized_name, name)
+    SELECT 'prefeitura municipal ' || n, 'Prefeitura Municipal ' || n
+    FROM generate_series(0, 499) AS n
+    ON CONFLICT (normalized_name) DO NOTHING
+    """
+)
+SEED_TENDERS = text(
+    """
+    INSERT INTO tenders (
+        tender_number, tender_year, object_description, public_body_name,
+        public_body_id, modality, format, status, participation_result,
+        awarded_value, session_date, company_id
+    )
+    SELECT
+        n, 2000 + n % 26, 'Aquisição de materiais, lote ' || n,
+        'Prefeitura Municipal ' || n % 500,
+        (
+            SELECT id FROM public_bodies
+            WHERE normalized_name = 'prefeitura municipal ' || n % 500
+        ),
+        (enum_range(NULL::tendermodality))[1 + n % 7],
+        (enum_range(NULL::tenderformat))[1 + n % 2],
+        (enum_range(NULL::tenderstatus))[1 + n % 10],
+        (enum_range(NULL::participationresult))[1 + n % 3],
+        (n % 100000) / 100.0,
+        timestamp '2020-01-01' + n * interval '1 minute',
+        :company_id
+    FROM generate_series(1, :rows) AS n
+    """
+)
+
+
+@dataclass
+class BenchmarkResult:
+    path: str
+    seconds: float
+    megabytes: float
+    peak_rss_mib: float
+    peak_python_kib: float | None
+
+
+async def measure(path: str, chunks, trace_memory: bool) -> BenchmarkResult:
+    """
+    Drains an export. Peak RSS is process-wide and never goes down, so it
+    only shows growth over the earlier paths; tracemalloc gives a per-path
+    figure but slows pure-Python paths several times over.
+    """
+    if trace_memory:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+
+    peak_python_kib = None
+    if trace_memory:
+        peak_python_kib = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+
+    peak_rss_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return BenchmarkResult(
+        path, elapsed, size / 1024 / 1024, peak_rss_mib, peak_python_kib
+    )
+
+
+async def run(rows: int, trace_memory: bool) -> list[BenchmarkResult]:
+    async with AsyncSession(engine) as session:
+        user_id = await session.scalar(SEED_USER)
+        company_id = await session.scalar(SEED_COMPANY, {"user_id": user_id})
+        await session.execute(SEED_PUBLIC_BODIES)
+        await session.execute(SEED_TENDERS, {"company_id": company_id, "rows": rows})
+
+        service = TenderService(session)
+        results = []
+        for path, file_format, exporter in (
+            ("copy csv", "csv", copy_csv_export),
+            ("cursor csv", "csv", None),
+            ("cursor ndjson", "ndjson", None),
+        ):
+            filters = TenderExportFilterSchema(file_format=file_format)
+            query = service.export_query(company_id, filters)
+            chunks = (
+                exporter(session, query)
+                if exporter
+                else stream_export(session, query, file_format)
+            )
+            results.append(await measure(path, chunks, trace_memory))
+
+        await session.rollback()
+
+    await engine.dispose()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--trace-memory", action="store_true")
+    args = parser.parse_args(argv)
+
+    for result in asyncio.run(run(args.rows, args.trace_memory)):
+        line = (
+            f"{result.path:<14} {result.seconds:7.2f} s "
+            f"{args.rows / result.seconds:10.0f} rows/s "
+            f"{result.megabytes:8.1f} MiB out, "
+            f"peak RSS {result.peak_rss_mib:6.1f} MiB"
+        )
+        if result.peak_python_kib is not None:
+            line += f", peak Python {result.peak_python_kib:.0f} KiB"
+        print(line)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
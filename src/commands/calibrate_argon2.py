@@ -0,0 +1,70 @@
+"""
+Benchmarks Argon2 parameters on the current machine and stores the chosen
+ones in the env file read by `Settings`.
+
+    python -m src.commands.calibrate_argon2 --target-ms 250
+"""
+
+import argparse
+from pathlib import Path
+
+from src.infra.hashing import calibrate_argon2
+
+
+def write_env_values(path: Path, values: dict[str, object]) -> None:
+    lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+    pending = dict(values)
+
+    for index, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if key in pending:
+            lines[index] = f"{key}={pending.pop(key)}"
+
+    lines.extend(f"{key}={value}" for key, value in pending.items())
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument(
+        "--memory-cost",
+        type=int,
+        action="append",
+        help="Candidate memory cost in KiB; may be repeated.",
+    )
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--env-file", type=Path, default=Path(".env"))
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    result = calibrate_argon2(
+        target_ms=args.target_ms,
+        memory_costs=args.memory_cost or [262144, 131072, 65536, 32768, 19456],
+        parallelism=args.parallelism,
+        max_time_cost=args.max_time_cost,
+        samples=args.samples,
+    )
+
+    if result is None:
+        print(f"No candidate hashes within {args.target_ms:.0f} ms.")
+        return 1
+
+    values = {
+        "ARGON2_TIME_COST": result.time_cost,
+        "ARGON2_MEMORY_COST": result.memory_cost,
+        "ARGON2_PARALLELISM": result.parallelism,
+    }
+    print(f"Selected {values} ({result.elapsed_ms:.1f} ms per hash).")
+
+    if not args.dry_run:
+        write_env_values(args.env_file, values)
+        print(f"Written to {args.env_file}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
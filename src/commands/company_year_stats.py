@@ -0,0 +1,78 @@
+"""
+Rebuilds or checks the company_year_stats rollup against the tenders table.
+
+    python -m src.commands.company_year_stats rebuild --chunk-size 500
+    python -m src.commands.company_year_stats check [--repair]
+
+Both walk the companies in chunks, each chunk in its own transaction, so
+a full run never locks the whole tenders table at once. `check` exits
+with status 1 when it finds a difference.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.settings.database import engine
+from src.services.company_stats_service import STATS_CHUNK_SIZE, CompanyStatsService
+
+
+async def rebuild(chunk_size: int) -> int:
+    async with AsyncSession(engine) as session:
+        service = CompanyStatsService(session)
+        companies = rows = 0
+        async for company_ids in service.company_id_chunks(chunk_size):
+            rows += await service.rebuild(company_ids)
+            companies += len(company_ids)
+            print(f"rebuilt {companies} companies, {rows} rows")
+
+    await engine.dispose()
+    return 0
+
+
+async def check(chunk_size: int, repair: bool) -> int:
+    async with AsyncSession(engine) as session:
+        service = CompanyStatsService(session)
+        found = 0
+        async for company_ids in service.company_id_chunks(chunk_size):
+            differences = await service.mismatches(company_ids)
+            await session.commit()
+            for difference in differences:
+                print(
+                    f"company {difference['company_id']} "
+                    f"year {difference['tender_year']} "
+                    f"status {difference['status'].value}: "
+                    f"expected {difference['expected']}, "
+                    f"found {difference['actual']}"
+                )
+            if differences and repair:
+                await service.rebuild(
+                    sorted({difference["company_id"] for difference in differences})
+                )
+            found += len(differences)
+
+    await engine.dispose()
+    print(f"{found} mismatched rows" + (", repaired" if found and repair else ""))
+    return 1 if found and not repair else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild_parser = commands.add_parser("rebuild")
+    rebuild_parser.add_argument("--chunk-size", type=int, default=STATS_CHUNK_SIZE)
+
+    check_parser = commands.add_parser("check")
+    check_parser.add_argument("--chunk-size", type=int, default=STATS_CHUNK_SIZE)
+    check_parser.add_argument("--repair", action="store_true")
+
+    args = parser.parse_args(argv)
+    if args.command == "rebuild":
+        return asyncio.run(rebuild(args.chunk_size))
+    return asyncio.run(check(args.chunk_size, args.repair))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
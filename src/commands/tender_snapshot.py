@@ -0,0 +1,75 @@
+"""
+Writes and queries columnar snapshots of companies and tenders.
+
+    python -m src.commands.tender_snapshot export --output var/snapshots
+    python -m src.commands.tender_snapshot metrics --snapshot var/snapshots \
+        --user-id 1 --year 2024 --breakdown status
+
+`export` reads the database once, in a single REPEATABLE READ
+transaction; point `--database-url` at a replica to keep the load off
+the primary. `metrics` never connects to a database.
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.schemas.dashboard import DashboardResponseSchema
+from src.services.analytics.columnar import Snapshot, write_snapshot
+from src.services.analytics.dashboard_breakdowns import BREAKDOWN_FIELDS
+from src.services.analytics.snapshot_metrics import snapshot_metrics
+from src.settings import Settings
+
+
+async def export(output: Path, database_url: str) -> int:
+    engine = create_async_engine(database_url)
+    started = time.perf_counter()
+    async with engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            connection = await connection.execution_options(
+                isolation_level="REPEATABLE READ"
+            )
+        async with AsyncSession(bind=connection) as session:
+            directory = await write_snapshot(session, output)
+    await engine.dispose()
+
+    print(f"wrote {directory} in {time.perf_counter() - started:.2f} s")
+    return 0
+
+
+def metrics(snapshot_root: Path, user_id: int, year: int, breakdowns) -> int:
+    fields = tuple(field for field in BREAKDOWN_FIELDS if field in breakdowns)
+    with Snapshot(snapshot_root) as snapshot:
+        result = snapshot_metrics(snapshot, user_id, year, fields)
+    print(DashboardResponseSchema.model_validate(result).model_dump_json(indent=2))
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export")
+    export_parser.add_argument("--output", type=Path, required=True)
+    export_parser.add_argument("--database-url")
+
+    metrics_parser = commands.add_parser("metrics")
+    metrics_parser.add_argument("--snapshot", type=Path, required=True)
+    metrics_parser.add_argument("--user-id", type=int, required=True)
+    metrics_parser.add_argument("--year", type=int, required=True)
+    metrics_parser.add_argument(
+        "--breakdown", action="append", choices=BREAKDOWN_FIELDS, default=[]
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        database_url = args.database_url or Settings().DATABASE_URL
+        return asyncio.run(export(args.output, database_url))
+    return metrics(args.snapshot, args.user_id, args.year, args.breakdown)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
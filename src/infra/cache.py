@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any, Hashable
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class TTLCache:
+    """
+    Bounded in-process LRU cache whose entries expire at an absolute
+    timestamp. Entries can be tagged with a group so that every entry
+    belonging to, e.g., one user is dropped with a single call.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, tuple[Any, float, Hashable]] = (
+            OrderedDict()
+        )
+        self._groups: dict[Hashable, set[Hashable]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable, default=None):
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats.misses += 1
+            return default
+
+        value, expires_at, _ = entry
+        if expires_at <= time.time():
+            self._remove(key)
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value,
+        *,
+        group: Hashable = None,
+        expires_at: float | None = None,
+    ) -> None:
+        """
+        Stores a value for at most `ttl_seconds`, or until `expires_at`
+        if that comes first.
+        """
+        deadline = time.time() + self.ttl_seconds
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (value, deadline, group)
+        if group is not None:
+            self._groups.setdefault(group, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        if key in self._entries:
+            self._remove(key)
+            self.stats.invalidations += 1
+
+    def invalidate_group(self, group: Hashable) -> None:
+        for key in list(self._groups.get(group, ())):
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._groups.clear()
+        self.stats = CacheStats()
+
+    def snapshot(self) -> dict:
+        return {"size": len(self._entries), "max_size": self.max_size} | asdict(
+            self.stats
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, group = self._entries.pop(key)
+        if group is None:
+            return
+
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller runs
+    the loader and everyone arriving before it finishes awaits the same
+    result (or exception) instead of repeating the work.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+            return await asyncio.shield(call)
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        try:
+            result = await loader()
+        except Exception as e:
+            call.set_exception(e)
+            # Followers re-raise it; mark it retrieved for the leader.
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+            # A cancelled leader cancels its followers' wait as well.
+            if not call.done():
+                call.cancel()
@@ -0,0 +1,19 @@
+from sqlalchemy import Connection
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_name(session: AsyncSession | Connection) -> str:
+    if isinstance(session, Connection):
+        return session.dialect.name
+    return session.bind.dialect.name
+
+
+def insert(session: AsyncSession | Connection, entity):
+    """
+    INSERT construct for the session's database, exposing ON CONFLICT
+    support on both PostgreSQL and SQLite.
+    """
+    if dialect_name(session) == "sqlite":
+        return sqlite.insert(entity)
+    return postgresql.insert(entity)
@@ -4,7 +4,16 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import ForeignKey, func
+from sqlalchemy import (
+    DDL,
+    ForeignKey,
+    Index,
+    Table,
+    UniqueConstraint,
+    event,
+    func,
+    inspect,
+)
 from sqlalchemy.orm import (
     Mapped,
     mapped_as_dataclass,
@@ -13,9 +22,16 @@ from sqlalchemy.orm import (
     relationship,
 )
 
+from src.infra.triggers import ROLLUP_DDL, TENDER_SEARCH_DDL, USER_DATA_VERSION_DDL
+
 table_registry = registry()
 
 
+def table_of(entity: type) -> Table:
+    """The Core table `entity` is mapped to."""
+    return inspect(entity).local_table
+
+
 @mapped_as_dataclass(table_registry)
 class UserEntity:
     __tablename__ = "users"
@@ -24,15 +40,49 @@ class UserEntity:
     username: Mapped[str] = mapped_column(unique=True)
     password: Mapped[str]
     email: Mapped[str] = mapped_column(unique=True)
-    created_at: Mapped[datetime] = mapped_column(init=False, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        init=False, server_default=func.now(), index=True
+    )
+    token_version: Mapped[int] = mapped_column(
+        init=False, default=0, server_default="0"
+    )
+    data_version: Mapped[int] = mapped_column(init=False, default=0, server_default="0")
 
     companies: Mapped[list["CompanyEntity"]] = relationship(
         init=False,
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="select",
     )
 
 
+@mapped_as_dataclass(table_registry)
+class RevokedTokenEntity:
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(primary_key=True)
+    user_id: Mapped[int]
+    expires_at: Mapped[datetime] = mapped_column(index=True)
+    revoked_at: Mapped[datetime] = mapped_column(
+        init=False, server_default=func.now(), index=True
+    )
+
+
+@mapped_as_dataclass(table_registry)
+class RefreshTokenEntity:
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(init=False, primary_key=True)
+    token_hash: Mapped[str] = mapped_column(unique=True)
+    family_id: Mapped[str] = mapped_column(index=True)
+    token_version: Mapped[int]
+    expires_at: Mapped[datetime]
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    used_at: Mapped[datetime | None] = mapped_column(default=None, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(init=False, server_default=func.now())
+
+
 @mapped_as_dataclass(table_registry)
 class CompanyEntity:
     __tablename__ = "companies"
@@ -43,12 +93,12 @@ class CompanyEntity:
     cnpj: Mapped[str]
     created_at: Mapped[datetime] = mapped_column(init=False, server_default=func.now())
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
 
     tenders: Mapped[list["TenderEntity"]] = relationship(
         init=False,
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="select",
     )
 
 
@@ -86,9 +136,42 @@ class ParticipationResult(str, Enum):
     LOST = "lost"
 
 
+@mapped_as_dataclass(table_registry)
+class PublicBodyEntity:
+    """
+    Interned public body. Tenders keep the name as typed and point at the
+    body whose `normalized_name` (see normalize_public_body_name) it
+    matches; `name` is the first spelling seen.
+    """
+
+    __tablename__ = "public_bodies"
+
+    id: Mapped[int] = mapped_column(init=False, primary_key=True)
+    normalized_name: Mapped[str] = mapped_column(unique=True)
+    name: Mapped[str]
+
+
+# A tender is the same procurement when all of these match.
+TENDER_IDENTITY_FIELDS = (
+    "company_id",
+    "tender_number",
+    "tender_year",
+    "public_body_id",
+    "modality",
+    "format",
+)
+
+
 @mapped_as_dataclass(table_registry)
 class TenderEntity:
     __tablename__ = "tenders"
+    __table_args__ = (
+        UniqueConstraint(*TENDER_IDENTITY_FIELDS, name="uq_tenders_identity"),
+        Index("ix_tenders_company_id_tender_year", "company_id", "tender_year"),
+        Index("ix_tenders_company_id_session_date", "company_id", "session_date"),
+        Index("ix_tenders_company_id_status", "company_id", "status"),
+        Index("ix_tenders_company_id_created_at", "company_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     tender_number: Mapped[int]
@@ -106,3 +189,105 @@ class TenderEntity:
     created_at: Mapped[datetime] = mapped_column(init=False, server_default=func.now())
 
     company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"))
+    # Set from public_body_name when the tender is written.
+    public_body_id: Mapped[int] = mapped_column(
+        ForeignKey("public_bodies.id"), init=False
+    )
+
+
+@mapped_as_dataclass(table_registry)
+class CompanyYearStatsEntity:
+    """
+    Rollup of tenders per company, year and status, kept current by
+    database triggers on `tenders` (see ROLLUP_DDL). Won
+    counts and awarded values only cover tenders whose result is WON.
+    """
+
+    __tablename__ = "company_year_stats"
+
+    company_id: Mapped[int] = mapped_column(
+        ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    tender_year: Mapped[int] = mapped_column(primary_key=True)
+    status: Mapped[TenderStatus] = mapped_column(primary_key=True)
+    tender_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    won_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    awarded_value: Mapped[Decimal] = mapped_column(
+        default=Decimal("0"), server_default="0"
+    )
+
+
+@mapped_as_dataclass(table_registry)
+class PublicBodyStatsEntity:
+    """
+    Rollup of tenders per company, year and public body, kept current by
+    database triggers on `tenders` (see ROLLUP_DDL). Wins and awarded
+    values cover won tenders that are finished, as on the dashboard.
+    """
+
+    __tablename__ = "public_body_stats"
+
+    company_id: Mapped[int] = mapped_column(
+        ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    tender_year: Mapped[int] = mapped_column(primary_key=True)
+    public_body_id: Mapped[int] = mapped_column(
+        ForeignKey("public_bodies.id"), primary_key=True
+    )
+    tender_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    won_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    awarded_value: Mapped[Decimal] = mapped_column(
+        default=Decimal("0"), server_default="0"
+    )
+
+
+# The dialect-specific DDL (search, rollup and data-version triggers) is
+# built in src.infra.triggers; it is attached to the tables here.
+for _dialect, _statements in TENDER_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            table_of(TenderEntity),
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
+
+event.listen(
+    table_of(TenderEntity),
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS tenders_fts").execute_if(dialect="sqlite"),
+)
+
+
+# Registered on the metadata so both tables exist when the triggers are made.
+for _table, _ddl in ROLLUP_DDL.items():
+    for _dialect, _statements in _ddl.items():
+        for _statement in _statements:
+            event.listen(
+                table_registry.metadata,
+                "after_create",
+                DDL(_statement).execute_if(dialect=_dialect),
+            )
+
+    event.listen(
+        table_registry.metadata,
+        "after_drop",
+        DDL(f"DROP FUNCTION IF EXISTS {_table}_apply()").execute_if(
+            dialect="postgresql"
+        ),
+    )
+
+
+for _dialect, _statements in USER_DATA_VERSION_DDL.items():
+    for _statement in _statements:
+        event.listen(
+            table_registry.metadata,
+            "after_create",
+            DDL(_statement).execute_if(dialect=_dialect),
+        )
+
+for _function in ("companies_bump_data_version", "tenders_bump_data_version"):
+    event.listen(
+        table_registry.metadata,
+        "after_drop",
+        DDL(f"DROP FUNCTION IF EXISTS {_function}()").execute_if(dialect="postgresql"),
+    )
@@ -0,0 +1,191 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Literal
+
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from src.settings import Settings
+
+settings = Settings()
+
+
+def build_password_context(
+    time_cost: int, memory_cost: int, parallelism: int
+) -> PasswordHash:
+    return PasswordHash(
+        (
+            Argon2Hasher(
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+            ),
+        )
+    )
+
+
+pwd_context = build_password_context(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+)
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password_hash(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Tells whether a stored hash was produced with parameters other than
+    the configured ones. Only the encoded header is parsed, so this is
+    cheap enough to run on the event loop.
+    """
+    hasher = pwd_context.current_hasher
+    return not hasher.identify(hashed_password) or hasher.check_needs_rehash(
+        hashed_password
+    )
+
+
+class HashPoolSaturatedError(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+@dataclass
+class LatencyStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class PasswordHashPool:
+    """
+    Runs password hashing on its own executor so that a login burst cannot
+    starve the default anyio thread limiter used by every other offload.
+    At most `workers + queue_size` jobs are admitted at once; anything
+    beyond that fails fast with HashPoolSaturatedError.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        kind: Literal["thread", "process"] = "thread",
+    ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.kind = kind
+        self.in_flight = 0
+        self.rejected = 0
+        self.latency = {"hash": LatencyStats(), "verify": LatencyStats()}
+        self._executor: Executor | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.in_flight - self.workers, 0)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def run(self, operation: Literal["hash", "verify"], func, *args):
+        if self.in_flight >= self.workers + self.queue_size:
+            self.rejected += 1
+            raise HashPoolSaturatedError
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+            self.latency[operation].observe(time.perf_counter() - started)
+
+    async def hash(self, password: str) -> str:
+        return await self.run("hash", hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(
+            "verify", verify_password_hash, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def snapshot(self) -> dict:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "rejected": self.rejected,
+            "latency": {name: asdict(stats) for name, stats in self.latency.items()},
+        }
+
+
+@dataclass
+class CalibrationResult:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    elapsed_ms: float
+
+
+def measure_hash_ms(context: PasswordHash, samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def calibrate_argon2(
+    target_ms: float,
+    memory_costs: list[int],
+    parallelism: int,
+    max_time_cost: int = 10,
+    samples: int = 3,
+) -> CalibrationResult | None:
+    """
+    Picks the largest memory cost that can hash within `target_ms` and then
+    raises the time cost as far as the budget allows. Returns None when
+    even the cheapest candidate is slower than the target.
+    """
+    for memory_cost in sorted(memory_costs, reverse=True):
+        best = None
+
+        for time_cost in range(1, max_time_cost + 1):
+            context = build_password_context(time_cost, memory_cost, parallelism)
+            elapsed_ms = measure_hash_ms(context, samples)
+
+            if elapsed_ms > target_ms:
+                break
+
+            best = CalibrationResult(time_cost, memory_cost, parallelism, elapsed_ms)
+
+        if best is not None:
+            return best
+
+    return None
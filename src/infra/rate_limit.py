@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    capacity: float
+    refill_per_second: float
+
+
+@dataclass(frozen=True)
+class BucketDecision:
+    allowed: bool
+    retry_after: float = 0.0
+
+
+class RateLimitStore(Protocol):
+    """
+    Storage for token buckets. The in-memory store is enough for a single
+    worker; multi-worker deployments plug in a shared implementation
+    (Redis, Postgres, ...) through the RATE_LIMIT_STORE setting.
+    """
+
+    async def consume(self, key: str, policy: BucketPolicy) -> BucketDecision: ...
+
+    async def reset(self) -> None: ...
+
+
+class InMemoryRateLimitStore:
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, policy: BucketPolicy) -> BucketDecision:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (policy.capacity, now))
+        tokens = min(
+            policy.capacity, tokens + (now - updated_at) * policy.refill_per_second
+        )
+
+        if tokens >= 1:
+            self._store(key, tokens - 1, now)
+            return BucketDecision(allowed=True)
+
+        self._store(key, tokens, now)
+        return BucketDecision(
+            allowed=False, retry_after=(1 - tokens) / policy.refill_per_second
+        )
+
+    async def reset(self) -> None:
+        self._buckets.clear()
+
+    def _store(self, key: str, tokens: float, now: float) -> None:
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+
+def build_rate_limit_store(path: str) -> RateLimitStore:
+    """
+    Returns the in-memory store for "memory", otherwise instantiates the
+    class at the given "module:ClassName" path.
+    """
+    if path == "memory":
+        return InMemoryRateLimitStore()
+
+    module_name, class_name = path.split(":", 1)
+    return getattr(import_module(module_name), class_name)()
+
+
+class LoginThrottle:
+    """
+    Token-bucket limiter for login attempts, keyed by both the submitted
+    email and the client IP so that neither a single account nor a single
+    source can burn Argon2 CPU without bound.
+    """
+
+    def __init__(
+        self, store: RateLimitStore, email_policy: BucketPolicy, ip_policy: BucketPolicy
+    ):
+        self.store = store
+        self.email_policy = email_policy
+        self.ip_policy = ip_policy
+        self.allowed = 0
+        self.rejected = {"email": 0, "ip": 0}
+
+    async def check(self, email: str, client_ip: str | None) -> BucketDecision:
+        decision = await self.store.consume(f"ip:{client_ip}", self.ip_policy)
+        if not decision.allowed:
+            self.rejected["ip"] += 1
+            return decision
+
+        decision = await self.store.consume(
+            f"email:{email.casefold()}", self.email_policy
+        )
+        if not decision.allowed:
+            self.rejected["email"] += 1
+            return decision
+
+        self.allowed += 1
+        return decision
+
+    async def reset(self) -> None:
+        await self.store.reset()
+        self.allowed = 0
+        self.rejected = {"email": 0, "ip": 0}
+
+    def snapshot(self) -> dict:
+        return {"allowed": self.allowed, "rejected": dict(self.rejected)}
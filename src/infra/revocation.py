@@ -0,0 +1,44 @@
+import heapq
+import time
+from collections.abc import Iterable
+
+
+class RevocationList:
+    """
+    In-memory mirror of the `revoked_tokens` table. Lookups are a single
+    dict probe; entries are pruned as their token would have expired
+    anyway, so memory stays proportional to the revocations still live.
+    """
+
+    def __init__(self):
+        self._expires_at: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def __len__(self):
+        return len(self._expires_at)
+
+    def add(self, jti: str, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+
+        self._expires_at[jti] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, jti))
+
+    def load(self, entries: Iterable[tuple[str, float]]) -> None:
+        for jti, expires_at in entries:
+            self.add(jti, expires_at)
+
+    def is_revoked(self, jti: str) -> bool:
+        self.prune()
+        return jti in self._expires_at
+
+    def prune(self) -> None:
+        now = time.time()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, jti = heapq.heappop(self._expiry_heap)
+            if self._expires_at.get(jti, now + 1) <= now:
+                del self._expires_at[jti]
+
+    def clear(self) -> None:
+        self._expires_at.clear()
+        self._expiry_heap.clear()
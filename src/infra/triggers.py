@@ -0,0 +1,273 @@
+"""
+Raw DDL hung on the metadata by src.infra.entities: what the declarative
+mapping cannot express. The *_DDL dicts map dialect names (per rollup
+table, in ROLLUP_DDL) to the statements run after the tables are created.
+
+Migrations keep their own frozen copies of these statements, as they
+stood at each revision; change those only through a new revision.
+"""
+
+# Full-text search lives outside the mapped columns because it is
+# dialect specific: a generated, Portuguese-stemmed tsvector (plus
+# pg_trgm indexes for substring filters, when the extension exists) on
+# PostgreSQL, and an external-content FTS5 table on SQLite.
+TENDER_SEARCH_DDL = {
+    "postgresql": [
+        """
+        ALTER TABLE tenders ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('portuguese', object_description), 'A')
+            || setweight(to_tsvector('portuguese', public_body_name), 'B')
+        ) STORED
+        """,
+        "CREATE INDEX ix_tenders_search_vector ON tenders USING gin (search_vector)",
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'
+            ) THEN
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX ix_tenders_object_description_trgm
+                    ON tenders USING gin (object_description gin_trgm_ops);
+                CREATE INDEX ix_tenders_public_body_name_trgm
+                    ON tenders USING gin (public_body_name gin_trgm_ops);
+            END IF;
+        END
+        $$
+        """,
+    ],
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS tenders_fts USING fts5(
+            object_description, public_body_name,
+            content='tenders', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        CREATE TRIGGER tenders_fts_ai AFTER INSERT ON tenders BEGIN
+            INSERT INTO tenders_fts(rowid, object_description, public_body_name)
+            VALUES (new.id, new.object_description, new.public_body_name);
+        END
+        """,
+        """
+        CREATE TRIGGER tenders_fts_ad AFTER DELETE ON tenders BEGIN
+            INSERT INTO tenders_fts(
+                tenders_fts, rowid, object_description, public_body_name
+            )
+            VALUES (
+                'delete', old.id, old.object_description, old.public_body_name
+            );
+        END
+        """,
+        """
+        CREATE TRIGGER tenders_fts_au AFTER UPDATE ON tenders BEGIN
+            INSERT INTO tenders_fts(
+                tenders_fts, rowid, object_description, public_body_name
+            )
+            VALUES (
+                'delete', old.id, old.object_description, old.public_body_name
+            );
+            INSERT INTO tenders_fts(rowid, object_description, public_body_name)
+            VALUES (new.id, new.object_description, new.public_body_name);
+        END
+        """,
+    ],
+}
+
+
+def _sqlite_rollup_upsert(table: str, keys: tuple, won: str, row: str, sign: int):
+    is_won = won.format(row=f"{row}.")
+    return f"""
+        INSERT INTO {table} (
+            {", ".join(keys)}, tender_count, won_count, awarded_value
+        )
+        VALUES (
+            {", ".join(f"{row}.{key}" for key in keys)}, {sign},
+            CASE WHEN {is_won} THEN {sign} ELSE 0 END,
+            CASE WHEN {is_won}
+                THEN {sign} * coalesce({row}.awarded_value, 0) ELSE 0 END
+        )
+        ON CONFLICT ({", ".join(keys)}) DO UPDATE SET
+            tender_count = tender_count + excluded.tender_count,
+            won_count = won_count + excluded.won_count,
+            awarded_value = awarded_value + excluded.awarded_value;
+    """
+
+
+def _postgres_rollup_upsert(table: str, keys: tuple, won: str, rows: str, sign: str):
+    is_won = won.format(row="")
+    return f"""
+        INSERT INTO {table} AS stats (
+            {", ".join(keys)}, tender_count, won_count, awarded_value
+        )
+        SELECT
+            {", ".join(keys)}, {sign}count(*),
+            {sign}count(*) FILTER (WHERE {is_won}),
+            {sign}coalesce(sum(awarded_value) FILTER (WHERE {is_won}), 0)
+        FROM {rows}
+        GROUP BY {", ".join(keys)}
+        ON CONFLICT ({", ".join(keys)}) DO UPDATE SET
+            tender_count = stats.tender_count + excluded.tender_count,
+            won_count = stats.won_count + excluded.won_count,
+            awarded_value = stats.awarded_value + excluded.awarded_value;
+    """
+
+
+def _rollup_ddl(table: str, trigger_prefix: str, keys: tuple, won: str) -> dict:
+    """
+    Triggers keeping `table` (tender count, won count and awarded value
+    of won tenders per `keys`) in step with `tenders`. `won` is the SQL
+    condition for a won tender, with `{row}` before each column name.
+    """
+    operations = (
+        ("insert", "NEW TABLE AS new_rows", (("new", 1),)),
+        (
+            "update",
+            "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+            (("old", -1), ("new", 1)),
+        ),
+        ("delete", "OLD TABLE AS old_rows", (("old", -1),)),
+    )
+    postgres_upserts = {
+        "new": _postgres_rollup_upsert(table, keys, won, "new_rows", ""),
+        "old": _postgres_rollup_upsert(table, keys, won, "old_rows", "-"),
+    }
+    return {
+        "postgresql": [
+            f"""
+            CREATE OR REPLACE FUNCTION {table}_apply() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    {postgres_upserts["old"]}
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    {postgres_upserts["new"]}
+                END IF;
+                RETURN NULL;
+            END
+            $$
+            """,
+            *(
+                f"""
+                CREATE TRIGGER {trigger_prefix}_{operation}
+                AFTER {operation.upper()} ON tenders REFERENCING {transitions}
+                FOR EACH STATEMENT EXECUTE FUNCTION {table}_apply()
+                """
+                for operation, transitions, _ in operations
+            ),
+        ],
+        "sqlite": [
+            f"""
+            CREATE TRIGGER {trigger_prefix}_{operation}
+            AFTER {operation.upper()} ON tenders BEGIN
+                {"".join(
+                    _sqlite_rollup_upsert(table, keys, won, row, sign)
+                    for row, sign in rows
+                )}
+            END
+            """
+            for operation, _, rows in operations
+        ],
+    }
+
+
+# The rollups below are maintained inside the writing transaction by
+# triggers, so every write path (services, bulk statements, imports,
+# manual SQL) keeps them exact. PostgreSQL uses statement-level triggers
+# with transition tables: a multi-row write costs one upsert per group
+# instead of one per row.
+ROLLUP_DDL = {
+    "company_year_stats": _rollup_ddl(
+        "company_year_stats",
+        "tenders_stats",
+        ("company_id", "tender_year", "status"),
+        "{row}participation_result = 'WON'",
+    ),
+    "public_body_stats": _rollup_ddl(
+        "public_body_stats",
+        "tenders_public_body_stats",
+        ("company_id", "tender_year", "public_body_id"),
+        "{row}participation_result = 'WON' AND {row}status = 'FINISHED'",
+    ),
+}
+
+
+def _postgres_version_function(name: str, owner: str, affected_users: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION {name}() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            touched int[] := '{{}}';
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                touched := touched || ARRAY(SELECT {owner} FROM old_rows);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                touched := touched || ARRAY(SELECT {owner} FROM new_rows);
+            END IF;
+            UPDATE users SET data_version = data_version + 1
+            WHERE id IN ({affected_users});
+            RETURN NULL;
+        END
+        $$
+    """
+
+
+def _postgres_version_triggers(table: str, function: str) -> list[str]:
+    return [
+        f"""
+        CREATE TRIGGER {table}_data_version_{operation.lower()}
+        AFTER {operation} ON {table} REFERENCING {transitions}
+        FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """
+        for operation, transitions in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        )
+    ]
+
+
+def _sqlite_version_triggers(table: str, affected_user: str) -> list[str]:
+    bump = "UPDATE users SET data_version = data_version + 1 WHERE id = {};"
+    return [
+        f"""
+        CREATE TRIGGER {table}_data_version_{operation.lower()}
+        AFTER {operation} ON {table} BEGIN
+            {" ".join(bump.format(affected_user.format(row)) for row in rows)}
+        END
+        """
+        for operation, rows in (
+            ("INSERT", ("new",)),
+            ("UPDATE", ("old", "new")),
+            ("DELETE", ("old",)),
+        )
+    ]
+
+
+# users.data_version changes whenever one of the user's companies or
+# tenders does, in the writing transaction, so caches of per-user
+# aggregates (the dashboard) can key on it instead of expiring blindly.
+USER_DATA_VERSION_DDL = {
+    "postgresql": [
+        _postgres_version_function(
+            "companies_bump_data_version", "user_id", "SELECT unnest(touched)"
+        ),
+        _postgres_version_function(
+            "tenders_bump_data_version",
+            "company_id",
+            "SELECT user_id FROM companies WHERE id = ANY(touched)",
+        ),
+        *_postgres_version_triggers("companies", "companies_bump_data_version"),
+        *_postgres_version_triggers("tenders", "tenders_bump_data_version"),
+    ],
+    "sqlite": [
+        *_sqlite_version_triggers("companies", "{}.user_id"),
+        *_sqlite_version_triggers(
+            "tenders", "(SELECT user_id FROM companies WHERE id = {}.company_id)"
+        ),
+    ],
+}
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.settings.database import get_session
+from src.schemas.analytics import TopPublicBodiesFilterSchema, TopPublicBodiesSchema
+from src.schemas.auth import PrincipalSchema
+from src.security import get_current_user
+from src.services.analytics_service import AnalyticsService
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+Session = Annotated[AsyncSession, Depends(get_session)]
+CurrentUser = Annotated[PrincipalSchema, Depends(get_current_user)]
+
+
+@router.get("/public-bodies/top", response_model=TopPublicBodiesSchema)
+async def get_top_public_bodies(
+    session: Session,
+    current_user: CurrentUser,
+    top_filter: Annotated[TopPublicBodiesFilterSchema, Query()],
+):
+    return await AnalyticsService(session).top_public_bodies(
+        current_user.id, top_filter
+    )
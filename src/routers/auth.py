@@ -1,25 +1,51 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infra.entities import UserEntity
+from src.infra.hashing import password_needs_rehash
 from src.infra.settings.database import get_session
-from src.schemas.auth import TokenSchema
-from src.security import create_access_token, get_current_user, verify_password
+from src.schemas.auth import (
+    PrincipalSchema,
+    RefreshTokenRequestSchema,
+    TokenSchema,
+)
+from src.schemas.common import MessageSchema
+from src.security import (
+    access_token_claims,
+    create_access_token,
+    decode_access_token,
+    forget_access_token,
+    get_current_user,
+    oauth2_scheme,
+    throttle_login,
+    verify_password,
+)
+from src.services.token_service import TokenService
+from src.services.user_service import UserService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 OAuth2Form = Annotated[OAuth2PasswordRequestForm, Depends()]
 Session = Annotated[AsyncSession, Depends(get_session)]
-CurrentUser = Annotated[UserEntity, Depends(get_current_user)]
+CurrentUser = Annotated[PrincipalSchema, Depends(get_current_user)]
+BearerToken = Annotated[str, Depends(oauth2_scheme)]
 
 
 @router.post("/token", response_model=TokenSchema)
-async def login_for_access_token(form_data: OAuth2Form, session: Session):
+async def login_for_access_token(
+    request: Request,
+    form_data: OAuth2Form,
+    session: Session,
+    background_tasks: BackgroundTasks,
+):
+    client_ip = request.client.host if request.client else None
+    await throttle_login(form_data.username, client_ip)
+
     user = await session.scalar(
         select(UserEntity).where(UserEntity.email == form_data.username)
     )
@@ -34,13 +60,60 @@ async def login_for_access_token(form_data: OAuth2Form, session: Session):
             status_code=HTTPStatus.UNAUTHORIZED, detail="Incorrect email or password"
         )
 
-    access_token = create_access_token(data={"sub": user.email})
+    if password_needs_rehash(user.password):
+        background_tasks.add_task(
+            UserService(session).rehash_password,
+            user.id,
+            user.password,
+            form_data.password,
+        )
+
+    access_token = create_access_token(data=access_token_claims(user))
+    refresh_token = await TokenService(session).issue_refresh_token(
+        user.id, user.token_version
+    )
 
-    return {"access_token": access_token, "token_type": "bearer"}
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
 
 
 @router.post("/refresh_token", response_model=TokenSchema)
 async def refresh_access_token(user: CurrentUser):
-    new_access_token = create_access_token(data={"sub": user.email})
+    new_access_token = create_access_token(data=access_token_claims(user))
 
     return {"access_token": new_access_token, "token_type": "bearer"}
+
+
+@router.post("/refresh", response_model=TokenSchema)
+async def rotate_refresh_token(payload: RefreshTokenRequestSchema, session: Session):
+    user, refresh_token = await TokenService(session).rotate_refresh_token(
+        payload.refresh_token
+    )
+
+    return {
+        "access_token": create_access_token(data=access_token_claims(user)),
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
+
+
+@router.post("/logout", response_model=MessageSchema)
+async def logout(
+    user: CurrentUser,
+    token: BearerToken,
+    session: Session,
+    payload: RefreshTokenRequestSchema | None = None,
+):
+    claims = decode_access_token(token)
+    service = TokenService(session)
+
+    await service.revoke(claims["jti"], user.id, claims["exp"])
+    forget_access_token(token, claims)
+
+    if payload is not None:
+        await service.revoke_refresh_token(payload.refresh_token, user.id)
+
+    return {"message": "Logged out"}
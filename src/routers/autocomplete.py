@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.settings.database import get_session
+from src.schemas.auth import PrincipalSchema
+from src.schemas.autocomplete import (
+    PublicBodyAutocompleteFilterSchema,
+    PublicBodySuggestionsSchema,
+)
+from src.security import get_current_user
+from src.services.autocomplete_service import AutocompleteService
+
+router = APIRouter(prefix="/autocomplete", tags=["autocomplete"])
+Session = Annotated[AsyncSession, Depends(get_session)]
+CurrentUser = Annotated[PrincipalSchema, Depends(get_current_user)]
+
+
+@router.get("/public-bodies", response_model=PublicBodySuggestionsSchema)
+async def autocomplete_public_bodies(
+    session: Session,
+    current_user: CurrentUser,
+    autocomplete_filter: Annotated[PublicBodyAutocompleteFilterSchema, Query()],
+):
+    return await AutocompleteService(session).suggest_public_bodies(
+        current_user.id, autocomplete_filter.q, autocomplete_filter.limit
+    )
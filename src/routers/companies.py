@@ -4,8 +4,8 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infra.entities import UserEntity
 from src.infra.settings.database import get_session
+from src.schemas.auth import PrincipalSchema
 from src.schemas.common import MessageSchema
 from src.schemas.company import (
     CompanyCreateSchema,
@@ -15,10 +15,11 @@ from src.schemas.company import (
     FilterCompanySchema,
 )
 from src.security import get_current_user
+from src.services.autocomplete_service import public_body_index_cache
 from src.services.company_service import CompanyService
 
 Session = Annotated[AsyncSession, Depends(get_session)]
-CurrentUser = Annotated[UserEntity, Depends(get_current_user)]
+CurrentUser = Annotated[PrincipalSchema, Depends(get_current_user)]
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
@@ -40,8 +41,8 @@ async def list_companies(
     company_filter: Annotated[FilterCompanySchema, Query()],
 ):
     service = CompanyService(session)
-    companies = await service.list(user.id, company_filter)
-    return {"companies": companies}
+    page = await service.list(user.id, company_filter)
+    return {"companies": page.items, "next_cursor": page.next_cursor}
 
 
 @router.patch("/{company_id}", response_model=CompanyPublicSchema)
@@ -56,5 +57,7 @@ async def patch_company(
 async def delete_company(company_id: int, session: Session, user: CurrentUser):
     service = CompanyService(session)
     await service.delete(company_id, user.id)
+    # The company's tenders went with it.
+    public_body_index_cache.invalidate(user.id)
 
     return {"message": "Company has been deleted successfully."}
@@ -1,24 +1,66 @@
-from datetime import datetime
+from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infra.entities import UserEntity
 from src.infra.settings.database import get_session
-from src.schemas.dashboard import DashboardResponseSchema
+from src.schemas.auth import PrincipalSchema
+from src.schemas.dashboard import (
+    DashboardMetricsFilterSchema,
+    DashboardResponseSchema,
+    DashboardTimeseriesFilterSchema,
+    DashboardTimeseriesSchema,
+)
 from src.security import get_current_user
-from src.services.dashboard_service import DashboardService
+from src.services.dashboard_service import (
+    DashboardService,
+    breakdown_fields,
+    dashboard_etag,
+    etag_matches,
+)
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 Session = Annotated[AsyncSession, Depends(get_session)]
-CurrentUser = Annotated[UserEntity, Depends(get_current_user)]
+CurrentUser = Annotated[PrincipalSchema, Depends(get_current_user)]
 
 
-@router.get("/metrics", response_model=DashboardResponseSchema)
+@router.get(
+    "/metrics",
+    response_model=DashboardResponseSchema,
+    responses={HTTPStatus.NOT_MODIFIED.value: {"description": "Not modified"}},
+)
 async def get_dashboard_metrics(
     session: Session,
     current_user: CurrentUser,
-    year: int = Query(default_factory=lambda: datetime.now().year),
+    response: Response,
+    metrics_filter: Annotated[DashboardMetricsFilterSchema, Query()],
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
-    return await DashboardService(session).get_metrics(current_user.id, year)
+    service = DashboardService(session)
+    data_version = await service.data_version(current_user.id)
+    year = metrics_filter.year
+    breakdowns = breakdown_fields(metrics_filter.breakdown)
+    headers = {
+        "ETag": dashboard_etag(current_user.id, year, data_version, breakdowns),
+        "Cache-Control": "private, no-cache",
+    }
+
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return await service.get_cached_metrics(
+        current_user.id, year, data_version, breakdowns
+    )
+
+
+@router.get("/timeseries", response_model=DashboardTimeseriesSchema)
+async def get_dashboard_timeseries(
+    session: Session,
+    current_user: CurrentUser,
+    timeseries_filter: Annotated[DashboardTimeseriesFilterSchema, Query()],
+):
+    return await DashboardService(session).get_timeseries(
+        current_user.id, timeseries_filter
+    )
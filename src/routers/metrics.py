@@ -0,0 +1,47 @@
+import secrets
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from src.security import login_throttle, password_hash_pool, principal_cache
+from src.services.autocomplete_service import public_body_index_cache
+from src.services.dashboard_service import dashboard_cache, dashboard_flights
+from src.settings import Settings
+
+settings = Settings()
+
+
+def require_metrics_token(x_metrics_token: Annotated[str | None, Header()] = None):
+    """
+    The counters describe every user's traffic, so they are only served
+    to operators holding METRICS_TOKEN; without one the endpoint is off.
+    """
+    if settings.METRICS_TOKEN is None:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Not Found")
+    if x_metrics_token is None or not secrets.compare_digest(
+        x_metrics_token, settings.METRICS_TOKEN
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN, detail="Not enough permissions"
+        )
+
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+    dependencies=[Depends(require_metrics_token)],
+    include_in_schema=False,
+)
+
+
+@router.get("/")
+async def read_metrics():
+    return {
+        "principal_cache": principal_cache.snapshot(),
+        "password_hash_pool": password_hash_pool.snapshot(),
+        "login_throttle": login_throttle.snapshot(),
+        "dashboard_cache": dashboard_cache.snapshot()
+        | {"coalesced": dashboard_flights.coalesced},
+        "public_body_index_cache": public_body_index_cache.snapshot(),
+    }
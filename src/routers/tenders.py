@@ -1,26 +1,35 @@
 # pylint: disable=R0917:too-many-positional-arguments
 
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infra.entities import UserEntity
 from src.infra.settings.database import get_session
+from src.schemas.auth import PrincipalSchema
 from src.schemas.common import MessageSchema
 from src.schemas.tender import (
     FilterTenderSchema,
+    TenderBulkActionSchema,
+    TenderBulkResultSchema,
     TenderCreateSchema,
+    TenderExportFilterSchema,
+    TenderImportReportSchema,
     TenderListSchema,
     TenderResponse,
+    TenderSearchFilterSchema,
+    TenderSearchListSchema,
     TenderUpdateSchema,
 )
 from src.security import get_current_user
+from src.services.autocomplete_service import public_body_index_cache
 from src.services.company_service import CompanyService
+from src.services.export.tender_export import MEDIA_TYPES
 from src.services.tender_service import TenderService
 
 Session = Annotated[AsyncSession, Depends(get_session)]
-CurrentUser = Annotated[UserEntity, Depends(get_current_user)]
+CurrentUser = Annotated[PrincipalSchema, Depends(get_current_user)]
 
 
 def get_tender_service(session: Session) -> TenderService:
@@ -48,7 +57,9 @@ async def create_tender(
     company_service: CompanyServ,
 ):
     await company_service.get_owned(company_id, user.id)
-    return await tender_service.create(company_id, tender)
+    created = await tender_service.create(company_id, tender)
+    public_body_index_cache.invalidate(user.id)
+    return created
 
 
 @router.get("/", response_model=TenderListSchema)
@@ -60,8 +71,75 @@ async def list_tenders(
     tender_filter: Annotated[FilterTenderSchema, Query()],
 ):
     await company_service.get_owned(company_id, user.id)
-    tenders = await tender_service.list(company_id, tender_filter)
-    return {"tenders": tenders}
+    page = await tender_service.list(company_id, tender_filter)
+    response = {"tenders": page.items, "next_cursor": page.next_cursor}
+
+    if page.totals is not None:
+        response |= page.totals
+
+    return response
+
+
+@router.post("/bulk", response_model=TenderBulkResultSchema)
+async def bulk_tenders(
+    company_id: int,
+    action: TenderBulkActionSchema,
+    user: CurrentUser,
+    tender_service: TenderServ,
+    company_service: CompanyServ,
+):
+    await company_service.get_owned(company_id, user.id)
+    result = await tender_service.bulk(company_id, action)
+    public_body_index_cache.invalidate(user.id)
+    return result
+
+
+@router.post("/import", response_model=TenderImportReportSchema)
+async def import_tenders(
+    company_id: int,
+    file: UploadFile,
+    user: CurrentUser,
+    tender_service: TenderServ,
+    company_service: CompanyServ,
+    file_format: Literal["csv", "ndjson"] = "csv",
+):
+    await company_service.get_owned(company_id, user.id)
+    try:
+        return await tender_service.import_file(company_id, file.file, file_format)
+    finally:
+        # Batches are committed one by one, so even a failed import may
+        # have written tenders.
+        public_body_index_cache.invalidate(user.id)
+
+
+@router.get("/search", response_model=TenderSearchListSchema)
+async def search_tenders(
+    company_id: int,
+    user: CurrentUser,
+    tender_service: TenderServ,
+    company_service: CompanyServ,
+    search_filter: Annotated[TenderSearchFilterSchema, Query()],
+):
+    await company_service.get_owned(company_id, user.id)
+    results = await tender_service.search(company_id, search_filter)
+    return {"results": results}
+
+
+@router.get("/export")
+async def export_tenders(
+    company_id: int,
+    user: CurrentUser,
+    tender_service: TenderServ,
+    company_service: CompanyServ,
+    export_filter: Annotated[TenderExportFilterSchema, Query()],
+):
+    await company_service.get_owned(company_id, user.id)
+    filename = f"tenders-{company_id}.{export_filter.file_format}"
+    return StreamingResponse(
+        tender_service.export(company_id, export_filter),
+        media_type=MEDIA_TYPES[export_filter.file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.patch("/{tender_id}", response_model=TenderResponse)
@@ -74,7 +152,9 @@ async def patch_tender(
     company_service: CompanyServ,
 ):
     await company_service.get_owned(company_id, user.id)
-    return await tender_service.update(tender_id, company_id, tender)
+    updated = await tender_service.update(tender_id, company_id, tender)
+    public_body_index_cache.invalidate(user.id)
+    return updated
 
 
 @router.delete("/{tender_id}", response_model=MessageSchema)
@@ -87,4 +167,5 @@ async def delete_tender(
 ):
     await company_service.get_owned(company_id, user.id)
     await tender_service.delete(tender_id, company_id)
+    public_body_index_cache.invalidate(user.id)
     return {"message": "Tender has been deleted successfully."}
@@ -6,8 +6,8 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infra.entities import UserEntity
 from src.infra.settings.database import get_session
+from src.schemas.auth import PrincipalSchema
 from src.schemas.common import FilterPageSchema, MessageSchema
 from src.schemas.user import (
     UserCreateSchema,
@@ -21,7 +21,7 @@ from src.services.user_service import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
 Session = Annotated[AsyncSession, Depends(get_session)]
-CurrentUser = Annotated[UserEntity, Depends(get_current_user)]
+CurrentUser = Annotated[PrincipalSchema, Depends(get_current_user)]
 
 
 @router.post("/", status_code=HTTPStatus.CREATED, response_model=UserPublicSchema)
@@ -35,8 +35,8 @@ async def read_users(
     filter_users: Annotated[FilterPageSchema, Query()],
     current_user: CurrentUser,
 ):
-    users = await UserService(session).list(filter_users)
-    return {"users": users}
+    page = await UserService(session).list(filter_users)
+    return {"users": page.items, "next_cursor": page.next_cursor}
 
 
 @router.patch("/{user_id}", response_model=UserPublicSchema)
@@ -0,0 +1,55 @@
+from datetime import date
+from decimal import Decimal
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+MAX_TOP_K = 100
+
+PublicBodyRanking = Literal["count", "win_rate", "awarded_value"]
+
+
+class TopPublicBodiesFilterSchema(BaseModel):
+    """
+    Rankings over whole years are read from the public_body_stats
+    rollup; a `from`/`to` session-date range is answered approximately
+    from a bounded-memory sketch of the matching tenders.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    k: int = Field(default=10, ge=1, le=MAX_TOP_K)
+    by: PublicBodyRanking = "count"
+    year: int | None = None
+    start: date | None = Field(default=None, alias="from")
+    end: date | None = Field(default=None, alias="to")
+    min_tenders: int = Field(default=1, ge=1)
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if (self.start is None) != (self.end is None):
+            raise ValueError("'from' and 'to' must be given together")
+        if self.start is not None and self.year is not None:
+            raise ValueError("'year' cannot be combined with 'from'/'to'")
+        if self.start is not None and self.end < self.start:
+            raise ValueError("'to' must not be before 'from'")
+        return self
+
+    @property
+    def is_ad_hoc(self) -> bool:
+        return self.start is not None
+
+
+class PublicBodyRankSchema(BaseModel):
+    public_body_name: str
+    total_tenders: int
+    won_tenders: int
+    win_rate: float
+    total_awarded_value: Decimal
+    error: Decimal = Decimal("0")
+
+
+class TopPublicBodiesSchema(BaseModel):
+    by: PublicBodyRanking
+    approximate: bool
+    bodies: list[PublicBodyRankSchema]
@@ -1,8 +1,22 @@
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TokenSchema(BaseModel):
     access_token: str = Field(..., min_length=1)
     token_type: Literal["bearer"]
+    refresh_token: str | None = None
+
+
+class RefreshTokenRequestSchema(BaseModel):
+    refresh_token: str = Field(..., min_length=1)
+
+
+class PrincipalSchema(BaseModel):
+    id: int
+    email: str
+    username: str
+    token_version: int
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+MAX_SUGGESTIONS = 50
+
+
+class PublicBodyAutocompleteFilterSchema(BaseModel):
+    q: str = Field(..., min_length=1, max_length=150)
+    limit: int = Field(default=10, ge=1, le=MAX_SUGGESTIONS)
+
+
+class PublicBodySuggestionSchema(BaseModel):
+    id: int
+    name: str
+    tender_count: int
+
+
+class PublicBodySuggestionsSchema(BaseModel):
+    suggestions: list[PublicBodySuggestionSchema]
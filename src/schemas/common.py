@@ -1,4 +1,8 @@
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+MAX_PAGE_SIZE = 200
 
 
 class MessageSchema(BaseModel):
@@ -6,5 +10,20 @@ class MessageSchema(BaseModel):
 
 
 class FilterPageSchema(BaseModel):
+    """
+    Pages are addressed either by `offset` or by the opaque `cursor`
+    returned as `next_cursor` on the previous page. Cursor pages are read
+    by a range scan over (sort, id), so they cost the same at any depth.
+    """
+
     offset: int = Field(0, ge=0)
-    limit: int = Field(100, ge=1)
+    limit: int = Field(100, ge=1, le=MAX_PAGE_SIZE)
+    cursor: str | None = Field(None, max_length=512)
+    sort: Literal["id", "created_at"] = "id"
+    order: Literal["asc", "desc"] = "asc"
+
+    @model_validator(mode="after")
+    def check_cursor_without_offset(self):
+        if self.cursor is not None and self.offset:
+            raise ValueError("offset cannot be combined with cursor")
+        return self
@@ -26,6 +26,7 @@ class CompanyPublicSchema(CompanyBaseSchema):
 
 class CompanyListSchema(BaseModel):
     companies: list[CompanyPublicSchema]
+    next_cursor: str | None = None
 
 
 class FilterCompanySchema(FilterPageSchema):
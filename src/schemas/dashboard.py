@@ -1,6 +1,23 @@
+from datetime import date, datetime
 from decimal import Decimal
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.infra.entities import TenderStatus
+
+MAX_TIMESERIES_BUCKETS = 120
+
+TimeseriesBucket = Literal["month", "quarter"]
+DashboardBreakdown = Literal["modality", "format", "status"]
+MONTHS_PER_BUCKET = {"month": 1, "quarter": 3}
+
+
+class BreakdownBucketSchema(BaseModel):
+    value: str
+    total_tenders: int
+    won_tenders: int
+    total_awarded_value: Decimal
 
 
 class CompanyDashboardSchema(BaseModel):
@@ -9,8 +26,76 @@ class CompanyDashboardSchema(BaseModel):
     total_tenders: int
     won_tenders: int
     total_awarded_value: Decimal
+    status_counts: dict[TenderStatus, int] = {}
+    breakdowns: dict[DashboardBreakdown, list[BreakdownBucketSchema]] = {}
+
+
+class DashboardMetricsFilterSchema(BaseModel):
+    year: int = Field(default_factory=lambda: datetime.now().year)
+    breakdown: list[DashboardBreakdown] = []
 
 
 class DashboardResponseSchema(BaseModel):
     year: int
     companies: list[CompanyDashboardSchema]
+
+
+def bucket_start(day: date, bucket: TimeseriesBucket) -> date:
+    months = MONTHS_PER_BUCKET[bucket]
+    return date(day.year, (day.month - 1) // months * months + 1, 1)
+
+
+def bucket_count(start: date, end: date, bucket: TimeseriesBucket) -> int:
+    months = (end.year - start.year) * 12 + end.month - start.month
+    return months // MONTHS_PER_BUCKET[bucket] + 1
+
+
+class DashboardTimeseriesFilterSchema(BaseModel):
+    """
+    `from` and `to` are inclusive session dates; the range may span at
+    most MAX_TIMESERIES_BUCKETS buckets.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    start: date = Field(alias="from")
+    end: date = Field(alias="to")
+    bucket: TimeseriesBucket = "month"
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end < self.start:
+            raise ValueError("'to' must not be before 'from'")
+        buckets = bucket_count(
+            bucket_start(self.start, self.bucket),
+            bucket_start(self.end, self.bucket),
+            self.bucket,
+        )
+        if buckets > MAX_TIMESERIES_BUCKETS:
+            raise ValueError(
+                f"range spans {buckets} buckets, at most "
+                f"{MAX_TIMESERIES_BUCKETS} are allowed"
+            )
+        return self
+
+
+class TimeseriesPointSchema(BaseModel):
+    period_start: date
+    total_tenders: int
+    won_tenders: int
+    total_awarded_value: Decimal
+
+
+class CompanyTimeseriesSchema(BaseModel):
+    company_id: int
+    company_name: str
+    points: list[TimeseriesPointSchema]
+
+
+class DashboardTimeseriesSchema(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    start: date = Field(serialization_alias="from")
+    end: date = Field(serialization_alias="to")
+    bucket: TimeseriesBucket
+    companies: list[CompanyTimeseriesSchema]
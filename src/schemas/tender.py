@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.infra.entities import (
     ParticipationResult,
@@ -11,6 +12,8 @@ from src.infra.entities import (
 )
 from src.schemas.common import FilterPageSchema
 
+MAX_BULK_IDS = 1000
+
 
 class TenderBaseSchema(BaseModel):
     tender_number: int = Field(..., gt=0)
@@ -43,6 +46,7 @@ class TenderUpdateSchema(BaseModel):
 
 class TenderResponse(TenderBaseSchema):
     id: int
+    public_body_id: int
     status: TenderStatus
     participation_result: ParticipationResult | None
     awarded_value: Decimal | None
@@ -51,11 +55,30 @@ class TenderResponse(TenderBaseSchema):
     model_config = ConfigDict(from_attributes=True)
 
 
+class FacetCountSchema(BaseModel):
+    value: str | None
+    count: int
+
+
+class TenderFacetsSchema(BaseModel):
+    status: list[FacetCountSchema]
+    modality: list[FacetCountSchema]
+    format: list[FacetCountSchema]
+    participation_result: list[FacetCountSchema]
+
+
 class TenderListSchema(BaseModel):
     tenders: list[TenderResponse]
+    next_cursor: str | None = None
+    total: int | None = None
+    total_is_estimate: bool = False
+    facets: TenderFacetsSchema | None = None
 
 
-class FilterTenderSchema(FilterPageSchema):
+TenderSort = Literal["id", "created_at", "session_date"]
+
+
+class TenderFiltersSchema(BaseModel):
     tender_number: int | None = None
     tender_year: int | None = None
     object_description: str | None = None
@@ -65,3 +88,88 @@ class FilterTenderSchema(FilterPageSchema):
     status: TenderStatus | None = None
     participation_result: ParticipationResult | None = None
     session_date: datetime | None = None
+
+
+class FilterTenderSchema(FilterPageSchema, TenderFiltersSchema):
+    sort: TenderSort = "id"
+    counts: Literal["none", "exact", "approximate"] = "none"
+
+
+class TenderExportFilterSchema(TenderFiltersSchema):
+    # `format` already filters by tender format, hence `file_format`.
+    file_format: Literal["csv", "ndjson"] = "csv"
+    sort: TenderSort = "id"
+    order: Literal["asc", "desc"] = "asc"
+
+
+class TenderSearchFilterSchema(FilterTenderSchema):
+    q: str = Field(..., min_length=2, max_length=200)
+
+
+# Identity fields are left out: giving many tenders the same number, body
+# or modality would only collide on uq_tenders_identity.
+class TenderBulkPatchSchema(BaseModel):
+    status: TenderStatus | None = None
+    participation_result: ParticipationResult | None = None
+    awarded_value: Decimal | None = Field(None, ge=0)
+    session_date: datetime | None = None
+
+    @model_validator(mode="after")
+    def check_required_fields_not_null(self):
+        for field in ("status", "session_date"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        if not self.model_fields_set:
+            raise ValueError("patch must set at least one field")
+        return self
+
+
+class TenderBulkActionSchema(BaseModel):
+    ids: list[int] | None = Field(None, min_length=1, max_length=MAX_BULK_IDS)
+    filters: TenderFiltersSchema | None = None
+    action: Literal["update", "delete"]
+    patch: TenderBulkPatchSchema | None = None
+
+    @model_validator(mode="after")
+    def check_selector_and_patch(self):
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("Provide exactly one of ids or filters")
+        if (self.action == "update") != (self.patch is not None):
+            raise ValueError("patch is required for update and only allowed there")
+        return self
+
+
+class TenderBulkResultSchema(BaseModel):
+    action: Literal["update", "delete"]
+    affected: int
+    ids: list[int]
+    not_found: list[int] = []
+
+
+class TenderImportRowSchema(BaseModel):
+    row: int
+    status: Literal["created", "duplicate", "invalid"]
+    id: int | None = None
+    errors: list[str] = []
+
+
+class TenderImportReportSchema(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    rows: list[TenderImportRowSchema]
+
+
+class TenderHighlightSchema(BaseModel):
+    object_description: str
+    public_body_name: str
+
+
+class TenderSearchHitSchema(BaseModel):
+    tender: TenderResponse
+    rank: float
+    highlights: TenderHighlightSchema
+
+
+class TenderSearchListSchema(BaseModel):
+    results: list[TenderSearchHitSchema]
@@ -27,3 +27,4 @@ class UserPasswordUpdateSchema(BaseModel):
 
 class UserListSchema(BaseModel):
     users: list[UserPublicSchema]
+    next_cursor: str | None = None
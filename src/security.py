@@ -1,22 +1,50 @@
+import math
+import uuid
 from datetime import datetime, timedelta
 from http import HTTPStatus
 from zoneinfo import ZoneInfo
 
-import anyio
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jwt import DecodeError, ExpiredSignatureError, decode, encode
-from pwdlib import PasswordHash
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infra.cache import TTLCache
 from src.infra.entities import UserEntity
+from src.infra.hashing import HashPoolSaturatedError, PasswordHashPool
+from src.infra.rate_limit import BucketPolicy, LoginThrottle, build_rate_limit_store
+from src.infra.revocation import RevocationList
 from src.infra.settings.database import get_session
+from src.schemas.auth import PrincipalSchema
 from src.settings import Settings
 
 settings = Settings()
 
-pwd_context = PasswordHash.recommended()
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    kind=settings.PASSWORD_HASH_EXECUTOR,
+)
+
+principal_cache = TTLCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+revocation_list = RevocationList()
+
+login_throttle = LoginThrottle(
+    store=build_rate_limit_store(settings.RATE_LIMIT_STORE),
+    email_policy=BucketPolicy(
+        capacity=settings.LOGIN_RATE_LIMIT_EMAIL_CAPACITY,
+        refill_per_second=settings.LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE / 60,
+    ),
+    ip_policy=BucketPolicy(
+        capacity=settings.LOGIN_RATE_LIMIT_IP_CAPACITY,
+        refill_per_second=settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE / 60,
+    ),
+)
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="auth/token", refreshUrl="auth/refresh_token"
@@ -28,37 +56,115 @@ def create_access_token(data: dict):
     expire = datetime.now(tz=ZoneInfo("UTC")) + timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
     return encoded_jwt
 
 
+def access_token_claims(user) -> dict:
+    """
+    Claims identifying `user` in an access token. `uid` allows a primary-key
+    lookup and `ver` lets a password or email change revoke older tokens.
+    """
+    return {"sub": user.email, "uid": user.id, "ver": user.token_version}
+
+
+def decode_access_token(token: str) -> dict:
+    return decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
+def forget_access_token(token: str, claims: dict) -> None:
+    """
+    Marks a token as revoked in this process. The caller is responsible
+    for persisting the revocation so that other workers pick it up.
+    """
+    revocation_list.add(claims["jti"], claims["exp"])
+    principal_cache.invalidate(token)
+
+
+async def throttle_login(email: str, client_ip: str | None) -> None:
+    decision = await login_throttle.check(email, client_ip)
+
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=HTTPStatus.TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Try again later.",
+            headers={"Retry-After": str(math.ceil(decision.retry_after))},
+        )
+
+
+def _password_pool_busy_exception():
+    return HTTPException(
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        detail="Too many concurrent authentication requests. Try again shortly.",
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+    )
+
+
 async def get_password_hash(password: str):
-    return await anyio.to_thread.run_sync(pwd_context.hash, password)
+    try:
+        return await password_hash_pool.hash(password)
+    except HashPoolSaturatedError as e:
+        raise _password_pool_busy_exception() from e
 
 
 async def verify_password(plain_password: str, hashed_password: str):
-    return await anyio.to_thread.run_sync(
-        pwd_context.verify, plain_password, hashed_password
-    )
+    try:
+        return await password_hash_pool.verify(plain_password, hashed_password)
+    except HashPoolSaturatedError as e:
+        raise _password_pool_busy_exception() from e
+
+
+async def load_principal(session: AsyncSession, user_id: int):
+    """
+    Loads only the columns needed to authorize a request, never the
+    user's companies or tenders.
+    """
+    row = (
+        await session.execute(
+            select(
+                UserEntity.id,
+                UserEntity.email,
+                UserEntity.username,
+                UserEntity.token_version,
+            ).where(UserEntity.id == user_id)
+        )
+    ).one_or_none()
+
+    if row is None:
+        return None
+
+    return PrincipalSchema.model_validate(row)
 
 
 async def get_current_user(
     session: AsyncSession = Depends(get_session),
     token: str = Depends(oauth2_scheme),
-):
+) -> PrincipalSchema:
     credentials_exception = HTTPException(
         status_code=HTTPStatus.UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    cached = principal_cache.get(token)
+    if cached is not None:
+        user, jti = cached
+        if revocation_list.is_revoked(jti):
+            raise credentials_exception
+        return user
+
     try:
-        payload = decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        subject_email = payload.get("sub")
+        payload = decode_access_token(token)
+        user_id = payload.get("uid")
+        token_version = payload.get("ver")
+        jti = payload.get("jti")
 
-        if not subject_email:
+        if user_id is None or token_version is None or jti is None:
+            raise credentials_exception
+
+        if revocation_list.is_revoked(jti):
             raise credentials_exception
 
     except DecodeError as e:
@@ -67,11 +173,11 @@ async def get_current_user(
     except ExpiredSignatureError as e:
         raise credentials_exception from e
 
-    user = await session.scalar(
-        select(UserEntity).where(UserEntity.email == subject_email)
-    )
+    user = await load_principal(session, user_id)
 
-    if not user:
+    if not user or user.token_version != token_version:
         raise credentials_exception
 
+    principal_cache.set(token, (user, jti), group=user.id, expires_at=payload["exp"])
+
     return user
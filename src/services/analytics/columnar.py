@@ -0,0 +1,277 @@
+"""
+Columnar snapshot of `companies` and `tenders` for offline analytics.
+
+A snapshot is a directory holding one raw little-endian array per
+column plus `manifest.json` (row counts, dtypes and the dictionaries of
+encoded columns). Enums are dictionary-encoded as uint8 codes and public
+body names as int32 codes; money is stored as int64 cents. Tender rows
+are sorted by (company_id, id), so one company's rows are a contiguous
+slice. The layout is what `numpy.memmap(path, dtype=manifest dtype)`
+expects, but reading only needs the standard library: columns are
+memory-mapped and exposed as zero-copy typed memoryviews.
+
+Snapshots are published under `<root>/<name>` and `<root>/current` is
+swapped to point at the newest one atomically, so readers never see a
+half-written snapshot.
+"""
+
+import json
+import mmap
+import os
+import shutil
+import sys
+from array import array
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.entities import (
+    CompanyEntity,
+    ParticipationResult,
+    TenderEntity,
+    TenderFormat,
+    TenderModality,
+    TenderStatus,
+)
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_BATCH_SIZE = 10_000
+CURRENT = "current"
+KEPT_SNAPSHOTS = 2
+
+# column -> array typecode; all typecodes have a fixed size on every
+# supported platform (q: 8 bytes, i: 4, B: 1).
+COMPANY_COLUMNS = {"id": "q", "user_id": "q"}
+TENDER_COLUMNS = {
+    "id": "q",
+    "company_id": "q",
+    "tender_year": "i",
+    "modality": "B",
+    "format": "B",
+    "status": "B",
+    "participation_result": "B",
+    "awarded_cents": "q",
+    "session_date": "q",
+    "public_body": "i",
+}
+NUMPY_DTYPES = {"q": "<i8", "i": "<i4", "B": "u1"}
+
+# Enum columns store the index of the member in its enum; a null
+# participation result gets the code right after the last member.
+ENUM_COLUMNS = {
+    "modality": TenderModality,
+    "format": TenderFormat,
+    "status": TenderStatus,
+    "participation_result": ParticipationResult,
+}
+
+
+def enum_codes(enum_class) -> dict:
+    codes = {member: code for code, member in enumerate(enum_class)}
+    codes[None] = len(codes)
+    return codes
+
+
+def to_cents(value: Decimal | None) -> int:
+    return 0 if value is None else int((value * 100).to_integral_value())
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+def to_epoch(moment: datetime) -> int:
+    """Seconds since the epoch; naive datetimes are taken as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+class _ColumnWriter:
+    def __init__(self, directory: Path, table: str, columns: dict[str, str]):
+        self.columns = columns
+        self.files = {
+            # pylint: disable-next=consider-using-with
+            name: open(directory / f"{table}.{name}.bin", "wb")
+            for name in columns
+        }
+        self.rows = 0
+
+    def write(self, batch: dict[str, list]) -> None:
+        for name, typecode in self.columns.items():
+            values = array(typecode, batch[name])
+            if sys.byteorder != "little":
+                values.byteswap()
+            values.tofile(self.files[name])
+        self.rows += len(batch["id"])
+
+    def close(self) -> None:
+        for file in self.files.values():
+            file.close()
+
+
+def _publish(root: Path, directory: Path) -> None:
+    link = root / f".{CURRENT}.{os.getpid()}"
+    link.unlink(missing_ok=True)
+    link.symlink_to(directory.name)
+    os.replace(link, root / CURRENT)
+
+    snapshots = sorted(
+        path for path in root.iterdir() if path.is_dir() and not path.is_symlink()
+    )
+    for old in snapshots[:-KEPT_SNAPSHOTS]:
+        # Mappings already open on the removed files stay valid.
+        shutil.rmtree(old)
+
+
+async def write_snapshot(session: AsyncSession, root: Path) -> Path:
+    """
+    Streams both tables into a new snapshot under `root`, in batches of
+    SNAPSHOT_BATCH_SIZE rows so memory stays flat, then publishes it as
+    `root/current`. Run it inside a REPEATABLE READ transaction (or
+    against a replica) for companies and tenders from the same instant.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    created_at = datetime.now(timezone.utc)
+    directory = root / created_at.strftime("%Y%m%dT%H%M%S%fZ")
+    directory.mkdir()
+
+    company_writer = _ColumnWriter(directory, "companies", COMPANY_COLUMNS)
+    company_names = []
+    result = await session.stream(
+        select(CompanyEntity.id, CompanyEntity.user_id, CompanyEntity.name)
+        .order_by(CompanyEntity.id)
+        .execution_options(yield_per=SNAPSHOT_BATCH_SIZE)
+    )
+    async for rows in result.partitions():
+        company_writer.write(
+            {"id": [r.id for r in rows], "user_id": [r.user_id for r in rows]}
+        )
+        company_names.extend(r.name for r in rows)
+    company_writer.close()
+
+    codes = {column: enum_codes(enum) for column, enum in ENUM_COLUMNS.items()}
+    bodies: dict[str, int] = {}
+    tender_writer = _ColumnWriter(directory, "tenders", TENDER_COLUMNS)
+    result = await session.stream(
+        select(
+            TenderEntity.id,
+            TenderEntity.company_id,
+            TenderEntity.tender_year,
+            *(getattr(TenderEntity, column) for column in ENUM_COLUMNS),
+            TenderEntity.awarded_value,
+            TenderEntity.session_date,
+            TenderEntity.public_body_name,
+        )
+        .order_by(TenderEntity.company_id, TenderEntity.id)
+        .execution_options(yield_per=SNAPSHOT_BATCH_SIZE)
+    )
+    async for rows in result.partitions():
+        batch = {
+            "id": [r.id for r in rows],
+            "company_id": [r.company_id for r in rows],
+            "tender_year": [r.tender_year for r in rows],
+            "awarded_cents": [to_cents(r.awarded_value) for r in rows],
+            "session_date": [to_epoch(r.session_date) for r in rows],
+            "public_body": [
+                bodies.setdefault(r.public_body_name, len(bodies)) for r in rows
+            ],
+        }
+        for column, column_codes in codes.items():
+            batch[column] = [column_codes[getattr(r, column)] for r in rows]
+        tender_writer.write(batch)
+    tender_writer.close()
+
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": created_at.isoformat(),
+        "tables": {
+            "companies": {
+                "rows": company_writer.rows,
+                "columns": {
+                    name: NUMPY_DTYPES[code] for name, code in COMPANY_COLUMNS.items()
+                },
+            },
+            "tenders": {
+                "rows": tender_writer.rows,
+                "sorted_by": ["company_id", "id"],
+                "columns": {
+                    name: NUMPY_DTYPES[code] for name, code in TENDER_COLUMNS.items()
+                },
+            },
+        },
+        "dictionaries": {
+            **{
+                column: [member.name for member in enum] + [None]
+                for column, enum in ENUM_COLUMNS.items()
+            },
+            "public_body": list(bodies),
+            "company_name": company_names,
+        },
+    }
+    (directory / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False))
+
+    _publish(root, directory)
+    return directory
+
+
+class Snapshot:
+    """
+    Read-only view of a published snapshot. Columns are memoryviews over
+    memory-mapped files: nothing is copied until values are used, and
+    slicing a column is free.
+    """
+
+    def __init__(self, root: Path):
+        self.path = (root / CURRENT).resolve()
+        self.manifest = json.loads((self.path / "manifest.json").read_text())
+        if self.manifest["format_version"] != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot format {self.manifest['format_version']}."
+            )
+        self.dictionaries = self.manifest["dictionaries"]
+        self._maps: list[mmap.mmap] = []
+        self._views: list[memoryview] = []
+        self.companies = self._open("companies", COMPANY_COLUMNS)
+        self.tenders = self._open("tenders", TENDER_COLUMNS)
+
+    def _open(self, table: str, columns: dict[str, str]) -> dict[str, memoryview]:
+        opened = {}
+        for name, typecode in columns.items():
+            path = self.path / f"{table}.{name}.bin"
+            if path.stat().st_size == 0:
+                opened[name] = memoryview(array(typecode))
+                continue
+            with open(path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            self._views.append(memoryview(mapped))
+            view = self._views[-1].cast(typecode)
+            self._views.append(view)
+            if sys.byteorder != "little":
+                swapped = array(typecode, view)
+                swapped.byteswap()
+                view = memoryview(swapped)
+            opened[name] = view
+        return opened
+
+    def code(self, column: str, name: str | None) -> int:
+        return self.dictionaries[column].index(name)
+
+    def close(self) -> None:
+        """Unmaps the files; slices taken from the columns must be gone."""
+        for view in reversed(self._views):
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._views.clear()
+        self._maps.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,111 @@
+# pylint: disable=E1102:not-callable
+
+from decimal import Decimal
+
+from sqlalchemy import String, case, func, literal, null, tuple_, type_coerce, union_all
+
+from src.infra.entities import (
+    ParticipationResult,
+    TenderEntity,
+    TenderStatus,
+    table_of,
+)
+
+BREAKDOWN_FIELDS = ("modality", "format", "status")
+
+
+def _measures():
+    won = (TenderEntity.participation_result == ParticipationResult.WON) & (
+        TenderEntity.status == TenderStatus.FINISHED
+    )
+    return (
+        func.count().label("total_tenders"),
+        func.count().filter(won).label("won_tenders"),
+        func.sum(case((won, TenderEntity.awarded_value))).label("total_awarded_value"),
+    )
+
+
+def _columns(fields):
+    return [getattr(TenderEntity, field) for field in fields]
+
+
+def postgres_breakdowns(query, fields):
+    """
+    Per-company counts for every requested dimension from a single
+    GROUP BY GROUPING SETS ((company_id, modality), (company_id, status), ...)
+    scan. grouping() over the dimension columns tells which set a row
+    belongs to: it has a zero bit only for the dimension it groups by.
+    """
+    columns = _columns(fields)
+    return query.with_only_columns(
+        TenderEntity.company_id,
+        func.grouping(*columns).label("dimension"),
+        *(type_coerce(column, String).label(column.key) for column in columns),
+        *_measures(),
+    ).group_by(
+        func.grouping_sets(
+            *(tuple_(TenderEntity.company_id, column) for column in columns)
+        )
+    )
+
+
+def sqlite_breakdowns(query, fields):
+    """Same rows as postgres_breakdowns, from one UNION ALL statement."""
+    columns = _columns(fields)
+    return union_all(
+        *(
+            query.with_only_columns(
+                TenderEntity.company_id,
+                literal(index).label("dimension"),
+                *(
+                    (
+                        type_coerce(other, String)
+                        if other is column
+                        else type_coerce(null(), String)
+                    ).label(other.key)
+                    for other in columns
+                ),
+                *_measures(),
+            ).group_by(TenderEntity.company_id, column)
+            for index, column in enumerate(columns)
+        )
+    )
+
+
+def _dimension_index(dimension: int, dialect: str, count: int) -> int:
+    if dialect == "sqlite":
+        return dimension
+
+    all_bits = (1 << count) - 1
+    for index in range(count):
+        if dimension == all_bits ^ (1 << (count - 1 - index)):
+            return index
+    raise ValueError(f"Unexpected grouping() value {dimension}.")
+
+
+def parse_breakdown_rows(rows, fields, dialect: str) -> dict[int, dict]:
+    """
+    Folds the rows into {company_id: {field: [bucket, ...]}}, buckets
+    ordered by descending tender count.
+    """
+    companies = {}
+    for row in rows:
+        field = fields[_dimension_index(row.dimension, dialect, len(fields))]
+        enum_class = table_of(TenderEntity).c[field].type.enum_class
+        breakdowns = companies.setdefault(
+            row.company_id, {field: [] for field in fields}
+        )
+        breakdowns[field].append(
+            {
+                "value": enum_class[getattr(row, field)].value,
+                "total_tenders": row.total_tenders,
+                "won_tenders": row.won_tenders,
+                "total_awarded_value": Decimal(row.total_awarded_value or 0),
+            }
+        )
+
+    for breakdowns in companies.values():
+        for buckets in breakdowns.values():
+            buckets.sort(key=lambda bucket: (-bucket["total_tenders"], bucket["value"]))
+
+    return companies
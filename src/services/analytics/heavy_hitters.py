@@ -0,0 +1,88 @@
+import heapq
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Hashable
+
+
+@dataclass
+class Counter:
+    key: Hashable
+    weight: Decimal | int = 0
+    error: Decimal | int = 0
+    tenders: int = 0
+    won: int = 0
+    awarded_value: Decimal = Decimal("0")
+
+
+class SpaceSaving:
+    """
+    Weighted Space-Saving sketch (Metwally et al.): tracks at most
+    `capacity` keys, so memory stays bounded however many distinct keys
+    the stream holds. When full, a new key replaces the lightest one and
+    inherits its weight as `error`; a key's true weight lies within
+    [weight - error, weight], and every key heavier than
+    total / capacity is guaranteed to be tracked.
+
+    Tender, win and value tallies are exact from the moment a key is
+    (re)admitted, so they are lower bounds for keys with an error.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.counters: dict[Hashable, Counter] = {}
+        self.total = 0
+        # Min-heap of (weight, insertion order, key); entries go stale
+        # when a key gains weight and are skipped when popped.
+        self._heap: list[tuple] = []
+        self._order = 0
+
+    def __len__(self):
+        return len(self.counters)
+
+    def _push(self, counter: Counter) -> None:
+        self._order += 1
+        heapq.heappush(self._heap, (counter.weight, self._order, counter.key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [
+                (c.weight, index, c.key)
+                for index, c in enumerate(self.counters.values())
+            ]
+            heapq.heapify(self._heap)
+
+    def _pop_lightest(self) -> Counter:
+        while True:
+            weight, _, key = heapq.heappop(self._heap)
+            counter = self.counters.get(key)
+            if counter is not None and counter.weight == weight:
+                del self.counters[key]
+                return counter
+
+    def offer(
+        self,
+        key: Hashable,
+        weight: Decimal | int = 1,
+        won: bool = False,
+        awarded_value: Decimal | None = None,
+    ) -> None:
+        counter = self.counters.get(key)
+        if counter is None and not weight:
+            # Weightless items would only displace tracked keys.
+            return
+
+        self.total += weight
+        if counter is None:
+            counter = Counter(key)
+            if len(self.counters) >= self.capacity:
+                evicted = self._pop_lightest()
+                counter.weight = counter.error = evicted.weight
+            self.counters[key] = counter
+
+        counter.weight += weight
+        counter.tenders += 1
+        if won:
+            counter.won += 1
+            counter.awarded_value += awarded_value or 0
+        if weight:
+            self._push(counter)
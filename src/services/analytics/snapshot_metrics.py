@@ -0,0 +1,111 @@
+"""
+Dashboard metrics computed from a columnar snapshot instead of the
+database. Work is done a column at a time: rows are selected with
+`itertools.compress` masks and grouped with `Counter`, so the per-row
+loops run in C, and only the user's companies' slices of each column
+are ever read.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from itertools import compress, repeat
+from operator import eq
+
+from src.infra.entities import TenderEntity, TenderStatus, table_of
+from src.services.analytics.columnar import Snapshot, from_cents
+
+
+def _owned_companies(snapshot: Snapshot, user_id: int) -> list[tuple[int, str]]:
+    companies = snapshot.companies
+    positions = compress(
+        range(len(companies["id"])), map(user_id.__eq__, companies["user_id"])
+    )
+    names = snapshot.dictionaries["company_name"]
+    return [(companies["id"][index], names[index]) for index in positions]
+
+
+def _public_value(snapshot: Snapshot, field: str, code: int) -> str:
+    enum_class = table_of(TenderEntity).c[field].type.enum_class
+    return enum_class[snapshot.dictionaries[field][code]].value
+
+
+def _breakdown(snapshot, field, codes, won_mask, cents) -> list[dict]:
+    totals = Counter(codes)
+    wins = Counter(compress(codes, won_mask))
+    values = defaultdict(int)
+    for code, value in compress(zip(codes, cents), won_mask):
+        values[code] += value
+
+    buckets = [
+        {
+            "value": _public_value(snapshot, field, code),
+            "total_tenders": total,
+            "won_tenders": wins[code],
+            "total_awarded_value": from_cents(values[code]),
+        }
+        for code, total in totals.items()
+    ]
+    buckets.sort(key=lambda bucket: (-bucket["total_tenders"], bucket["value"]))
+    return buckets
+
+
+def _company_metrics(snapshot, company_id, year, won_key, breakdowns) -> dict:
+    """
+    Metrics of one company's tenders of `year`; `won_key` holds the
+    (status, participation_result) codes of a won tender.
+    """
+    tenders = snapshot.tenders
+    # Rows are sorted by company, so its tenders are one slice.
+    lo = bisect_left(tenders["company_id"], company_id)
+    hi = bisect_right(tenders["company_id"], company_id, lo)
+    in_year = list(map(year.__eq__, tenders["tender_year"][lo:hi]))
+
+    def column(field: str) -> list[int]:
+        return list(compress(tenders[field][lo:hi], in_year))
+
+    statuses = column("status")
+    cents = column("awarded_cents")
+    won_mask = list(
+        map(eq, zip(statuses, column("participation_result")), repeat(won_key))
+    )
+
+    metrics = {
+        "total_tenders": len(statuses),
+        "won_tenders": sum(won_mask),
+        "total_awarded_value": from_cents(sum(compress(cents, won_mask))),
+        "status_counts": {
+            TenderStatus[snapshot.dictionaries["status"][code]]: count
+            for code, count in Counter(statuses).items()
+        },
+    }
+    if breakdowns:
+        metrics["breakdowns"] = {
+            field: _breakdown(
+                snapshot,
+                field,
+                statuses if field == "status" else column(field),
+                won_mask,
+                cents,
+            )
+            for field in breakdowns
+        }
+    return metrics
+
+
+def snapshot_metrics(
+    snapshot: Snapshot, user_id: int, year: int, breakdowns: tuple[str, ...] = ()
+) -> dict:
+    """
+    Same result as DashboardService.get_metrics(user_id, year,
+    breakdowns), read from `snapshot`.
+    """
+    won_key = (
+        snapshot.code("status", TenderStatus.FINISHED.name),
+        snapshot.code("participation_result", "WON"),
+    )
+    companies = [
+        {"company_id": company_id, "company_name": name}
+        | _company_metrics(snapshot, company_id, year, won_key, breakdowns)
+        for company_id, name in _owned_companies(snapshot, user_id)
+    ]
+    return {"year": year, "companies": companies}
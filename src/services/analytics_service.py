@@ -0,0 +1,157 @@
+# pylint: disable=E1102:not-callable
+
+from datetime import timedelta
+from decimal import Decimal
+
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.entities import (
+    CompanyEntity,
+    ParticipationResult,
+    PublicBodyEntity,
+    PublicBodyStatsEntity,
+    TenderEntity,
+    TenderStatus,
+)
+from src.schemas.analytics import TopPublicBodiesFilterSchema
+from src.services.analytics.heavy_hitters import SpaceSaving
+from src.settings import Settings
+
+settings = Settings()
+
+SKETCH_BATCH_SIZE = 5000
+
+
+def _win_rate(won: int, total: int) -> float:
+    return won / total if total else 0.0
+
+
+class AnalyticsService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _owned_company_ids(self, user_id: int):
+        return select(CompanyEntity.id).where(CompanyEntity.user_id == user_id)
+
+    async def _public_body_names(self, body_ids: list[int]) -> dict[int, str]:
+        rows = await self.session.execute(
+            select(PublicBodyEntity.id, PublicBodyEntity.name).where(
+                PublicBodyEntity.id.in_(body_ids)
+            )
+        )
+        return dict(rows.all())
+
+    async def top_public_bodies(
+        self, user_id: int, filters: TopPublicBodiesFilterSchema
+    ) -> dict:
+        if filters.is_ad_hoc:
+            bodies = await self._sketch_top_public_bodies(user_id, filters)
+        else:
+            bodies = await self._rollup_top_public_bodies(user_id, filters)
+        return {"by": filters.by, "approximate": filters.is_ad_hoc, "bodies": bodies}
+
+    async def _rollup_top_public_bodies(
+        self, user_id: int, filters: TopPublicBodiesFilterSchema
+    ) -> list[dict]:
+        """
+        Exact ranking from the public_body_stats rollup: one row per
+        company, year and body instead of one per tender.
+        """
+        total = func.sum(PublicBodyStatsEntity.tender_count).label("total")
+        won = func.sum(PublicBodyStatsEntity.won_count).label("won")
+        awarded_value = func.sum(PublicBodyStatsEntity.awarded_value).label(
+            "awarded_value"
+        )
+        ranking = {
+            "count": (total.desc(), won.desc()),
+            "win_rate": ((cast(won, Float) / total).desc(), total.desc()),
+            "awarded_value": (awarded_value.desc(), total.desc()),
+        }[filters.by]
+
+        stmt = (
+            select(PublicBodyEntity.name, total, won, awarded_value)
+            .join(PublicBodyEntity)
+            .where(
+                PublicBodyStatsEntity.company_id.in_(self._owned_company_ids(user_id))
+            )
+            .group_by(PublicBodyEntity.id)
+            .having(total >= filters.min_tenders)
+            .order_by(*ranking, PublicBodyEntity.name)
+            .limit(filters.k)
+        )
+        if filters.year is not None:
+            stmt = stmt.where(PublicBodyStatsEntity.tender_year == filters.year)
+        if filters.by == "awarded_value":
+            stmt = stmt.having(awarded_value > 0)
+
+        return [
+            {
+                "public_body_name": row.name,
+                "total_tenders": row.total,
+                "won_tenders": row.won,
+                "win_rate": _win_rate(row.won, row.total),
+                "total_awarded_value": Decimal(row.awarded_value),
+            }
+            for row in await self.session.execute(stmt)
+        ]
+
+    async def _sketch_top_public_bodies(
+        self, user_id: int, filters: TopPublicBodiesFilterSchema
+    ) -> list[dict]:
+        """
+        Approximate ranking for an arbitrary session-date range, which no
+        rollup covers. Matching tenders are streamed through a
+        Space-Saving sketch of PUBLIC_BODY_SKETCH_CAPACITY counters, so
+        memory is bounded by the sketch rather than the number of
+        distinct bodies. Counts and values may be underestimated by at
+        most `error`; win rate ranks the bodies heaviest by count.
+        """
+        is_won = (TenderEntity.participation_result == ParticipationResult.WON) & (
+            TenderEntity.status == TenderStatus.FINISHED
+        )
+        stmt = select(
+            TenderEntity.public_body_id,
+            is_won.label("won"),
+            TenderEntity.awarded_value,
+        ).where(
+            TenderEntity.company_id.in_(self._owned_company_ids(user_id)),
+            TenderEntity.session_date >= filters.start,
+            TenderEntity.session_date < filters.end + timedelta(days=1),
+        )
+
+        sketch = SpaceSaving(settings.PUBLIC_BODY_SKETCH_CAPACITY)
+        result = await self.session.stream(
+            stmt.execution_options(yield_per=SKETCH_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            for body_id, won, value in rows:
+                weight = 1
+                if filters.by == "awarded_value":
+                    weight = (value or 0) if won else 0
+                sketch.offer(body_id, weight, won=bool(won), awarded_value=value)
+
+        candidates = [
+            counter
+            for counter in sketch.counters.values()
+            if counter.tenders >= filters.min_tenders
+        ]
+        names = await self._public_body_names([c.key for c in candidates])
+        if filters.by == "win_rate":
+            candidates.sort(
+                key=lambda c: (-_win_rate(c.won, c.tenders), -c.tenders, names[c.key])
+            )
+        else:
+            candidates.sort(key=lambda c: (-c.weight, c.error, names[c.key]))
+
+        return [
+            {
+                "public_body_name": names[counter.key],
+                "total_tenders": counter.tenders,
+                "won_tenders": counter.won,
+                "win_rate": _win_rate(counter.won, counter.tenders),
+                "total_awarded_value": Decimal(counter.awarded_value),
+                "error": Decimal(counter.error),
+            }
+            for counter in candidates[: filters.k]
+        ]
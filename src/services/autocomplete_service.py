@@ -0,0 +1,94 @@
+# pylint: disable=E1102:not-callable
+
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.cache import SingleFlight, TTLCache
+from src.infra.entities import CompanyEntity, PublicBodyEntity, TenderEntity
+from src.services.search.public_body_index import PublicBodyIndex
+from src.settings import Settings
+
+settings = Settings()
+
+
+class PublicBodyIndexCache:
+    """
+    One PublicBodyIndex per user, least recently used evicted first.
+    Tender writes and company deletes invalidate the writer's entry (see
+    routers/tenders.py and routers/companies.py); the TTL bounds staleness
+    after writes made by other processes.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.indexes = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.flights = SingleFlight()
+        # Bumped by every invalidation: an index whose build overlapped
+        # one may predate the write, so it is returned but not cached.
+        self.generation = 0
+
+    async def get(
+        self, user_id: int, build: Callable[[], Awaitable[PublicBodyIndex]]
+    ) -> PublicBodyIndex:
+        index = self.indexes.get(user_id)
+        if index is not None:
+            return index
+
+        async def load():
+            generation = self.generation
+            index = await build()
+            if generation == self.generation:
+                self.indexes.set(user_id, index)
+            return index
+
+        return await self.flights.do(user_id, load)
+
+    def invalidate(self, user_id: int) -> None:
+        self.generation += 1
+        self.indexes.invalidate(user_id)
+
+    def clear(self) -> None:
+        self.indexes.clear()
+
+    def snapshot(self) -> dict:
+        return self.indexes.snapshot() | {"coalesced": self.flights.coalesced}
+
+
+public_body_index_cache = PublicBodyIndexCache(
+    max_size=settings.AUTOCOMPLETE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTOCOMPLETE_CACHE_TTL_SECONDS,
+)
+
+
+class AutocompleteService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _build_public_body_index(self, user_id: int) -> PublicBodyIndex:
+        rows = await self.session.execute(
+            select(
+                PublicBodyEntity.id,
+                PublicBodyEntity.normalized_name,
+                PublicBodyEntity.name,
+                func.count(TenderEntity.id),
+            )
+            .join(TenderEntity, TenderEntity.public_body_id == PublicBodyEntity.id)
+            .where(
+                TenderEntity.company_id.in_(
+                    select(CompanyEntity.id).where(CompanyEntity.user_id == user_id)
+                )
+            )
+            .group_by(PublicBodyEntity.id)
+        )
+        return PublicBodyIndex(rows.tuples())
+
+    async def suggest_public_bodies(self, user_id: int, query: str, limit: int):
+        """
+        Public bodies of the user's tenders matching `query`, from the
+        user's cached index: warm lookups never touch the database.
+        """
+        index = await public_body_index_cache.get(
+            user_id, lambda: self._build_public_body_index(user_id)
+        )
+        return {"suggestions": index.suggest(query, limit)}
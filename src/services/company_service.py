@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infra.entities import CompanyEntity
+from src.services.pagination import paginate
 
 
 class CompanyService:
@@ -77,11 +78,7 @@ class CompanyService:
         if filters.cnpj:
             query = query.filter(CompanyEntity.cnpj == filters.cnpj)
 
-        result = await self.session.scalars(
-            query.offset(filters.offset).limit(filters.limit)
-        )
-
-        return result.all()
+        return await paginate(self.session, query, CompanyEntity, filters)
 
     async def update(self, company_id: int, user_id: int, data):
         company = await self.get_owned(company_id, user_id)
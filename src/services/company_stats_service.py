@@ -0,0 +1,135 @@
+# pylint: disable=E1102:not-callable
+
+from collections.abc import AsyncIterator, Iterable
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.dialects import dialect_name
+from src.infra.entities import (
+    CompanyEntity,
+    CompanyYearStatsEntity,
+    ParticipationResult,
+    TenderEntity,
+    table_of,
+)
+
+STATS_CHUNK_SIZE = 500
+
+STATS_KEYS = ("company_id", "tender_year", "status")
+STATS_VALUES = ("tender_count", "won_count", "awarded_value")
+
+
+def live_stats_query(company_ids: Iterable[int]):
+    """
+    Recomputes company_year_stats rows for `company_ids` from the tenders
+    table; the rollup triggers must always agree with it.
+    """
+    won = TenderEntity.participation_result == ParticipationResult.WON
+    return (
+        select(
+            TenderEntity.company_id,
+            TenderEntity.tender_year,
+            TenderEntity.status,
+            func.count().label("tender_count"),
+            func.count().filter(won).label("won_count"),
+            func.coalesce(func.sum(TenderEntity.awarded_value).filter(won), 0).label(
+                "awarded_value"
+            ),
+        )
+        .where(TenderEntity.company_id.in_(list(company_ids)))
+        .group_by(
+            TenderEntity.company_id, TenderEntity.tender_year, TenderEntity.status
+        )
+    )
+
+
+class CompanyStatsService:
+    """
+    Maintenance of the company_year_stats rollup: chunked rebuilds and a
+    consistency check against the tenders it summarizes.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def company_id_chunks(
+        self, chunk_size: int = STATS_CHUNK_SIZE
+    ) -> AsyncIterator[list[int]]:
+        """Yields every company id in keyset-paginated chunks."""
+        last_id = 0
+        while True:
+            ids = (
+                await self.session.scalars(
+                    select(CompanyEntity.id)
+                    .where(CompanyEntity.id > last_id)
+                    .order_by(CompanyEntity.id)
+                    .limit(chunk_size)
+                )
+            ).all()
+            if not ids:
+                return
+            yield list(ids)
+            last_id = ids[-1]
+
+    async def rebuild(self, company_ids: list[int]) -> int:
+        """
+        Replaces the rollup rows of `company_ids` with freshly aggregated
+        ones and commits. Tender writes are blocked for the duration of
+        the chunk so no trigger delta is lost between delete and insert.
+        Returns the number of rows written.
+        """
+        if dialect_name(self.session) == "postgresql":
+            await self.session.execute(text("LOCK TABLE tenders IN SHARE MODE"))
+
+        await self.session.execute(
+            delete(CompanyYearStatsEntity).where(
+                CompanyYearStatsEntity.company_id.in_(company_ids)
+            )
+        )
+        result = await self.session.execute(
+            table_of(CompanyYearStatsEntity)
+            .insert()
+            .from_select(STATS_KEYS + STATS_VALUES, live_stats_query(company_ids))
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def mismatches(self, company_ids: list[int]) -> list[dict]:
+        """
+        Compares the rollup with the live aggregate for `company_ids` and
+        returns one entry per differing (company, year, status) key, with
+        both versions of the values. Rollup rows that dropped to zero are
+        equivalent to missing ones.
+        """
+        live = {
+            tuple(row[:3]): tuple(row[3:])
+            for row in await self.session.execute(live_stats_query(company_ids))
+        }
+        stored = {
+            tuple(row[:3]): tuple(row[3:])
+            for row in await self.session.execute(
+                select(
+                    *(
+                        getattr(CompanyYearStatsEntity, column)
+                        for column in STATS_KEYS + STATS_VALUES
+                    )
+                ).where(CompanyYearStatsEntity.company_id.in_(company_ids))
+            )
+        }
+
+        zero = (0, 0, 0)
+        differences = []
+        for key in sorted(
+            live.keys() | stored.keys(), key=lambda k: (k[0], k[1], k[2].name)
+        ):
+            expected, actual = live.get(key, zero), stored.get(key, zero)
+            if expected != actual:
+                differences.append(
+                    {
+                        **dict(zip(STATS_KEYS, key)),
+                        "expected": dict(zip(STATS_VALUES, expected)),
+                        "actual": dict(zip(STATS_VALUES, actual)),
+                    }
+                )
+        return differences
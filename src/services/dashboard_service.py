@@ -1,79 +1,285 @@
-# pylint: disable=E1102:not-callable
-
+import time
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-from sqlalchemy import case, func, select
+from sqlalchemy import Integer, case, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infra.cache import SingleFlight, TTLCache
+from src.infra.dialects import dialect_name
 from src.infra.entities import (
     CompanyEntity,
+    CompanyYearStatsEntity,
     ParticipationResult,
     TenderEntity,
     TenderStatus,
+    UserEntity,
+)
+from src.schemas.dashboard import (
+    MONTHS_PER_BUCKET,
+    DashboardBreakdown,
+    DashboardResponseSchema,
+    DashboardTimeseriesFilterSchema,
+    bucket_count,
+    bucket_start,
+)
+from src.services.analytics.dashboard_breakdowns import (
+    BREAKDOWN_FIELDS,
+    parse_breakdown_rows,
+    postgres_breakdowns,
+    sqlite_breakdowns,
+)
+from src.settings import Settings
+
+settings = Settings()
+
+# Entries are keyed by the user's data version, so a write makes them
+# unreachable at once; the TTL only bounds how long they occupy memory.
+dashboard_cache = TTLCache(
+    max_size=settings.DASHBOARD_CACHE_MAX_SIZE,
+    ttl_seconds=settings.DASHBOARD_CACHE_PAST_YEAR_TTL_SECONDS,
 )
+dashboard_flights = SingleFlight()
+
+
+def breakdown_fields(breakdowns) -> tuple[str, ...]:
+    """Requested breakdowns, deduplicated and in canonical order."""
+    return tuple(field for field in BREAKDOWN_FIELDS if field in set(breakdowns))
+
+
+def dashboard_etag(
+    user_id: int, year: int, data_version: int, breakdowns: tuple[str, ...] = ()
+) -> str:
+    suffix = "".join(f"-{field}" for field in breakdowns)
+    return f'"dashboard-{user_id}-{year}-{data_version}{suffix}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {
+        value.strip().removeprefix("W/") for value in if_none_match.split(",")
+    }
+    return "*" in candidates or etag in candidates
+
+
+def period_start_column(session: AsyncSession, bucket: str):
+    """First day of the month or quarter holding each tender's session."""
+    if dialect_name(session) != "sqlite":
+        return func.date_trunc(bucket, TenderEntity.session_date)
+
+    modifiers = ["start of month"]
+    if bucket == "quarter":
+        month = cast(func.strftime("%m", TenderEntity.session_date), Integer)
+        modifiers.append(func.printf("-%d months", (month - 1) % 3))
+    return func.date(TenderEntity.session_date, *modifiers)
+
+
+def _as_date(value) -> date:
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _add_months(day: date, months: int) -> date:
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
 
 
 class DashboardService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_metrics(self, user_id: int, year: int):
+    async def data_version(self, user_id: int) -> int:
+        """
+        Bumped by database triggers on every write to the user's
+        companies or tenders.
+        """
+        return await self.session.scalar(
+            select(UserEntity.data_version).where(UserEntity.id == user_id)
+        )
+
+    async def get_cached_metrics(
+        self,
+        user_id: int,
+        year: int,
+        data_version: int,
+        breakdowns: tuple[str, ...] = (),
+    ) -> DashboardResponseSchema:
+        """
+        Serves the metrics of (user, year) at `data_version` from the
+        cache; concurrent misses for the same key share one computation.
+        The version is read before the metrics, so a cached response is
+        never older than the version it is stored under.
+        """
+        key = (user_id, year, data_version, breakdowns)
+        cached = dashboard_cache.get(key)
+        if cached is not None:
+            return cached
+
+        async def load():
+            metrics = DashboardResponseSchema.model_validate(
+                await self.get_metrics(user_id, year, breakdowns)
+            )
+            expires_at = None
+            if year >= datetime.now().year:
+                expires_at = time.time() + settings.DASHBOARD_CACHE_TTL_SECONDS
+            dashboard_cache.set(key, metrics, group=user_id, expires_at=expires_at)
+            return metrics
+
+        return await dashboard_flights.do(key, load)
+
+    async def get_metrics(
+        self, user_id: int, year: int, breakdowns: tuple[DashboardBreakdown, ...] = ()
+    ):
+        """
+        Reads the company_year_stats rollup, so the cost is one row per
+        company and status regardless of how many tenders exist. Won
+        tenders and awarded value only count finished tenders.
+        Requested `breakdowns` add one scan of the year's tenders.
+        """
+        stmt = (
+            select(
+                CompanyEntity.id,
+                CompanyEntity.name,
+                CompanyYearStatsEntity.status,
+                CompanyYearStatsEntity.tender_count,
+                CompanyYearStatsEntity.won_count,
+                CompanyYearStatsEntity.awarded_value,
+            )
+            .outerjoin(
+                CompanyYearStatsEntity,
+                (CompanyYearStatsEntity.company_id == CompanyEntity.id)
+                & (CompanyYearStatsEntity.tender_year == year)
+                & (CompanyYearStatsEntity.tender_count > 0),
+            )
+            .where(CompanyEntity.user_id == user_id)
+            .order_by(CompanyEntity.id)
+        )
+
+        companies = {}
+        for row in await self.session.execute(stmt):
+            company = companies.setdefault(
+                row.id,
+                {
+                    "company_id": row.id,
+                    "company_name": row.name,
+                    "total_tenders": 0,
+                    "won_tenders": 0,
+                    "total_awarded_value": Decimal("0.0"),
+                    "status_counts": {},
+                },
+            )
+            if row.status is None:
+                continue
+
+            company["total_tenders"] += row.tender_count
+            company["status_counts"][row.status] = row.tender_count
+            if row.status == TenderStatus.FINISHED:
+                company["won_tenders"] += row.won_count
+                company["total_awarded_value"] += Decimal(row.awarded_value)
+
+        if breakdowns:
+            per_company = await self._breakdowns(user_id, year, breakdowns)
+            for company_id, company in companies.items():
+                company["breakdowns"] = per_company.get(
+                    company_id, {field: [] for field in breakdowns}
+                )
+
+        return {"year": year, "companies": list(companies.values())}
+
+    async def _breakdowns(self, user_id: int, year: int, fields: tuple[str, ...]):
+        query = select(TenderEntity).where(
+            TenderEntity.company_id.in_(
+                select(CompanyEntity.id).where(CompanyEntity.user_id == user_id)
+            ),
+            TenderEntity.tender_year == year,
+        )
+        dialect = dialect_name(self.session)
+        builder = sqlite_breakdowns if dialect == "sqlite" else postgres_breakdowns
+        rows = await self.session.execute(builder(query, fields))
+        return parse_breakdown_rows(rows, fields, dialect)
+
+    async def get_timeseries(
+        self, user_id: int, filters: DashboardTimeseriesFilterSchema
+    ):
+        """
+        Per-company totals, wins and awarded value for every month or
+        quarter between `filters.start` and `filters.end`, from a single
+        GROUP BY over the truncated session date. Buckets without tenders
+        are filled with zeros so each series has the same length.
+        """
+        won = (TenderEntity.participation_result == ParticipationResult.WON) & (
+            TenderEntity.status == TenderStatus.FINISHED
+        )
+        period = period_start_column(self.session, filters.bucket).label("period")
         stmt = (
             select(
-                CompanyEntity.id.label("company_id"),
-                CompanyEntity.name.label("company_name"),
+                CompanyEntity.id,
+                CompanyEntity.name,
+                period,
                 func.count(TenderEntity.id).label("total_tenders"),
-                func.sum(
-                    case(
-                        (
-                            (
-                                TenderEntity.participation_result
-                                == ParticipationResult.WON
-                            )
-                            & (TenderEntity.status == TenderStatus.FINISHED),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("won_tenders"),
-                func.coalesce(
-                    func.sum(
-                        case(
-                            (
-                                (
-                                    TenderEntity.participation_result
-                                    == ParticipationResult.WON
-                                )
-                                & (TenderEntity.status == TenderStatus.FINISHED),
-                                TenderEntity.awarded_value,
-                            ),
-                            else_=Decimal("0.0"),
-                        )
-                    ),
-                    Decimal("0.0"),
-                ).label("total_awarded_value"),
+                func.count(TenderEntity.id).filter(won).label("won_tenders"),
+                func.sum(case((won, TenderEntity.awarded_value))).label(
+                    "total_awarded_value"
+                ),
             )
             .outerjoin(
                 TenderEntity,
                 (TenderEntity.company_id == CompanyEntity.id)
-                & (TenderEntity.tender_year == year),
+                & (TenderEntity.session_date >= filters.start)
+                & (TenderEntity.session_date < filters.end + timedelta(days=1)),
             )
             .where(CompanyEntity.user_id == user_id)
-            .group_by(CompanyEntity.id, CompanyEntity.name)
+            .group_by(CompanyEntity.id, CompanyEntity.name, period)
+            .order_by(CompanyEntity.id)
         )
 
-        results = await self.session.execute(stmt)
-        companies_data = []
+        first = bucket_start(filters.start, filters.bucket)
+        periods = [
+            _add_months(first, index * MONTHS_PER_BUCKET[filters.bucket])
+            for index in range(
+                bucket_count(
+                    first, bucket_start(filters.end, filters.bucket), filters.bucket
+                )
+            )
+        ]
 
-        for row in results:
-            companies_data.append(
+        companies = {}
+        for row in await self.session.execute(stmt):
+            company = companies.setdefault(
+                row.id,
                 {
-                    "company_id": row.company_id,
-                    "company_name": row.company_name,
-                    "total_tenders": row.total_tenders or 0,
-                    "won_tenders": row.won_tenders or 0,
-                    "total_awarded_value": Decimal(row.total_awarded_value),
-                }
+                    "company_id": row.id,
+                    "company_name": row.name,
+                    "points": {
+                        period: {
+                            "period_start": period,
+                            "total_tenders": 0,
+                            "won_tenders": 0,
+                            "total_awarded_value": Decimal("0.0"),
+                        }
+                        for period in periods
+                    },
+                },
+            )
+            if row.period is None:
+                continue
+
+            company["points"][_as_date(row.period)].update(
+                total_tenders=row.total_tenders,
+                won_tenders=row.won_tenders,
+                total_awarded_value=Decimal(row.total_awarded_value or 0),
             )
 
-        return {"year": year, "companies": companies_data}
+        return {
+            "start": filters.start,
+            "end": filters.end,
+            "bucket": filters.bucket,
+            "companies": [
+                company | {"points": list(company["points"].values())}
+                for company in companies.values()
+            ],
+        }
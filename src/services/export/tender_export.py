@@ -0,0 +1,129 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import Enum as EnumType
+from sqlalchemy import Select, String, cast, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.entities import TenderEntity
+
+EXPORT_FIELDS = (
+    "id",
+    "tender_number",
+    "tender_year",
+    "object_description",
+    "public_body_name",
+    "modality",
+    "format",
+    "status",
+    "participation_result",
+    "awarded_value",
+    "session_date",
+    "created_at",
+)
+
+EXPORT_BATCH_SIZE = 2000
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _export_columns():
+    return [getattr(TenderEntity, field) for field in EXPORT_FIELDS]
+
+
+def export_value(value):
+    """
+    Text form shared by every export path, including COPY, so the output
+    does not depend on which path produced it.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="microseconds")
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _csv_chunk(rows, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([export_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def _ndjson_chunk(rows) -> bytes:
+    return "".join(
+        json.dumps(
+            dict(zip(EXPORT_FIELDS, (export_value(value) for value in row))),
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    ).encode()
+
+
+async def stream_export(
+    session: AsyncSession, query: Select, file_format: str
+) -> AsyncIterator[bytes]:
+    """
+    Streams the rows of `query` through a server-side cursor,
+    EXPORT_BATCH_SIZE rows at a time, yielding one encoded chunk per
+    batch. Only plain column tuples are fetched, so nothing accumulates
+    in the session's identity map.
+    """
+    result = await session.stream(
+        query.with_only_columns(*_export_columns()).execution_options(
+            yield_per=EXPORT_BATCH_SIZE
+        )
+    )
+
+    if file_format == "csv":
+        yield _csv_chunk([], header=True)
+
+    async for rows in result.partitions():
+        if file_format == "csv":
+            yield _csv_chunk(rows)
+        else:
+            yield _ndjson_chunk(rows)
+
+
+def _copy_column(column):
+    # Enum columns store member names; every value is its name lowercased.
+    if isinstance(column.type, EnumType):
+        return func.lower(cast(column, String)).label(column.key)
+    if column.key in ("session_date", "created_at"):
+        return func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS.US').label(column.key)
+    return column
+
+
+def supports_copy(session: AsyncSession) -> bool:
+    return session.bind.dialect.driver == "psycopg"
+
+
+async def copy_csv_export(session: AsyncSession, query: Select) -> AsyncIterator[bytes]:
+    """
+    PostgreSQL fast path: COPY (query) TO STDOUT lets the server format
+    the CSV, and chunks are relayed as they arrive without building a
+    Python object per row.
+    """
+    query = query.with_only_columns(*(_copy_column(c) for c in _export_columns()))
+    connection = await session.connection()
+    sql = query.compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+
+    raw_connection = await connection.get_raw_connection()
+    async with raw_connection.driver_connection.cursor() as cursor:
+        async with cursor.copy(
+            f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER true)"
+        ) as copy:
+            async for chunk in copy:
+                yield bytes(chunk)
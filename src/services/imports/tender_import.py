@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+from collections import Counter
+from collections.abc import Iterator
+from itertools import islice
+from typing import BinaryIO
+
+from pydantic import ValidationError
+
+from src.infra.entities import TENDER_IDENTITY_FIELDS
+from src.schemas.tender import TenderCreateSchema
+
+IMPORT_BATCH_SIZE = 1000
+
+# Fields that make a tender unique within one company.
+ROW_IDENTITY_FIELDS = tuple(f for f in TENDER_IDENTITY_FIELDS if f != "company_id")
+
+
+def _text_stream(file: BinaryIO) -> io.TextIOWrapper:
+    # utf-8-sig drops the BOM that spreadsheet exports prepend.
+    return io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+
+
+def iter_csv_records(file: BinaryIO) -> Iterator[tuple[int, dict | str]]:
+    """
+    Yields (row number, record) one CSV record at a time. Both comma and
+    semicolon (the default of pt-BR spreadsheets) delimiters are accepted;
+    empty cells are dropped so that schema defaults apply.
+    """
+    stream = _text_stream(file)
+    header = stream.readline()
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    fields = next(csv.reader([header], delimiter=delimiter), [])
+    fields = [field.strip() for field in fields]
+
+    for number, values in enumerate(csv.reader(stream, delimiter=delimiter), 1):
+        if not any(values):
+            continue
+        if len(values) != len(fields):
+            yield number, f"Expected {len(fields)} columns, got {len(values)}."
+            continue
+        yield number, {
+            field: value for field, value in zip(fields, values) if value != ""
+        }
+
+
+def iter_ndjson_records(file: BinaryIO) -> Iterator[tuple[int, dict | str]]:
+    for number, line in enumerate(_text_stream(file), 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, f"Invalid JSON: {e.msg}."
+            continue
+        if not isinstance(record, dict):
+            yield number, "Expected a JSON object."
+            continue
+        yield number, record
+
+
+RECORD_READERS = {"csv": iter_csv_records, "ndjson": iter_ndjson_records}
+
+
+def batched(records: Iterator, size: int = IMPORT_BATCH_SIZE) -> Iterator[list]:
+    while batch := list(islice(records, size)):
+        yield batch
+
+
+def validation_messages(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+def parse_batch(batch: list, results: dict) -> list[tuple[int, TenderCreateSchema]]:
+    """
+    Validates a batch of (row number, record) pairs against the create
+    schema. Unreadable and invalid rows get their report entry in
+    `results`; the others are returned as (row number, schema).
+    """
+    parsed = []
+    for number, raw in batch:
+        if isinstance(raw, str):
+            results[number] = import_row(number, "invalid", errors=[raw])
+            continue
+
+        try:
+            parsed.append((number, TenderCreateSchema.model_validate(raw)))
+        except ValidationError as e:
+            results[number] = import_row(
+                number, "invalid", errors=validation_messages(e)
+            )
+    return parsed
+
+
+def row_identity(data: dict) -> tuple:
+    return tuple(data[field] for field in ROW_IDENTITY_FIELDS)
+
+
+def import_row(number: int, status: str, tender_id: int | None = None, errors=()):
+    return {"row": number, "status": status, "id": tender_id, "errors": list(errors)}
+
+
+def import_report(rows: list[dict]) -> dict:
+    statuses = Counter(row["status"] for row in rows)
+    return {
+        "created": statuses["created"],
+        "duplicates": statuses["duplicate"],
+        "invalid": statuses["invalid"],
+        "rows": rows,
+    }
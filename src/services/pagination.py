@@ -0,0 +1,138 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import Select, select, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+
+@dataclass
+class Page:
+    items: list[Any]
+    next_cursor: str | None = None
+    totals: Any = None
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Invalid cursor.")
+
+
+def encode_cursor(sort: str, order: str, value, row_id: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+
+    payload = json.dumps([sort, order, value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> tuple[Any, int]:
+    """
+    Returns the (sort value, id) of the last row of the previous page.
+    A cursor is only valid for the sort and order that produced it.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, cursor_order, value, row_id = json.loads(
+            base64.urlsafe_b64decode(padded)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise _invalid_cursor() from e
+
+    if (cursor_sort, cursor_order) != (sort, order) or not isinstance(row_id, int):
+        raise _invalid_cursor()
+
+    if sort == "id":
+        return row_id, row_id
+
+    try:
+        return datetime.fromisoformat(value), row_id
+    except (TypeError, ValueError) as e:
+        raise _invalid_cursor() from e
+
+
+def sort_keys(entity, sort: str) -> tuple:
+    if sort == "id":
+        return (entity.id,)
+    return getattr(entity, sort), entity.id
+
+
+def order_by_sort(query: Select, entity, sort: str, order: str) -> Select:
+    """Orders by the sort key with id as tie-breaker, so order is total."""
+    keys = sort_keys(entity, sort)
+    return query.order_by(*(key.desc() if order == "desc" else key for key in keys))
+
+
+async def _read_page(
+    session: AsyncSession, page: Select, entity, filters, totals: Select | None
+) -> tuple[list, dict | None]:
+    """
+    Reads the page and the single `totals` row, as a dict, in one statement:
+    totals LEFT JOIN page ON true, so the totals come back even when the
+    page is empty.
+    """
+    if totals is None:
+        return (await session.scalars(page)).all(), None
+
+    page = page.subquery()
+    paged = aliased(entity, page)
+    totals = totals.subquery()
+    rows = (
+        await session.execute(
+            order_by_sort(
+                select(totals, paged).select_from(totals).outerjoin(page, true()),
+                paged,
+                filters.sort,
+                filters.order,
+            )
+        )
+    ).all()
+    return [row[-1] for row in rows if row[-1] is not None], dict(
+        zip(totals.c.keys(), rows[0])
+    )
+
+
+async def paginate(
+    session: AsyncSession, query: Select, entity, filters, totals: Select | None = None
+) -> Page:
+    """
+    Orders `query` by (filters.sort, id) so pages are deterministic, then
+    reads one page either after `filters.cursor` (keyset) or at
+    `filters.offset`. One extra row is fetched to tell whether a next
+    page exists. `totals`, a query returning one row computed over every
+    result, is read in the same round trip and returned as Page.totals.
+    """
+    keys = sort_keys(entity, filters.sort)
+    descending = filters.order == "desc"
+    query = order_by_sort(query, entity, filters.sort, filters.order)
+
+    if filters.cursor is not None:
+        value, row_id = decode_cursor(filters.cursor, filters.sort, filters.order)
+        position, boundary = entity.id, row_id
+        if filters.sort != "id":
+            position, boundary = tuple_(*keys), tuple_(value, row_id)
+        query = query.where(position < boundary if descending else position > boundary)
+    else:
+        query = query.offset(filters.offset)
+
+    rows, totals_row = await _read_page(
+        session, query.limit(filters.limit + 1), entity, filters, totals
+    )
+
+    if len(rows) <= filters.limit:
+        return Page(items=list(rows), totals=totals_row)
+
+    items = list(rows[: filters.limit])
+    last = items[-1]
+    return Page(
+        items=items,
+        next_cursor=encode_cursor(
+            filters.sort, filters.order, getattr(last, filters.sort), last.id
+        ),
+        totals=totals_row,
+    )
@@ -0,0 +1,132 @@
+"""
+Public bodies are interned in `public_bodies`, one row per normalized
+name, and tenders reference them by id: "Prefeitura de São Paulo" and
+"PREFEITURA DE SAO PAULO" are the same body.
+
+Names are resolved to ids through `public_body_cache`. Ids found or
+created inside a transaction are only cached once it commits, so a
+rolled-back insert can never leave a dangling id behind. Core inserts
+(TenderService.create and imports) resolve explicitly; ORM writes are
+covered by the mapper events at the bottom of this module.
+"""
+
+import unicodedata
+from collections.abc import Iterable
+
+from sqlalchemy import Connection, event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from src.infra.cache import TTLCache
+from src.infra.dialects import insert
+from src.infra.entities import PublicBodyEntity, TenderEntity
+from src.settings import Settings
+
+settings = Settings()
+
+# Bodies are never renamed or deleted, so cached ids do not go stale;
+# the TTL only bounds how long rarely used names stay in memory.
+public_body_cache = TTLCache(
+    max_size=settings.PUBLIC_BODY_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PUBLIC_BODY_CACHE_TTL_SECONDS,
+)
+
+# Session.info key holding {normalized name: id} for the open transaction.
+UNCOMMITTED_IDS = "public_body_ids"
+
+
+def normalize_public_body_name(name: str) -> str:
+    """Casefolded, without accents and with whitespace collapsed."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def resolve_public_body_ids(
+    session: Session, names: Iterable[str], connection: Connection | None = None
+) -> dict[str, int]:
+    """
+    Returns {name: public body id}, creating the missing bodies with one
+    INSERT ... ON CONFLICT DO NOTHING and one SELECT. Only goes to the
+    database for names not cached. `connection` is required while the
+    session is flushing.
+    """
+    keys = {name: normalize_public_body_name(name) for name in names}
+    uncommitted = session.info.setdefault(UNCOMMITTED_IDS, {})
+
+    ids = {}
+    for key in set(keys.values()):
+        body_id = uncommitted.get(key) or public_body_cache.get(key)
+        if body_id is not None:
+            ids[key] = body_id
+
+    missing = {}
+    for name, key in keys.items():
+        if key not in ids:
+            missing.setdefault(key, name)
+
+    if missing:
+        connection = connection or session.connection()
+        connection.execute(
+            insert(connection, PublicBodyEntity)
+            .values(
+                [
+                    {"normalized_name": key, "name": name}
+                    for key, name in missing.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["normalized_name"])
+        )
+        found = dict(
+            connection.execute(
+                select(PublicBodyEntity.normalized_name, PublicBodyEntity.id).where(
+                    PublicBodyEntity.normalized_name.in_(missing)
+                )
+            ).all()
+        )
+        uncommitted.update(found)
+        ids.update(found)
+
+    return {name: ids[key] for name, key in keys.items()}
+
+
+class PublicBodyService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def resolve_ids(self, names: Iterable[str]) -> dict[str, int]:
+        names = list(dict.fromkeys(names))
+        return await self.session.run_sync(resolve_public_body_ids, names)
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed_ids(session: Session) -> None:
+    for key, body_id in session.info.pop(UNCOMMITTED_IDS, {}).items():
+        public_body_cache.set(key, body_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_uncommitted_ids(session: Session) -> None:
+    session.info.pop(UNCOMMITTED_IDS, None)
+
+
+def _resolve_tender_body(connection: Connection, tender: TenderEntity) -> None:
+    name = tender.public_body_name
+    ids = resolve_public_body_ids(object_session(tender), [name], connection)
+    tender.public_body_id = ids[name]
+
+
+@event.listens_for(TenderEntity, "before_insert")
+def _resolve_inserted_tender_body(_mapper, connection, tender) -> None:
+    if tender.public_body_id is None:
+        _resolve_tender_body(connection, tender)
+
+
+@event.listens_for(TenderEntity, "before_update")
+def _resolve_updated_tender_body(_mapper, connection, tender) -> None:
+    attrs = inspect(tender).attrs
+    if (
+        attrs.public_body_name.history.has_changes()
+        and not attrs.public_body_id.history.has_changes()
+    ):
+        _resolve_tender_body(connection, tender)
@@ -0,0 +1,62 @@
+import heapq
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from src.services.public_body_service import normalize_public_body_name
+
+# Sorts after every character, so prefix + MAX_CHAR bounds all keys
+# starting with prefix.
+MAX_CHAR = "\U0010ffff"
+
+
+class PublicBodyIndex:
+    """
+    Prefix index over one user's public bodies: a sorted array of the
+    normalized names and of each of their word-start suffixes, so "sao
+    pa" finds "Prefeitura de São Paulo". A lookup is two bisections plus
+    picking the best ranked matches.
+    """
+
+    def __init__(self, bodies: Iterable[tuple[int, str, str, int]]):
+        """`bodies` yields (id, normalized name, name, tender count)."""
+        # Bodies are stored in suggestion order (most used first), so a
+        # body's position is also its rank and matches rank as plain ints.
+        ranked = sorted(bodies, key=lambda body: (-body[3], body[2]))
+        self.ids = [body_id for body_id, _, _, _ in ranked]
+        self.names = [name for _, _, name, _ in ranked]
+        self.tender_counts = [tenders for _, _, _, tenders in ranked]
+
+        entries = []
+        for position, (_, normalized_name, _, _) in enumerate(ranked):
+            words = normalized_name.split(" ")
+            entries.extend(
+                (" ".join(words[start:]), position) for start in range(len(words))
+            )
+
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.positions = [position for _, position in entries]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def suggest(self, query: str, limit: int) -> list[dict]:
+        """
+        Bodies with a word starting with `query` (normalized like the
+        names), most used first.
+        """
+        prefix = normalize_public_body_name(query)
+        if not prefix:
+            return []
+
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + MAX_CHAR, lo)
+        best = heapq.nsmallest(limit, set(self.positions[lo:hi]))
+        return [
+            {
+                "id": self.ids[position],
+                "name": self.names[position],
+                "tender_count": self.tender_counts[position],
+            }
+            for position in best
+        ]
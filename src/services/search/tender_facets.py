@@ -0,0 +1,153 @@
+# pylint: disable=E1102:not-callable
+
+import json
+
+from sqlalchemy import (
+    JSON,
+    String,
+    func,
+    literal,
+    null,
+    select,
+    tuple_,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.entities import TenderEntity, table_of
+
+FACET_FIELDS = ("status", "modality", "format", "participation_result")
+
+# grouping() over all facet columns sets one bit per column left out of
+# the grouping set, the first column being the most significant bit.
+ALL_FACETS_MASK = (1 << len(FACET_FIELDS)) - 1
+TOTAL_FACET = -1
+
+
+def _facet_columns():
+    return [getattr(TenderEntity, field) for field in FACET_FIELDS]
+
+
+def postgres_facets(query):
+    """
+    Total plus per-value counts for every facet in a single
+    GROUP BY GROUPING SETS ((status), (modality), ..., ()) scan.
+    """
+    columns = _facet_columns()
+    facet = func.grouping(*columns).label("facet")
+
+    return query.with_only_columns(
+        facet,
+        *(type_coerce(column, String).label(column.key) for column in columns),
+        func.count().label("total"),
+    ).group_by(func.grouping_sets(*columns, tuple_()))
+
+
+def sqlite_facets(query):
+    """
+    SQLite has no GROUPING SETS; the same rows come from one UNION ALL
+    statement instead.
+    """
+    columns = _facet_columns()
+    parts = [
+        query.with_only_columns(
+            literal(TOTAL_FACET).label("facet"),
+            *(null().label(column.key) for column in columns),
+            func.count().label("total"),
+        )
+    ]
+
+    for index, column in enumerate(columns):
+        parts.append(
+            query.with_only_columns(
+                literal(index).label("facet"),
+                *(
+                    (
+                        type_coerce(other, String)
+                        if other is column
+                        else type_coerce(null(), String)
+                    ).label(other.key)
+                    for other in columns
+                ),
+                func.count().label("total"),
+            ).group_by(column)
+        )
+
+    return union_all(*parts)
+
+
+def facet_totals(query, dialect: str):
+    """
+    The facet rows of `query` folded into one row with a single JSON
+    column, `facets`, so they can be read along with a page of results.
+    """
+    if dialect == "sqlite":
+        rows = sqlite_facets(query).subquery()
+        build_array, build_object = func.json_group_array, func.json_object
+    else:
+        rows = postgres_facets(query).subquery()
+        build_array, build_object = func.json_agg, func.json_build_object
+
+    pairs = []
+    for column in rows.c:
+        pairs.extend((literal(column.key), column))
+    return select(type_coerce(build_array(build_object(*pairs)), JSON).label("facets"))
+
+
+def _facet_index(facet: int, dialect: str) -> int:
+    if dialect == "sqlite":
+        return facet
+
+    for index in range(len(FACET_FIELDS)):
+        if facet == ALL_FACETS_MASK ^ (1 << (len(FACET_FIELDS) - 1 - index)):
+            return index
+    return TOTAL_FACET
+
+
+def _public_value(field: str, stored_name: str | None) -> str | None:
+    if stored_name is None:
+        return None
+    enum_class = table_of(TenderEntity).c[field].type.enum_class
+    return enum_class[stored_name].value
+
+
+def parse_facet_rows(rows: list[dict], dialect: str) -> tuple[int, dict]:
+    """
+    Folds the facet rows read by facet_totals into (total, {field:
+    [{"value", "count"}, ...]}), with buckets ordered by descending count.
+    """
+    total = 0
+    facets = {field: [] for field in FACET_FIELDS}
+
+    for row in rows:
+        index = _facet_index(row["facet"], dialect)
+        if index == TOTAL_FACET:
+            total = row["total"]
+            continue
+
+        field = FACET_FIELDS[index]
+        facets[field].append(
+            {"value": _public_value(field, row[field]), "count": row["total"]}
+        )
+
+    for buckets in facets.values():
+        buckets.sort(key=lambda bucket: (-bucket["count"], bucket["value"] or ""))
+
+    return total, facets
+
+
+async def estimate_row_count(session: AsyncSession, query) -> int:
+    """
+    Planner row estimate for `query`, read from EXPLAIN without executing
+    it. Only as good as the table statistics, but O(1) in the row count.
+    """
+    connection = await session.connection()
+    compiled = query.with_only_columns(TenderEntity.id).compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,73 @@
+import re
+
+from sqlalchemy import func, literal_column, or_, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.infra.entities import TenderEntity
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxFragments=2, MaxWords=20, MinWords=5"
+)
+
+
+def postgres_search(query, text: str):
+    """
+    Adds Portuguese full-text matching, ts_rank_cd relevance and
+    ts_headline highlights. Public bodies also match on substring so that
+    partial agency names still hit (served by the pg_trgm index).
+    """
+    search_vector = literal_column("tenders.search_vector", type_=TSVECTOR)
+    tsquery = func.websearch_to_tsquery("portuguese", text)
+
+    return query.add_columns(
+        func.ts_rank_cd(search_vector, tsquery).label("rank"),
+        func.ts_headline(
+            "portuguese", TenderEntity.object_description, tsquery, HEADLINE_OPTIONS
+        ).label("object_description_highlight"),
+        func.ts_headline(
+            "portuguese", TenderEntity.public_body_name, tsquery, HEADLINE_OPTIONS
+        ).label("public_body_name_highlight"),
+    ).where(
+        or_(
+            search_vector.bool_op("@@")(tsquery),
+            TenderEntity.public_body_name.ilike(f"%{text}%"),
+        )
+    )
+
+
+def fts5_match_expression(text: str) -> str | None:
+    """
+    Turns free text into an FTS5 query that ANDs every word as a quoted
+    prefix, so user input can never be parsed as FTS5 syntax.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def sqlite_search(query, text: str):
+    match_expression = fts5_match_expression(text)
+    if match_expression is None:
+        return None
+
+    fts = table("tenders_fts", literal_column("rowid"))
+    fts_ref = literal_column("tenders_fts")
+
+    return (
+        query.join(fts, literal_column("tenders_fts.rowid") == TenderEntity.id)
+        .add_columns(
+            (-func.bm25(fts_ref)).label("rank"),
+            func.highlight(fts_ref, 0, HIGHLIGHT_START, HIGHLIGHT_STOP).label(
+                "object_description_highlight"
+            ),
+            func.highlight(fts_ref, 1, HIGHLIGHT_START, HIGHLIGHT_STOP).label(
+                "public_body_name_highlight"
+            ),
+        )
+        .where(fts_ref.bool_op("MATCH")(match_expression))
+    )
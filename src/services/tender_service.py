@@ -1,16 +1,54 @@
-# pylint: disable=R0917:too-many-positional-arguments, W0622:redefined-builtin
-
+from collections.abc import AsyncIterator
+from dataclasses import replace
 from datetime import datetime
 from http import HTTPStatus
+from typing import BinaryIO
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import delete, desc, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infra.entities import TenderEntity
-from src.schemas.tender import TenderCreateSchema, TenderUpdateSchema
+from src.infra.dialects import dialect_name, insert
+from src.infra.entities import (
+    TENDER_IDENTITY_FIELDS,
+    TenderEntity,
+    TenderStatus,
+    table_of,
+)
+from src.schemas.tender import (
+    TenderBulkActionSchema,
+    TenderCreateSchema,
+    TenderUpdateSchema,
+)
+from src.services.export.tender_export import (
+    copy_csv_export,
+    stream_export,
+    supports_copy,
+)
+from src.services.imports.tender_import import (
+    RECORD_READERS,
+    ROW_IDENTITY_FIELDS,
+    batched,
+    import_report,
+    import_row,
+    parse_batch,
+    row_identity,
+)
+from src.services.pagination import Page, order_by_sort, paginate
+from src.services.public_body_service import PublicBodyService
+from src.services.search.tender_facets import (
+    estimate_row_count,
+    facet_totals,
+    parse_facet_rows,
+)
+from src.services.search.tender_search import postgres_search, sqlite_search
 from src.services.validators.tender_validator import TenderValidator
+from src.settings import Settings
+
+settings = Settings()
+
+MAX_REPORTED_VIOLATIONS = 50
 
 
 class TenderService:
@@ -41,51 +79,29 @@ class TenderService:
 
         return tender
 
-    async def _verify_uniqueness(
-        self,
-        company_id: int,
-        tender_number: int,
-        tender_year: int,
-        public_body_name: str,
-        modality,
-        format,
-        exclude_tender_id: int | None = None,
-    ) -> None:
-        """
-        Ensures that no duplicate tender exists for the same company with the same core data.
-        """
-        query = select(TenderEntity).where(
-            TenderEntity.company_id == company_id,
-            TenderEntity.tender_number == tender_number,
-            TenderEntity.tender_year == tender_year,
-            TenderEntity.public_body_name == public_body_name,
-            TenderEntity.modality == modality,
-            TenderEntity.format == format,
-        )
-
-        if exclude_tender_id is not None:
-            query = query.where(TenderEntity.id != exclude_tender_id)
-
-        existing_tender = await self.session.scalar(query)
-        if existing_tender:
-            raise HTTPException(
-                status_code=HTTPStatus.CONFLICT,
-                detail="A tender with these details is already registered for this company.",
-            )
+    @staticmethod
+    def _conflict_exception():
+        return HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail="A tender with these details is already registered for this company.",
+        )
 
-    async def create(self, company_id: int, data: TenderCreateSchema):
+    @staticmethod
+    def _is_identity_conflict(error: IntegrityError) -> bool:
         """
-        Creates a new tender after verifying uniqueness and business rules.
+        Tells a violation of uq_tenders_identity apart from other integrity
+        errors such as a missing company.
         """
-        await self._verify_uniqueness(
-            company_id=company_id,
-            tender_number=data.tender_number,
-            tender_year=data.tender_year,
-            public_body_name=data.public_body_name,
-            modality=data.modality,
-            format=data.format,
+        return getattr(error.orig, "sqlstate", None) == "23505" or (
+            "UNIQUE constraint failed" in str(error.orig)
         )
 
+    async def create(self, company_id: int, data: TenderCreateSchema):
+        """
+        Creates a new tender after checking business rules. Uniqueness is
+        enforced by uq_tenders_identity, so the insert is a single
+        INSERT ... ON CONFLICT DO NOTHING RETURNING statement.
+        """
         TenderValidator.validate_rules(
             participation_result=data.participation_result,
             awarded_value=data.awarded_value,
@@ -96,14 +112,20 @@ class TenderService:
         if not tender_data.get("session_date"):
             tender_data["session_date"] = datetime.now()
 
-        tender = TenderEntity(
-            **tender_data,
-            company_id=company_id,
+        body_ids = await PublicBodyService(self.session).resolve_ids(
+            [data.public_body_name]
         )
+        tender_data["public_body_id"] = body_ids[data.public_body_name]
 
-        self.session.add(tender)
+        stmt = (
+            insert(self.session, TenderEntity)
+            .values(**tender_data, company_id=company_id)
+            .on_conflict_do_nothing(index_elements=list(TENDER_IDENTITY_FIELDS))
+            .returning(TenderEntity)
+        )
 
         try:
+            tender = await self.session.scalar(stmt)
             await self.session.commit()
         except IntegrityError as e:
             raise HTTPException(
@@ -111,15 +133,13 @@ class TenderService:
                 detail="Database integrity error.",
             ) from e
 
-        await self.session.refresh(tender)
-        return tender
+        if tender is None:
+            raise self._conflict_exception()
 
-    async def list(self, company_id: int, filters):
-        """
-        Lists tenders for a specific company with optional filters.
-        """
-        query = select(TenderEntity).where(TenderEntity.company_id == company_id)
+        return tender
 
+    @staticmethod
+    def _apply_filters(query, filters):
         if filters.tender_number is not None:
             query = query.where(TenderEntity.tender_number == filters.tender_number)
 
@@ -153,11 +173,234 @@ class TenderService:
         if filters.session_date:
             query = query.where(TenderEntity.session_date == filters.session_date)
 
-        result = await self.session.scalars(
-            query.offset(filters.offset).limit(filters.limit)
+        return query
+
+    async def list(self, company_id: int, filters) -> Page:
+        """
+        Lists one page of a company's tenders with optional filters,
+        ordered by the requested sort key and id. With filters.counts,
+        Page.totals holds the total and per-value facet counts over every
+        tender matching the filters (not just the page), read by the
+        same statement as the page. In approximate mode, result sets the
+        planner estimates above TENDER_EXACT_COUNT_LIMIT get that
+        estimate as total and no facets.
+        """
+        query = self._apply_filters(
+            select(TenderEntity).where(TenderEntity.company_id == company_id),
+            filters,
+        )
+        dialect = dialect_name(self.session)
+
+        if filters.counts == "none":
+            return await paginate(self.session, query, TenderEntity, filters)
+
+        if filters.counts == "approximate" and dialect == "postgresql":
+            estimate = await estimate_row_count(self.session, query)
+            if estimate > settings.TENDER_EXACT_COUNT_LIMIT:
+                page = await paginate(self.session, query, TenderEntity, filters)
+                return replace(
+                    page,
+                    totals={
+                        "total": estimate,
+                        "total_is_estimate": True,
+                        "facets": None,
+                    },
+                )
+
+        page = await paginate(
+            self.session,
+            query,
+            TenderEntity,
+            filters,
+            totals=facet_totals(query, dialect),
+        )
+        total, facets = parse_facet_rows(page.totals["facets"], dialect)
+        return replace(
+            page, totals={"total": total, "total_is_estimate": False, "facets": facets}
+        )
+
+    def export_query(self, company_id: int, filters):
+        return order_by_sort(
+            self._apply_filters(
+                select(TenderEntity).where(TenderEntity.company_id == company_id),
+                filters,
+            ),
+            TenderEntity,
+            filters.sort,
+            filters.order,
+        )
+
+    def export(self, company_id: int, filters) -> AsyncIterator[bytes]:
+        """
+        Streams every tender matching the filters as CSV or NDJSON chunks.
+        CSV goes through COPY TO STDOUT on PostgreSQL unless
+        TENDER_EXPORT_COPY is off; otherwise rows come from a server-side
+        cursor. Memory stays flat either way.
+        """
+        query = self.export_query(company_id, filters)
+
+        if (
+            filters.file_format == "csv"
+            and settings.TENDER_EXPORT_COPY
+            and supports_copy(self.session)
+        ):
+            return copy_csv_export(self.session, query)
+
+        return stream_export(self.session, query, filters.file_format)
+
+    async def search(self, company_id: int, filters):
+        """
+        Ranked full-text search over object descriptions and public bodies,
+        narrowed by the regular list filters. Uses the stemmed tsvector on
+        PostgreSQL and FTS5 on SQLite; both are index-backed. Results are
+        ordered by rank, so only offset pagination applies.
+        """
+        if filters.cursor is not None:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail="Search results are paginated by offset only.",
+            )
+
+        query = self._apply_filters(
+            select(TenderEntity).where(TenderEntity.company_id == company_id),
+            filters,
         )
 
-        return result.all()
+        if dialect_name(self.session) == "sqlite":
+            query = sqlite_search(query, filters.q)
+        else:
+            query = postgres_search(query, filters.q)
+
+        if query is None:
+            return []
+
+        rows = await self.session.execute(
+            query.order_by(desc("rank"), TenderEntity.id)
+            .offset(filters.offset)
+            .limit(filters.limit)
+        )
+
+        return [
+            {
+                "tender": row.TenderEntity,
+                "rank": row.rank,
+                "highlights": {
+                    "object_description": row.object_description_highlight,
+                    "public_body_name": row.public_body_name_highlight,
+                },
+            }
+            for row in rows
+        ]
+
+    async def import_file(
+        self, company_id: int, file: BinaryIO, file_format: str
+    ) -> dict:
+        """
+        Imports a CSV or NDJSON upload, read one record at a time and
+        written IMPORT_BATCH_SIZE rows per INSERT ... ON CONFLICT DO
+        NOTHING RETURNING statement. Each batch is committed on its own,
+        and the report gives the outcome of every row.
+        """
+        rows, first_seen = [], {}
+
+        for batch in batched(RECORD_READERS[file_format](file)):
+            results = {}
+            parsed = parse_batch(batch, results)
+            pending = await self._pending_rows(parsed, results, first_seen)
+
+            if pending:
+                created_ids = await self._insert_batch(company_id, pending)
+                for number, _, key in pending:
+                    if key in created_ids:
+                        results[number] = import_row(
+                            number, "created", created_ids[key]
+                        )
+                    else:
+                        results[number] = import_row(
+                            number,
+                            "duplicate",
+                            errors=[self._conflict_exception().detail],
+                        )
+
+            rows.extend(results[number] for number in sorted(results))
+
+        return import_report(rows)
+
+    async def _pending_rows(self, parsed, results: dict, first_seen: dict):
+        """
+        Applies the business rules to a parsed batch and drops rows
+        repeating an earlier row of the file, reporting both in `results`.
+        Returns the (row number, values, identity) triples to insert.
+        """
+        violations = {
+            violation.index: violation.message
+            for violation in TenderValidator.validate_batch(
+                [data.participation_result for _, data in parsed],
+                [data.awarded_value for _, data in parsed],
+                [data.status for _, data in parsed],
+            )
+        }
+
+        body_ids = await PublicBodyService(self.session).resolve_ids(
+            data.public_body_name
+            for index, (_, data) in enumerate(parsed)
+            if index not in violations
+        )
+
+        pending = []
+        for index, (number, data) in enumerate(parsed):
+            if index in violations:
+                results[number] = import_row(
+                    number, "invalid", errors=[violations[index]]
+                )
+                continue
+
+            values = data.model_dump()
+            values["session_date"] = values["session_date"] or datetime.now()
+            values["status"] = values["status"] or TenderStatus.MONITORING
+            values["public_body_id"] = body_ids[values["public_body_name"]]
+
+            key = row_identity(values)
+            if key in first_seen:
+                results[number] = import_row(
+                    number,
+                    "duplicate",
+                    errors=[f"Same tender as row {first_seen[key]}."],
+                )
+                continue
+
+            first_seen[key] = number
+            pending.append((number, values, key))
+
+        return pending
+
+    async def _insert_batch(self, company_id: int, pending: list) -> dict:
+        """
+        Inserts a batch and returns {identity: id} for the rows created.
+        The statement goes through the Core table with a parameter list,
+        which SQLAlchemy sends as multi-row VALUES ("insertmanyvalues")
+        from one cached compilation.
+        """
+        table = table_of(TenderEntity)
+        stmt = (
+            insert(self.session, table)
+            .on_conflict_do_nothing(index_elements=list(TENDER_IDENTITY_FIELDS))
+            .returning(table.c.id, *(table.c[f] for f in ROW_IDENTITY_FIELDS))
+        )
+        parameters = [values | {"company_id": company_id} for _, values, _ in pending]
+
+        try:
+            rows = await self.session.execute(stmt, parameters)
+            created_ids = {tuple(row[1:]): row.id for row in rows}
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=HTTPStatus.CONFLICT,
+                detail="Database integrity error.",
+            ) from e
+
+        return created_ids
 
     async def update(self, tender_id: int, company_id: int, data: TenderUpdateSchema):
         """
@@ -176,26 +419,6 @@ class TenderService:
             participation_result=new_result, awarded_value=new_value, status=new_status
         )
 
-        id_fields = {
-            "tender_number",
-            "tender_year",
-            "public_body_name",
-            "modality",
-            "format",
-        }
-        if any(field in update_data for field in id_fields):
-            await self._verify_uniqueness(
-                company_id=company_id,
-                tender_number=update_data.get("tender_number", tender.tender_number),
-                tender_year=update_data.get("tender_year", tender.tender_year),
-                public_body_name=update_data.get(
-                    "public_body_name", tender.public_body_name
-                ),
-                modality=update_data.get("modality", tender.modality),
-                format=update_data.get("format", tender.format),
-                exclude_tender_id=tender.id,
-            )
-
         for key, value in update_data.items():
             setattr(tender, key, value)
 
@@ -205,6 +428,9 @@ class TenderService:
             await self.session.commit()
             await self.session.refresh(tender)
         except IntegrityError as e:
+            await self.session.rollback()
+            if self._is_identity_conflict(e):
+                raise self._conflict_exception() from e
             raise HTTPException(
                 status_code=HTTPStatus.CONFLICT,
                 detail="Database integrity error.",
@@ -212,6 +438,67 @@ class TenderService:
 
         return tender
 
+    async def bulk(self, company_id: int, data: TenderBulkActionSchema) -> dict:
+        """
+        Applies one patch or delete to every selected tender with a single
+        UPDATE/DELETE ... RETURNING. Updated rows are checked against the
+        business rules as returned, and the whole change is rolled back if
+        any of them breaks one.
+        """
+        criteria = [TenderEntity.company_id == company_id]
+        if data.ids is not None:
+            criteria.append(TenderEntity.id.in_(data.ids))
+
+        if data.action == "delete":
+            stmt = delete(TenderEntity).returning(TenderEntity.id)
+        else:
+            stmt = (
+                update(TenderEntity)
+                .values(**data.patch.model_dump(exclude_unset=True))
+                .returning(
+                    TenderEntity.id,
+                    TenderEntity.participation_result,
+                    TenderEntity.awarded_value,
+                    TenderEntity.status,
+                )
+            )
+
+        stmt = stmt.where(*criteria)
+        if data.filters is not None:
+            stmt = self._apply_filters(stmt, data.filters)
+
+        rows = (await self.session.execute(stmt)).all()
+
+        if data.action == "update":
+            violations = TenderValidator.validate_batch(
+                [row.participation_result for row in rows],
+                [row.awarded_value for row in rows],
+                [row.status for row in rows],
+            )
+            if violations:
+                await self.session.rollback()
+                raise HTTPException(
+                    status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                    detail=[
+                        {
+                            "id": rows[v.index].id,
+                            "code": v.code,
+                            "msg": v.message,
+                        }
+                        for v in violations[:MAX_REPORTED_VIOLATIONS]
+                    ],
+                )
+
+        await self.session.commit()
+
+        ids = sorted(row.id for row in rows)
+        return {
+            "action": data.action,
+            "affected": len(ids),
+            "ids": ids,
+            "not_found": sorted(set(data.ids or ()) - set(ids)),
+        }
+
     async def delete(self, tender_id: int, company_id: int):
         """
         Deletes a tender.
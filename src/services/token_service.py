@@ -0,0 +1,188 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+from fastapi import HTTPException
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infra.entities import RefreshTokenEntity, RevokedTokenEntity
+from src.infra.revocation import RevocationList
+from src.security import load_principal
+from src.settings import Settings
+
+settings = Settings()
+
+# Revocations committed late can carry a revoked_at older than the last
+# sync point, so every sync re-reads a small window before it.
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+def _to_utc_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(tzinfo=None)
+
+
+def _to_timestamp(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+
+def hash_refresh_token(token: str) -> str:
+    # Refresh tokens are 256-bit random strings, so a fast digest is enough;
+    # there is nothing for a slow password hash to protect against.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TokenService:
+    """
+    Persists revoked access tokens, keeps the in-memory revocation list in
+    sync with them, and manages rotating refresh tokens.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def revoke(self, jti: str, user_id: int, expires_at: float) -> None:
+        self.session.add(
+            RevokedTokenEntity(
+                jti=jti, user_id=user_id, expires_at=_to_utc_datetime(expires_at)
+            )
+        )
+
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+
+    async def prune_expired(self) -> None:
+        await self.session.execute(
+            delete(RevokedTokenEntity).where(RevokedTokenEntity.expires_at <= _utcnow())
+        )
+        await self.session.commit()
+
+    async def sync(
+        self, revocation_list: RevocationList, revoked_after: datetime | None = None
+    ) -> datetime | None:
+        """
+        Loads revocations recorded after `revoked_after` (all of them when
+        None) and returns the newest `revoked_at` seen, to be passed back
+        on the next call.
+        """
+        query = select(
+            RevokedTokenEntity.jti,
+            RevokedTokenEntity.expires_at,
+            RevokedTokenEntity.revoked_at,
+        )
+
+        if revoked_after is not None:
+            query = query.where(
+                RevokedTokenEntity.revoked_at > revoked_after - SYNC_OVERLAP
+            )
+
+        rows = (await self.session.execute(query)).all()
+        revocation_list.load((row.jti, _to_timestamp(row.expires_at)) for row in rows)
+
+        return max((row.revoked_at for row in rows), default=revoked_after)
+
+    async def issue_refresh_token(
+        self, user_id: int, token_version: int, family_id: str | None = None
+    ) -> str:
+        token = secrets.token_urlsafe(32)
+
+        self.session.add(
+            RefreshTokenEntity(
+                token_hash=hash_refresh_token(token),
+                family_id=family_id or uuid.uuid4().hex,
+                token_version=token_version,
+                expires_at=_utcnow()
+                + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+                user_id=user_id,
+            )
+        )
+        await self.session.commit()
+
+        return token
+
+    async def rotate_refresh_token(self, token: str):
+        """
+        Exchanges a refresh token for the user's principal and a new token
+        of the same family. Presenting an already-used token means it was
+        copied, so the whole family is revoked.
+        """
+        invalid_token_exception = HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+        token_hash = hash_refresh_token(token)
+        now = _utcnow()
+
+        consumed = (
+            await self.session.execute(
+                update(RefreshTokenEntity)
+                .where(
+                    RefreshTokenEntity.token_hash == token_hash,
+                    RefreshTokenEntity.used_at.is_(None),
+                    RefreshTokenEntity.expires_at > now,
+                )
+                .values(used_at=now)
+                .returning(
+                    RefreshTokenEntity.user_id,
+                    RefreshTokenEntity.family_id,
+                    RefreshTokenEntity.token_version,
+                )
+            )
+        ).one_or_none()
+
+        if consumed is None:
+            reused_family = await self.session.scalar(
+                select(RefreshTokenEntity.family_id).where(
+                    RefreshTokenEntity.token_hash == token_hash,
+                    RefreshTokenEntity.used_at.is_not(None),
+                )
+            )
+            if reused_family is not None:
+                await self._revoke_family(reused_family, now)
+
+            await self.session.commit()
+            raise invalid_token_exception
+
+        user = await load_principal(self.session, consumed.user_id)
+
+        if user is None or user.token_version != consumed.token_version:
+            await self.session.commit()
+            raise invalid_token_exception
+
+        new_token = await self.issue_refresh_token(
+            user.id, user.token_version, family_id=consumed.family_id
+        )
+
+        return user, new_token
+
+    async def revoke_refresh_token(self, token: str, user_id: int) -> None:
+        """Revokes the family of `token`, unless it belongs to another user."""
+        family_id = await self.session.scalar(
+            select(RefreshTokenEntity.family_id).where(
+                RefreshTokenEntity.token_hash == hash_refresh_token(token),
+                RefreshTokenEntity.user_id == user_id,
+            )
+        )
+
+        if family_id is not None:
+            await self._revoke_family(family_id, _utcnow())
+            await self.session.commit()
+
+    async def _revoke_family(self, family_id: str, now: datetime) -> None:
+        await self.session.execute(
+            update(RefreshTokenEntity)
+            .where(
+                RefreshTokenEntity.family_id == family_id,
+                RefreshTokenEntity.used_at.is_(None),
+            )
+            .values(used_at=now)
+        )
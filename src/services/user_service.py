@@ -1,12 +1,14 @@
 from http import HTTPStatus
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infra.entities import UserEntity
-from src.security import get_password_hash, verify_password
+from src.schemas.auth import PrincipalSchema
+from src.security import get_password_hash, principal_cache, verify_password
+from src.services.pagination import paginate
 
 
 class UserService:
@@ -48,27 +50,33 @@ class UserService:
         return new_user
 
     async def list(self, filters):
-        query = await self.session.scalars(
-            select(UserEntity).offset(filters.offset).limit(filters.limit)
-        )
-        return query.all()
+        return await paginate(self.session, select(UserEntity), UserEntity, filters)
 
-    async def update(self, user_id: int, current_user: UserEntity, data):
+    async def _get_self(self, user_id: int, current_user: PrincipalSchema):
         if current_user.id != user_id:
             raise HTTPException(
                 status_code=HTTPStatus.FORBIDDEN, detail="Not enough permissions"
             )
 
+        return await self.session.get(UserEntity, user_id)
+
+    async def update(self, user_id: int, current_user: PrincipalSchema, data):
+        user = await self._get_self(user_id, current_user)
+
         update_data = data.model_dump(exclude_unset=True)
 
+        if "email" in update_data and update_data["email"] != user.email:
+            user.token_version += 1
+
         for key, value in update_data.items():
-            setattr(current_user, key, value)
+            setattr(user, key, value)
 
         try:
             await self.session.commit()
-            await self.session.refresh(current_user)
+            await self.session.refresh(user)
+            principal_cache.invalidate_group(user_id)
 
-            return current_user
+            return user
 
         except IntegrityError as e:
             raise HTTPException(
@@ -76,27 +84,43 @@ class UserService:
                 detail="Username or Email already exists",
             ) from e
 
-    async def update_password(self, user_id: int, current_user: UserEntity, data):
-        if current_user.id != user_id:
-            raise HTTPException(
-                status_code=HTTPStatus.FORBIDDEN, detail="Not enough permissions"
-            )
+    async def update_password(self, user_id: int, current_user: PrincipalSchema, data):
+        user = await self._get_self(user_id, current_user)
 
-        if not await verify_password(data.current_password, current_user.password):
+        if not await verify_password(data.current_password, user.password):
             raise HTTPException(
                 status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
                 detail="Invalid current password",
             )
 
-        current_user.password = await get_password_hash(data.new_password)
+        user.password = await get_password_hash(data.new_password)
+        user.token_version += 1
+        await self.session.commit()
+        await self.session.refresh(user)
+        principal_cache.invalidate_group(user_id)
+
+    async def rehash_password(self, user_id: int, old_hash: str, password: str):
+        """
+        Re-hashes a password with the current Argon2 parameters. Runs after
+        a successful login, so a busy hashing pool just defers the upgrade
+        to the next one. The stored hash is only replaced if it has not
+        changed in the meantime.
+        """
+        try:
+            new_hash = await get_password_hash(password)
+        except HTTPException:
+            return
+
+        await self.session.execute(
+            update(UserEntity)
+            .where(UserEntity.id == user_id, UserEntity.password == old_hash)
+            .values(password=new_hash)
+        )
         await self.session.commit()
-        await self.session.refresh(current_user)
 
-    async def delete(self, user_id: int, current_user: UserEntity):
-        if current_user.id != user_id:
-            raise HTTPException(
-                status_code=HTTPStatus.FORBIDDEN, detail="Not enough permissions"
-            )
+    async def delete(self, user_id: int, current_user: PrincipalSchema):
+        user = await self._get_self(user_id, current_user)
 
-        await self.session.delete(current_user)
+        await self.session.delete(user)
         await self.session.commit()
+        principal_cache.invalidate_group(user_id)
@@ -1,11 +1,19 @@
+from collections.abc import Sequence
 from decimal import Decimal
 from http import HTTPStatus
+from typing import NamedTuple
 
 from fastapi import HTTPException
 
 from src.infra.entities import ParticipationResult, TenderStatus
 
 
+class TenderRuleViolation(NamedTuple):
+    index: int
+    code: str
+    message: str
+
+
 class TenderValidator:
     """
     Handles business domain rules for Tenders to ensure data consistency
@@ -22,6 +30,57 @@ class TenderValidator:
         TenderStatus.CANCELED,
     }
 
+    LOST_WITH_VALUE = "Awarded value must be zero when participation result is LOST."
+    WON_WITHOUT_VALUE = (
+        "Awarded value must be greater than zero when participation result is WON."
+    )
+    VALUE_FOR_STATUS = "Value cannot be greater than zero for status: {status}"
+
+    @staticmethod
+    def validate_batch(
+        participation_results: Sequence[ParticipationResult | None],
+        awarded_values: Sequence[Decimal | None],
+        statuses: Sequence[TenderStatus | None],
+    ) -> list[TenderRuleViolation]:
+        """
+        Checks the business rules for N records given as columns, in one
+        pass and without raising. Returns the first violation of each
+        failing record, ordered by index; valid records are omitted.
+        """
+        if not len(participation_results) == len(awarded_values) == len(statuses):
+            raise ValueError("All columns must have the same length.")
+
+        blocked = TenderValidator.BLOCKED_STATUSES_FOR_VALUE
+        violations = []
+
+        for index, (result, value, status) in enumerate(
+            zip(participation_results, awarded_values, statuses)
+        ):
+            has_value = value is not None and value > 0
+
+            if result == ParticipationResult.LOST and value is not None and value != 0:
+                violations.append(
+                    TenderRuleViolation(
+                        index, "lost_with_value", TenderValidator.LOST_WITH_VALUE
+                    )
+                )
+            elif result == ParticipationResult.WON and not has_value:
+                violations.append(
+                    TenderRuleViolation(
+                        index, "won_without_value", TenderValidator.WON_WITHOUT_VALUE
+                    )
+                )
+            elif has_value and status in blocked:
+                violations.append(
+                    TenderRuleViolation(
+                        index,
+                        "value_for_status",
+                        TenderValidator.VALUE_FOR_STATUS.format(status=status.value),
+                    )
+                )
+
+        return violations
+
     @staticmethod
     def validate_rules(
         participation_result: ParticipationResult | None,
@@ -31,23 +90,12 @@ class TenderValidator:
         """
         Validates business rules for awarded value, result and status.
         """
-        if participation_result == ParticipationResult.LOST:
-            if awarded_value is not None and awarded_value != Decimal("0.0"):
-                raise HTTPException(
-                    status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-                    detail="Awarded value must be zero when participation result is LOST.",
-                )
-
-        if participation_result == ParticipationResult.WON:
-            if awarded_value is None or awarded_value <= 0:
-                raise HTTPException(
-                    status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-                    detail="Awarded value must be greater than zero when participation result is WON.",
-                )
+        violations = TenderValidator.validate_batch(
+            [participation_result], [awarded_value], [status]
+        )
 
-        if awarded_value is not None and awarded_value > 0:
-            if status in TenderValidator.BLOCKED_STATUSES_FOR_VALUE:
-                raise HTTPException(
-                    status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-                    detail=f"Value cannot be greater than zero for status: {status.value}",
-                )
+        if violations:
+            raise HTTPException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                detail=violations[0].message,
+            )
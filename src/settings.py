@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +12,33 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 300
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    REVOCATION_SYNC_SECONDS: int = 30
+    RATE_LIMIT_STORE: str = "memory"
+    LOGIN_RATE_LIMIT_EMAIL_CAPACITY: int = 5
+    LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE: int = 5
+    LOGIN_RATE_LIMIT_IP_CAPACITY: int = 30
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: int = 30
+    TENDER_EXACT_COUNT_LIMIT: int = 10_000
+    TENDER_EXPORT_COPY: bool = True
+    DASHBOARD_CACHE_MAX_SIZE: int = 10_000
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300
+    DASHBOARD_CACHE_PAST_YEAR_TTL_SECONDS: int = 86_400
+    PUBLIC_BODY_SKETCH_CAPACITY: int = 1000
+    PUBLIC_BODY_CACHE_MAX_SIZE: int = 50_000
+    PUBLIC_BODY_CACHE_TTL_SECONDS: int = 86_400
+    AUTOCOMPLETE_CACHE_MAX_SIZE: int = 1000
+    AUTOCOMPLETE_CACHE_TTL_SECONDS: int = 600
+    METRICS_TOKEN: str | None = None
     CORS_ORIGINS: list[str] = [
         "http://localhost:3000",
         "http://localhost:5173",
@@ -2,6 +2,7 @@
 
 from contextlib import contextmanager
 from datetime import datetime
+from typing import Any, NamedTuple
 
 import pytest
 import pytest_asyncio
@@ -13,10 +14,34 @@ from testcontainers.postgres import PostgresContainer
 from src.app import app
 from src.infra.entities import table_registry
 from src.infra.settings.database import get_session
-from src.security import get_password_hash
+from src.security import (
+    get_password_hash,
+    login_throttle,
+    principal_cache,
+    revocation_list,
+)
+from src.services.autocomplete_service import public_body_index_cache
+from src.services.dashboard_service import dashboard_cache
+from src.services.public_body_service import public_body_cache
 from tests.factories import UserFactory
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def reset_in_memory_state():
+    principal_cache.clear()
+    dashboard_cache.clear()
+    public_body_cache.clear()
+    public_body_index_cache.clear()
+    revocation_list.clear()
+    await login_throttle.reset()
+    yield
+    principal_cache.clear()
+    dashboard_cache.clear()
+    public_body_cache.clear()
+    public_body_index_cache.clear()
+    revocation_list.clear()
+
+
 @pytest_asyncio.fixture
 async def client(session):
     def get_session_override():
@@ -70,6 +95,35 @@ def mock_db_time():
     return _mock_db_time
 
 
+class ExecutedStatement(NamedTuple):
+    statement: str
+    parameters: Any
+    rowcount: int
+
+
+@pytest.fixture
+def capture_statements(engine):
+    """
+    Context manager collecting, as ExecutedStatement tuples, the
+    statements the engine runs inside it.
+    """
+
+    @contextmanager
+    def capture():
+        statements = []
+
+        def record(_conn, cursor, statement, parameters, *_):
+            statements.append(ExecutedStatement(statement, parameters, cursor.rowcount))
+
+        event.listen(engine.sync_engine, "after_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "after_cursor_execute", record)
+
+    return capture
+
+
 @pytest_asyncio.fixture
 async def user(session):
     password = "testtest"
@@ -0,0 +1,171 @@
+# pylint: disable=W0613:unused-argument
+
+from datetime import datetime
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, update
+
+from src.infra.entities import (
+    ParticipationResult,
+    PublicBodyEntity,
+    PublicBodyStatsEntity,
+    TenderEntity,
+    TenderStatus,
+)
+from tests.factories import CompanyFactory, TenderFactory
+
+
+def won_tender(company_id: int, body: str, value: str, **kwargs):
+    return TenderFactory(
+        company_id=company_id,
+        public_body_name=body,
+        status=TenderStatus.FINISHED,
+        participation_result=ParticipationResult.WON,
+        awarded_value=Decimal(value),
+        **kwargs,
+    )
+
+
+@pytest_asyncio.fixture
+async def bodies(session, user, other_user):
+    company = CompanyFactory(user_id=user.id)
+    second = CompanyFactory(user_id=user.id)
+    foreign = CompanyFactory(user_id=other_user.id)
+    session.add_all([company, second, foreign])
+    await session.commit()
+
+    session.add_all(
+        [
+            *TenderFactory.create_batch(
+                3,
+                company_id=company.id,
+                public_body_name="Prefeitura A",
+                status=TenderStatus.ANALYSIS,
+                tender_year=2023,
+                session_date=datetime(2023, 3, 1),
+            ),
+            won_tender(
+                second.id,
+                "Prefeitura A",
+                "100.00",
+                tender_year=2024,
+                session_date=datetime(2024, 3, 1),
+            ),
+            won_tender(
+                company.id,
+                "Governo B",
+                "900.00",
+                tender_year=2024,
+                session_date=datetime(2024, 6, 1),
+            ),
+            TenderFactory(
+                company_id=company.id,
+                public_body_name="Governo B",
+                status=TenderStatus.ANALYSIS,
+                tender_year=2024,
+                session_date=datetime(2024, 7, 1),
+            ),
+            *TenderFactory.create_batch(
+                9, company_id=foreign.id, public_body_name="Estranho C"
+            ),
+        ]
+    )
+    await session.commit()
+    return company
+
+
+async def top(client, token, **params):
+    response = await client.get(
+        "/analytics/public-bodies/top",
+        headers={"Authorization": f"Bearer {token}"},
+        params=params,
+    )
+    assert response.status_code == HTTPStatus.OK, response.json()
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_top_public_bodies_by_count_spans_companies_and_years(
+    client, token, bodies
+):
+    data = await top(client, token)
+
+    assert data["approximate"] is False
+    assert [
+        (b["public_body_name"], b["total_tenders"], b["won_tenders"])
+        for b in data["bodies"]
+    ] == [("Prefeitura A", 4, 1), ("Governo B", 2, 1)]
+
+
+@pytest.mark.asyncio
+async def test_top_public_bodies_by_win_rate_and_value(client, token, bodies):
+    by_rate = await top(client, token, by="win_rate", k=1)
+    by_value = await top(client, token, by="awarded_value", year=2024)
+
+    assert [(b["public_body_name"], b["win_rate"]) for b in by_rate["bodies"]] == [
+        ("Governo B", 0.5)
+    ]
+    assert [
+        (b["public_body_name"], Decimal(b["total_awarded_value"]))
+        for b in by_value["bodies"]
+    ] == [("Governo B", Decimal("900")), ("Prefeitura A", Decimal("100"))]
+
+
+@pytest.mark.asyncio
+async def test_top_public_bodies_rollup_follows_tender_writes(
+    session, client, token, bodies
+):
+    body_ids = dict(
+        (await session.execute(select(PublicBodyEntity.name, PublicBodyEntity.id)))
+        .tuples()
+        .all()
+    )
+    await session.execute(
+        update(TenderEntity)
+        .where(TenderEntity.public_body_name == "Prefeitura A")
+        .values(public_body_name="Governo B", public_body_id=body_ids["Governo B"])
+    )
+    await session.execute(
+        delete(TenderEntity).where(TenderEntity.public_body_name == "Estranho C")
+    )
+    await session.commit()
+
+    data = await top(client, token)
+
+    assert [(b["public_body_name"], b["total_tenders"]) for b in data["bodies"]] == [
+        ("Governo B", 6)
+    ]
+    stranger_rows = await session.scalars(
+        select(PublicBodyStatsEntity).where(
+            PublicBodyStatsEntity.public_body_id == body_ids["Estranho C"],
+            PublicBodyStatsEntity.tender_count != 0,
+        )
+    )
+    assert stranger_rows.all() == []
+
+
+@pytest.mark.asyncio
+async def test_top_public_bodies_with_date_range_uses_the_sketch(client, token, bodies):
+    data = await top(client, token, **{"from": "2024-01-01", "to": "2024-06-30"})
+
+    assert data["approximate"] is True
+    assert [
+        (b["public_body_name"], b["total_tenders"], Decimal(b["error"]))
+        for b in data["bodies"]
+    ] == [("Governo B", 1, 0), ("Prefeitura A", 1, 0)]
+
+
+@pytest.mark.asyncio
+async def test_top_public_bodies_with_half_open_range_returns_unprocessable(
+    client, token
+):
+    response = await client.get(
+        "/analytics/public-bodies/top",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"from": "2024-01-01"},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
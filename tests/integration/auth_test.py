@@ -3,6 +3,18 @@
 from http import HTTPStatus
 
 from freezegun import freeze_time
+from httpx import ASGITransport, AsyncClient
+from jwt import decode
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from src.app import app
+from src.infra.hashing import (
+    HashPoolSaturatedError,
+    build_password_context,
+    password_needs_rehash,
+)
+from src.security import settings, verify_password
+from tests.factories import UserFactory
 
 
 async def test_auth_login_with_valid_credentials_returns_token(client, user):
@@ -88,3 +100,223 @@ async def test_auth_refresh_token_with_expired_token_returns_unauthorized(client
         )
         assert response.status_code == HTTPStatus.UNAUTHORIZED
         assert response.json() == {"detail": "Could not validate credentials"}
+
+
+async def test_auth_login_when_hash_pool_is_saturated_returns_service_unavailable(
+    client, user, mocker
+):
+    mocker.patch(
+        "src.security.password_hash_pool.verify",
+        side_effect=HashPoolSaturatedError,
+    )
+
+    response = await client.post(
+        "/auth/token",
+        data={"username": user.email, "password": user.clean_password},
+    )
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+async def test_auth_login_with_outdated_hash_parameters_rehashes_password(
+    client, session
+):
+    outdated_hash = build_password_context(
+        time_cost=1, memory_cost=8192, parallelism=1
+    ).hash("testtest")
+    user = UserFactory(password=outdated_hash)
+    session.add(user)
+    await session.commit()
+
+    response = await client.post(
+        "/auth/token", data={"username": user.email, "password": "testtest"}
+    )
+    await session.refresh(user)
+
+    assert response.status_code == HTTPStatus.OK
+    assert user.password != outdated_hash
+    assert not password_needs_rehash(user.password)
+    assert await verify_password("testtest", user.password)
+
+
+async def test_auth_login_behind_proxy_limits_each_forwarded_client(client, user):
+    # What uvicorn --proxy-headers does when nginx is the trusted proxy.
+    proxied = ProxyHeadersMiddleware(app, trusted_hosts="127.0.0.1")
+
+    async def login(forwarded_for: str, email: str, password: str):
+        async with AsyncClient(
+            transport=ASGITransport(app=proxied), base_url="http://test"
+        ) as behind_proxy:
+            return await behind_proxy.post(
+                "/auth/token",
+                headers={"X-Forwarded-For": forwarded_for},
+                data={"username": email, "password": password},
+            )
+
+    for attempt in range(settings.LOGIN_RATE_LIMIT_IP_CAPACITY):
+        response = await login("203.0.113.7", f"guess{attempt}@test.com", "wrong")
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    response = await login("203.0.113.7", user.email, user.clean_password)
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+    response = await login("198.51.100.2", user.email, user.clean_password)
+    assert response.status_code == HTTPStatus.OK
+
+
+async def test_auth_login_over_email_budget_returns_too_many_requests(
+    client, user, mocker
+):
+    verify = mocker.patch(
+        "src.routers.auth.verify_password", new=mocker.AsyncMock(return_value=False)
+    )
+
+    for _ in range(settings.LOGIN_RATE_LIMIT_EMAIL_CAPACITY):
+        response = await client.post(
+            "/auth/token", data={"username": user.email, "password": "wrong"}
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    response = await client.post(
+        "/auth/token", data={"username": user.email, "password": "wrong"}
+    )
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) > 0
+    assert verify.await_count == settings.LOGIN_RATE_LIMIT_EMAIL_CAPACITY
+
+
+async def test_auth_token_carries_user_id_and_token_version(client, user, token):
+    payload = decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    assert payload["sub"] == user.email
+    assert payload["uid"] == user.id
+    assert payload["ver"] == 0
+
+
+async def test_auth_password_change_revokes_previous_tokens(client, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await client.patch(
+        f"/users/{user.id}/password",
+        headers=headers,
+        json={"current_password": user.clean_password, "new_password": "newpass"},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = await client.post("/auth/refresh_token", headers=headers)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    response = await client.post(
+        "/auth/token", data={"username": user.email, "password": "newpass"}
+    )
+    new_token = response.json()["access_token"]
+    response = await client.post(
+        "/auth/refresh_token", headers={"Authorization": f"Bearer {new_token}"}
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+async def test_auth_logout_revokes_the_token(client, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.post("/auth/refresh_token", headers=headers)
+
+    response = await client.post("/auth/logout", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"message": "Logged out"}
+
+    response = await client.post("/auth/refresh_token", headers=headers)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+async def _login(client, user, password=None):
+    response = await client.post(
+        "/auth/token",
+        data={"username": user.email, "password": password or user.clean_password},
+    )
+    return response.json()
+
+
+async def test_auth_refresh_rotates_refresh_token_without_password(
+    client, user, mocker
+):
+    tokens = await _login(client, user)
+    verify = mocker.patch("src.routers.auth.verify_password")
+
+    response = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    rotated = response.json()
+    claims = decode(
+        rotated["access_token"], settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert claims["uid"] == user.id
+    verify.assert_not_called()
+
+
+async def test_auth_refresh_with_reused_token_revokes_the_family(client, user):
+    tokens = await _login(client, user)
+    first = tokens["refresh_token"]
+
+    response = await client.post("/auth/refresh", json={"refresh_token": first})
+    second = response.json()["refresh_token"]
+
+    response = await client.post("/auth/refresh", json={"refresh_token": first})
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {"detail": "Invalid refresh token"}
+
+    response = await client.post("/auth/refresh", json={"refresh_token": second})
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+async def test_auth_refresh_after_password_change_returns_unauthorized(client, user):
+    tokens = await _login(client, user)
+
+    await client.patch(
+        f"/users/{user.id}/password",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        json={"current_password": user.clean_password, "new_password": "newpass"},
+    )
+
+    response = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+async def test_auth_logout_with_refresh_token_revokes_it(client, user):
+    tokens = await _login(client, user)
+
+    response = await client.post(
+        "/auth/logout",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+async def test_auth_logout_with_another_users_refresh_token_keeps_it(
+    client, user, other_user
+):
+    tokens = await _login(client, user)
+    other_tokens = await _login(client, other_user)
+
+    response = await client.post(
+        "/auth/logout",
+        headers={"Authorization": f"Bearer {other_tokens['access_token']}"},
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == HTTPStatus.OK
@@ -0,0 +1,132 @@
+# pylint: disable=W0613:unused-argument
+
+from http import HTTPStatus
+
+import pytest
+import pytest_asyncio
+
+from src.services.autocomplete_service import public_body_index_cache
+from tests.factories import CompanyFactory, TenderFactory
+
+
+@pytest_asyncio.fixture
+async def company(session, user, other_user):
+    company = CompanyFactory(user_id=user.id)
+    foreign = CompanyFactory(user_id=other_user.id)
+    session.add_all([company, foreign])
+    await session.commit()
+
+    session.add_all(
+        [
+            *TenderFactory.create_batch(
+                3, company_id=company.id, public_body_name="Prefeitura de São Paulo"
+            ),
+            TenderFactory(
+                company_id=company.id, public_body_name="PREFEITURA DE SAO PAULO"
+            ),
+            TenderFactory(
+                company_id=company.id, public_body_name="Prefeitura de Santos"
+            ),
+            TenderFactory(
+                company_id=company.id, public_body_name="Secretaria de Saúde"
+            ),
+            TenderFactory(
+                company_id=foreign.id, public_body_name="Prefeitura Estranha"
+            ),
+        ]
+    )
+    await session.commit()
+    return company
+
+
+async def suggest(client, token, q, **params):
+    response = await client.get(
+        "/autocomplete/public-bodies",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"q": q, **params},
+    )
+    assert response.status_code == HTTPStatus.OK
+    return [(s["name"], s["tender_count"]) for s in response.json()["suggestions"]]
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_public_bodies_matches_word_prefixes(client, token, company):
+    assert await suggest(client, token, "pref") == [
+        ("Prefeitura de São Paulo", 4),
+        ("Prefeitura de Santos", 1),
+    ]
+    assert await suggest(client, token, "SAO pa") == [("Prefeitura de São Paulo", 4)]
+    assert await suggest(client, token, "sa") == [
+        ("Prefeitura de São Paulo", 4),
+        ("Prefeitura de Santos", 1),
+        ("Secretaria de Saúde", 1),
+    ]
+    assert await suggest(client, token, "sa", limit=1) == [
+        ("Prefeitura de São Paulo", 4)
+    ]
+    assert await suggest(client, token, "estranha") == []
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_public_bodies_warm_lookups_skip_the_database(
+    client, capture_statements, token, company
+):
+    await suggest(client, token, "pref")
+
+    with capture_statements() as statements:
+        assert await suggest(client, token, "secr") == [("Secretaria de Saúde", 1)]
+
+    assert not statements
+    assert public_body_index_cache.snapshot()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_public_bodies_follows_tender_writes(client, token, company):
+    headers = {"Authorization": f"Bearer {token}"}
+    assert await suggest(client, token, "camara") == []
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/",
+        headers=headers,
+        json={
+            "tender_number": 9999,
+            "tender_year": 2025,
+            "object_description": "New body",
+            "public_body_name": "Câmara Municipal",
+            "modality": "public_tender",
+            "format": "electronic",
+        },
+    )
+    assert await suggest(client, token, "camara") == [("Câmara Municipal", 1)]
+
+    await client.delete(
+        f"/companies/{company.id}/tenders/{response.json()['id']}", headers=headers
+    )
+    assert await suggest(client, token, "camara") == []
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_public_bodies_follows_company_deletes(
+    client, token, company
+):
+    assert await suggest(client, token, "santos") == [("Prefeitura de Santos", 1)]
+
+    response = await client.delete(
+        f"/companies/{company.id}", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    assert await suggest(client, token, "pref") == []
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_public_bodies_without_query_returns_unprocessable(
+    client, token
+):
+    response = await client.get(
+        "/autocomplete/public-bodies",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"q": ""},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -110,6 +110,30 @@ async def test_company_list_with_pagination_returns_correct_subset(
     assert len(response.json()["companies"]) == expected_companies
 
 
+@pytest.mark.asyncio
+async def test_company_list_with_cursor_continues_after_previous_page(
+    session, user, client, token
+):
+    session.add_all(CompanyFactory.create_batch(5, user_id=user.id))
+    await session.commit()
+
+    first = await client.get(
+        "/companies/?limit=2&order=desc",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    second = await client.get(
+        "/companies/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"limit": 2, "order": "desc", "cursor": first.json()["next_cursor"]},
+    )
+
+    first_ids = [c["id"] for c in first.json()["companies"]]
+    second_ids = [c["id"] for c in second.json()["companies"]]
+    assert first_ids + second_ids == sorted(first_ids + second_ids, reverse=True)
+    assert len(set(first_ids + second_ids)) == 4
+    assert second.json()["next_cursor"] is not None
+
+
 @pytest.mark.asyncio
 async def test_company_list_filter_by_name_returns_filtered_results(
     session, user, client, token
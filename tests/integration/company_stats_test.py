@@ -0,0 +1,199 @@
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import select, update
+
+from src.infra.entities import (
+    CompanyYearStatsEntity,
+    ParticipationResult,
+    TenderEntity,
+    TenderStatus,
+)
+from src.services.company_stats_service import CompanyStatsService
+from tests.factories import CompanyFactory, TenderFactory
+
+
+async def stats_rows(session, company_id: int) -> dict:
+    rows = await session.scalars(
+        select(CompanyYearStatsEntity)
+        .where(CompanyYearStatsEntity.company_id == company_id)
+        .where(CompanyYearStatsEntity.tender_count > 0)
+    )
+    return {
+        (row.tender_year, row.status): (
+            row.tender_count,
+            row.won_count,
+            row.awarded_value,
+        )
+        for row in rows
+    }
+
+
+@pytest.mark.asyncio
+async def test_company_stats_follow_tender_create_update_and_delete(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    created = []
+    for number in (1, 2):
+        response = await client.post(
+            f"/companies/{company.id}/tenders/",
+            headers=headers,
+            json={
+                "tender_number": number,
+                "tender_year": 2025,
+                "object_description": "Rollup tender",
+                "public_body_name": "City Hall",
+                "modality": "public_tender",
+                "format": "electronic",
+                "session_date": "2025-01-01T10:00:00",
+            },
+        )
+        created.append(response.json()["id"])
+
+    assert await stats_rows(session, company.id) == {
+        (2025, TenderStatus.MONITORING): (2, 0, Decimal("0")),
+    }
+
+    response = await client.patch(
+        f"/companies/{company.id}/tenders/{created[0]}",
+        headers=headers,
+        json={
+            "status": "finished",
+            "participation_result": "won",
+            "awarded_value": "1500.50",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert await stats_rows(session, company.id) == {
+        (2025, TenderStatus.MONITORING): (1, 0, Decimal("0")),
+        (2025, TenderStatus.FINISHED): (1, 1, Decimal("1500.50")),
+    }
+
+    response = await client.delete(
+        f"/companies/{company.id}/tenders/{created[0]}", headers=headers
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert await stats_rows(session, company.id) == {
+        (2025, TenderStatus.MONITORING): (1, 0, Decimal("0")),
+    }
+    assert await CompanyStatsService(session).mismatches([company.id]) == []
+
+
+@pytest.mark.asyncio
+async def test_company_stats_follow_bulk_statements(session, client, user, token):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(
+        TenderFactory.create_batch(
+            5, company_id=company.id, tender_year=2024, status=TenderStatus.ANALYSIS
+        )
+    )
+    await session.commit()
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "filters": {"status": "analysis"},
+            "action": "update",
+            "patch": {"status": "approved"},
+        },
+    )
+
+    assert response.json()["affected"] == 5
+    assert await stats_rows(session, company.id) == {
+        (2024, TenderStatus.APPROVED): (5, 0, Decimal("0")),
+    }
+    assert await CompanyStatsService(session).mismatches([company.id]) == []
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_reports_status_counts_from_rollup(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(
+        [
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2023,
+                status=TenderStatus.FINISHED,
+                participation_result=ParticipationResult.WON,
+                awarded_value=Decimal("200.00"),
+            ),
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2023,
+                status=TenderStatus.APPEAL,
+                participation_result=ParticipationResult.WON,
+                awarded_value=Decimal("999.00"),
+            ),
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2022,
+                status=TenderStatus.FINISHED,
+            ),
+        ]
+    )
+    await session.commit()
+
+    response = await client.get(
+        "/dashboard/metrics",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"year": 2023},
+    )
+
+    [metrics] = response.json()["companies"]
+    assert metrics["total_tenders"] == 2
+    assert metrics["won_tenders"] == 1
+    assert Decimal(metrics["total_awarded_value"]) == Decimal("200.00")
+    assert metrics["status_counts"] == {"finished": 1, "appeal": 1}
+
+
+@pytest.mark.asyncio
+async def test_company_stats_checker_detects_and_rebuild_repairs_drift(session, user):
+    companies = CompanyFactory.create_batch(3, user_id=user.id)
+    session.add_all(companies)
+    await session.commit()
+    for company in companies:
+        session.add_all(
+            TenderFactory.create_batch(4, company_id=company.id, tender_year=2021)
+        )
+    await session.commit()
+
+    drifted = companies[1]
+    await session.execute(
+        update(CompanyYearStatsEntity)
+        .where(CompanyYearStatsEntity.company_id == drifted.id)
+        .values(tender_count=CompanyYearStatsEntity.tender_count + 7)
+    )
+    await session.commit()
+
+    service = CompanyStatsService(session)
+    chunks = [ids async for ids in service.company_id_chunks(chunk_size=2)]
+    assert chunks == [[companies[0].id, companies[1].id], [companies[2].id]]
+
+    differences = await service.mismatches([c.id for c in companies])
+    assert differences
+    assert {difference["company_id"] for difference in differences} == {drifted.id}
+
+    for ids in chunks:
+        await service.rebuild(ids)
+
+    assert await service.mismatches([c.id for c in companies]) == []
+    total = sum(
+        count for count, _, _ in (await stats_rows(session, drifted.id)).values()
+    )
+    tenders = await session.scalars(
+        select(TenderEntity).where(TenderEntity.company_id == drifted.id)
+    )
+    assert total == len(tenders.all())
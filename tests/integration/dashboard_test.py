@@ -7,6 +7,7 @@ from http import HTTPStatus
 import pytest
 
 from src.infra.entities import ParticipationResult, TenderStatus
+from src.services.dashboard_service import dashboard_cache
 from tests.factories import CompanyFactory, TenderFactory
 
 
@@ -150,6 +151,199 @@ async def test_dashboard_metrics_with_another_users_data_returns_only_owned_metr
     assert other_company.id not in company_ids
 
 
+@pytest.mark.asyncio
+async def test_dashboard_metrics_with_matching_etag_returns_not_modified(
+    client, session, user, token
+):
+    session.add(CompanyFactory(user_id=user.id))
+    await session.commit()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.get(
+        "/dashboard/metrics", headers=headers, params={"year": 2020}
+    )
+    etag = first.headers["ETag"]
+
+    response = await client.get(
+        "/dashboard/metrics",
+        headers=headers | {"If-None-Match": f'"other", W/{etag}'},
+        params={"year": 2020},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_are_cached_until_a_tender_changes(
+    client, session, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.get(
+        "/dashboard/metrics", headers=headers, params={"year": 2020}
+    )
+    second = await client.get(
+        "/dashboard/metrics", headers=headers, params={"year": 2020}
+    )
+
+    assert second.json() == first.json()
+    assert dashboard_cache.stats.hits == 1
+
+    session.add(TenderFactory(company_id=company.id, tender_year=2020))
+    await session.commit()
+
+    third = await client.get(
+        "/dashboard/metrics",
+        headers=headers | {"If-None-Match": first.headers["ETag"]},
+        params={"year": 2020},
+    )
+
+    assert third.status_code == HTTPStatus.OK
+    assert third.headers["ETag"] != first.headers["ETag"]
+    assert third.json()["companies"][0]["total_tenders"] == 1
+
+
 async def test_dashboard_metrics_without_authentication_returns_unauthorized(client):
     response = await client.get("/dashboard/metrics")
     assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_dashboard_timeseries_returns_dense_quarterly_series(
+    client, session, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    idle = CompanyFactory(user_id=user.id)
+    session.add_all([company, idle])
+    await session.commit()
+    session.add_all(
+        [
+            TenderFactory(
+                company_id=company.id,
+                session_date=datetime(2023, 2, 10, 9),
+                participation_result=ParticipationResult.WON,
+                status=TenderStatus.FINISHED,
+                awarded_value=Decimal("100.00"),
+            ),
+            TenderFactory(
+                company_id=company.id,
+                session_date=datetime(2023, 3, 31, 23),
+                participation_result=ParticipationResult.LOST,
+                status=TenderStatus.FINISHED,
+                awarded_value=None,
+            ),
+            TenderFactory(company_id=company.id, session_date=datetime(2023, 8, 1)),
+            TenderFactory(company_id=company.id, session_date=datetime(2024, 1, 1)),
+        ]
+    )
+    await session.commit()
+
+    response = await client.get(
+        "/dashboard/timeseries",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"from": "2023-01-15", "to": "2023-12-31", "bucket": "quarter"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert (data["from"], data["to"], data["bucket"]) == (
+        "2023-01-15",
+        "2023-12-31",
+        "quarter",
+    )
+    series = {c["company_id"]: c["points"] for c in data["companies"]}
+    assert [
+        (p["period_start"], p["total_tenders"], p["won_tenders"])
+        for p in series[company.id]
+    ] == [
+        ("2023-01-01", 2, 1),
+        ("2023-04-01", 0, 0),
+        ("2023-07-01", 1, 0),
+        ("2023-10-01", 0, 0),
+    ]
+    assert Decimal(series[company.id][0]["total_awarded_value"]) == Decimal("100")
+    assert [p["total_tenders"] for p in series[idle.id]] == [0, 0, 0, 0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"from": "2024-05-01", "to": "2024-01-01"},
+        {"from": "2000-01-01", "to": "2024-01-01", "bucket": "month"},
+    ],
+)
+async def test_dashboard_timeseries_with_invalid_range_returns_unprocessable(
+    client, user, token, params
+):
+    response = await client.get(
+        "/dashboard/timeseries",
+        headers={"Authorization": f"Bearer {token}"},
+        params=params,
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_dashboard_metrics_with_breakdowns_groups_each_dimension(
+    client, session, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    idle = CompanyFactory(user_id=user.id)
+    session.add_all([company, idle])
+    await session.commit()
+    session.add_all(
+        [
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2022,
+                modality="auction",
+                format="electronic",
+                status=TenderStatus.FINISHED,
+                participation_result=ParticipationResult.WON,
+                awarded_value=Decimal("300.00"),
+            ),
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2022,
+                modality="auction",
+                format="in_person",
+                status=TenderStatus.ANALYSIS,
+            ),
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2022,
+                modality="invitation",
+                format="electronic",
+                status=TenderStatus.ANALYSIS,
+            ),
+        ]
+    )
+    await session.commit()
+
+    response = await client.get(
+        "/dashboard/metrics",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"year": 2022, "breakdown": ["status", "modality", "status"]},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    companies = {c["company_id"]: c for c in response.json()["companies"]}
+    breakdowns = companies[company.id]["breakdowns"]
+    assert set(breakdowns) == {"modality", "status"}
+    assert [
+        (b["value"], b["total_tenders"], b["won_tenders"])
+        for b in breakdowns["modality"]
+    ] == [("auction", 2, 1), ("invitation", 1, 0)]
+    assert [(b["value"], b["total_tenders"]) for b in breakdowns["status"]] == [
+        ("analysis", 2),
+        ("finished", 1),
+    ]
+    assert Decimal(breakdowns["status"][1]["total_awarded_value"]) == Decimal("300")
+    assert companies[idle.id]["breakdowns"] == {"modality": [], "status": []}
@@ -2,6 +2,7 @@ from dataclasses import asdict
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from src.infra.entities import CompanyEntity, UserEntity
 
@@ -16,7 +17,9 @@ async def test_db_user_creation_with_valid_data_persists_correctly(
         await session.commit()
 
     user = await session.scalar(
-        select(UserEntity).where(UserEntity.username == "alice")
+        select(UserEntity)
+        .options(selectinload(UserEntity.companies))
+        .where(UserEntity.username == "alice")
     )
 
     assert asdict(user) == {
@@ -25,6 +28,8 @@ async def test_db_user_creation_with_valid_data_persists_correctly(
         "password": "secret",
         "email": "test@test",
         "created_at": time,
+        "token_version": 0,
+        "data_version": 0,
         "companies": [],
     }
 
@@ -64,6 +69,10 @@ async def test_db_user_company_relationship_links_correctly(session, user: UserE
     await session.commit()
     await session.refresh(user)
 
-    user = await session.scalar(select(UserEntity).where(UserEntity.id == user.id))
+    user = await session.scalar(
+        select(UserEntity)
+        .options(selectinload(UserEntity.companies))
+        .where(UserEntity.id == user.id)
+    )
 
     assert user.companies == [company]
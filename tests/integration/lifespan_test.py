@@ -0,0 +1,32 @@
+import time
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src import app as app_module
+from src.infra.entities import RevokedTokenEntity, table_registry
+from src.security import revocation_list
+from src.services.token_service import TokenService
+
+
+@pytest.mark.asyncio
+async def test_lifespan_on_sqlite_prunes_expired_revocations(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(table_registry.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        service = TokenService(session)
+        await service.revoke("live", 1, time.time() + 600)
+        await service.revoke("expired", 1, time.time() - 600)
+
+    monkeypatch.setattr(app_module, "engine", engine)
+    async with app_module.lifespan(app_module.app):
+        assert revocation_list.is_revoked("live")
+        assert len(revocation_list) == 1
+
+    async with AsyncSession(engine) as session:
+        remaining = await session.scalars(select(RevokedTokenEntity.jti))
+        assert remaining.all() == ["live"]
+    await engine.dispose()
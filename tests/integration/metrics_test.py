@@ -0,0 +1,36 @@
+from http import HTTPStatus
+
+from src.routers.metrics import settings
+
+
+async def test_metrics_without_a_configured_token_returns_not_found(
+    client, token, monkeypatch
+):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+
+    response = await client.get(
+        "/metrics/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+async def test_metrics_for_a_logged_in_user_returns_forbidden(
+    client, token, monkeypatch
+):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "internal")
+
+    response = await client.get(
+        "/metrics/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+async def test_metrics_with_the_metrics_token_returns_counters(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "internal")
+
+    response = await client.get("/metrics/", headers={"X-Metrics-Token": "internal"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert "principal_cache" in response.json()
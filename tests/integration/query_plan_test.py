@@ -0,0 +1,288 @@
+# pylint: disable=W0613:unused-argument
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from src.infra.entities import (
+    ParticipationResult,
+    PublicBodyEntity,
+    TenderFormat,
+    TenderModality,
+    TenderStatus,
+)
+from src.schemas.analytics import TopPublicBodiesFilterSchema
+from src.schemas.company import FilterCompanySchema
+from src.schemas.dashboard import DashboardTimeseriesFilterSchema
+from src.schemas.tender import FilterTenderSchema, TenderSearchFilterSchema
+from src.services.analytics_service import AnalyticsService
+from src.services.company_service import CompanyService
+from src.services.dashboard_service import DashboardService
+from src.services.tender_service import TenderService
+from tests.factories import CompanyFactory
+
+HOT_TABLES = (
+    "tenders",
+    "companies",
+    "company_year_stats",
+    "public_bodies",
+    "public_body_stats",
+)
+
+# Enough rows that the planner prefers indexes for the user's slice of
+# each table: one company in OWNED_EVERY belongs to the user, the rest to
+# other_user.
+COMPANIES = 4000
+OWNED_EVERY = 200
+TENDERS_PER_COMPANY = 5
+PUBLIC_BODIES = 300
+# Full-text search is planned against a large company, where the index
+# matters; RARE_SUBJECT is on one tender in RARE_EVERY.
+LARGE_COMPANY_TENDERS = 3000
+RARE_EVERY = 500
+RARE_SUBJECT = "aquisição de drones"
+SUBJECTS = (
+    "pavimentação asfáltica",
+    "merenda escolar",
+    "medicamentos básicos",
+    "uniformes escolares",
+    "coleta de lixo",
+    "iluminação pública",
+    "transporte escolar",
+    "material de escritório",
+    "manutenção predial",
+    "serviços de limpeza",
+)
+# Postgres array type of each seeded tenders column.
+TENDER_COLUMNS = {
+    "tender_number": "integer[]",
+    "tender_year": "integer[]",
+    "object_description": "varchar[]",
+    "public_body_name": "varchar[]",
+    "public_body_id": "integer[]",
+    "modality": "tendermodality[]",
+    "format": "tenderformat[]",
+    "status": "tenderstatus[]",
+    "participation_result": "participationresult[]",
+    "awarded_value": "numeric[]",
+    "session_date": "timestamp[]",
+    "company_id": "integer[]",
+}
+
+
+def tender_rows(company_id: int, count: int, body_ids: list[int]) -> list[dict]:
+    # Enum columns store member names.
+    statuses = [status.name for status in TenderStatus]
+    results = [result.name for result in ParticipationResult]
+    modalities = [modality.name for modality in TenderModality]
+    formats = [tender_format.name for tender_format in TenderFormat]
+    return [
+        {
+            "tender_number": number,
+            "tender_year": 2020 + number % 5,
+            "object_description": (
+                RARE_SUBJECT
+                if number % RARE_EVERY == RARE_EVERY - 1
+                else SUBJECTS[number % len(SUBJECTS)]
+            ),
+            "public_body_name": f"Prefeitura {body_id}",
+            "public_body_id": body_id,
+            "modality": modalities[number % len(modalities)],
+            "format": formats[number % len(formats)],
+            "status": statuses[number % len(statuses)],
+            "participation_result": results[number % len(results)],
+            "awarded_value": Decimal(1000 + number),
+            "session_date": datetime(2020 + number % 5, number % 12 + 1, 1),
+            "company_id": company_id,
+        }
+        for number in range(count)
+        for body_id in [body_ids[(company_id * 7 + number) % len(body_ids)]]
+    ]
+
+
+async def insert_tenders(session, rows: list[dict]) -> None:
+    """
+    Inserts `rows` as one INSERT ... SELECT FROM unnest() of a parameter
+    array per column: nothing is compiled per row, and the statement-level
+    rollup triggers run once.
+    """
+    columns = ", ".join(TENDER_COLUMNS)
+    arrays = ", ".join(
+        f"CAST(:{column} AS {array_type})"
+        for column, array_type in TENDER_COLUMNS.items()
+    )
+    await session.execute(
+        text(f"INSERT INTO tenders ({columns}) SELECT * FROM unnest({arrays})"),
+        {column: [row[column] for row in rows] for column in TENDER_COLUMNS},
+    )
+
+
+@pytest_asyncio.fixture
+async def seeded(session, user, other_user):
+    """
+    Seeds and analyzes the hot tables. Returns one of the user's
+    companies and a large company of other_user.
+    """
+    companies = [
+        CompanyFactory(user_id=user.id if index % OWNED_EVERY == 0 else other_user.id)
+        for index in range(COMPANIES)
+    ]
+    bodies = [
+        PublicBodyEntity(
+            normalized_name=f"prefeitura {index}", name=f"Prefeitura {index}"
+        )
+        for index in range(PUBLIC_BODIES)
+    ]
+    session.add_all(companies + bodies)
+    await session.commit()
+
+    body_ids = [body.id for body in bodies]
+    rows = tender_rows(companies[1].id, LARGE_COMPANY_TENDERS, body_ids)
+    for company in companies[2:] + companies[:1]:
+        rows.extend(tender_rows(company.id, TENDERS_PER_COMPANY, body_ids))
+    await insert_tenders(session, rows)
+    await session.commit()
+
+    for table in HOT_TABLES:
+        await session.execute(text(f"ANALYZE {table}"))
+
+    return SimpleNamespace(company=companies[0], large_company=companies[1])
+
+
+async def explain_queries(session, capture_statements, action):
+    """
+    Runs `action`, captures every SELECT it sends to the database and
+    returns their EXPLAIN output.
+    """
+    with capture_statements() as statements:
+        await action()
+
+    connection = await session.connection()
+    plans = []
+    for executed in statements:
+        if not executed.statement.lstrip().upper().startswith("SELECT"):
+            continue
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN {executed.statement}", executed.parameters
+        )
+        plans.append("\n".join(row[0] for row in result))
+    return plans
+
+
+# path: (action, indexes its plans must use)
+HOT_PATHS = {
+    "tender_list": (
+        lambda session, seeded: TenderService(session).list(
+            seeded.company.id, FilterTenderSchema(sort="created_at", order="desc")
+        ),
+        ("ix_tenders_company_id_created_at",),
+    ),
+    "tender_list_by_year": (
+        lambda session, seeded: TenderService(session).list(
+            seeded.company.id, FilterTenderSchema(tender_year=2021)
+        ),
+        ("ix_tenders_company_id_tender_year",),
+    ),
+    "tender_list_by_status": (
+        lambda session, seeded: TenderService(session).list(
+            seeded.company.id, FilterTenderSchema(status="finished")
+        ),
+        ("ix_tenders_company_id_status",),
+    ),
+    "tender_list_by_session_date": (
+        lambda session, seeded: TenderService(session).list(
+            seeded.company.id, FilterTenderSchema(sort="session_date", order="desc")
+        ),
+        ("ix_tenders_company_id_session_date",),
+    ),
+    "tender_counts": (
+        lambda session, seeded: TenderService(session).list(
+            seeded.company.id, FilterTenderSchema(counts="exact")
+        ),
+        ("ix_tenders_company_id_status",),
+    ),
+    "tender_search": (
+        lambda session, seeded: TenderService(session).search(
+            seeded.large_company.id, TenderSearchFilterSchema(q="drones")
+        ),
+        ("ix_tenders_search_vector", "ix_tenders_public_body_name_trgm"),
+    ),
+    "dashboard_metrics": (
+        lambda session, seeded: DashboardService(session).get_metrics(
+            seeded.company.user_id, 2021
+        ),
+        ("ix_companies_user_id", "company_year_stats_pkey"),
+    ),
+    "dashboard_breakdowns": (
+        lambda session, seeded: DashboardService(session).get_metrics(
+            seeded.company.user_id, 2021, ("modality", "format", "status")
+        ),
+        (
+            "ix_companies_user_id",
+            "company_year_stats_pkey",
+            "ix_tenders_company_id_tender_year",
+        ),
+    ),
+    "dashboard_timeseries": (
+        lambda session, seeded: DashboardService(session).get_timeseries(
+            seeded.company.user_id,
+            DashboardTimeseriesFilterSchema.model_validate(
+                {"from": "2021-01-01", "to": "2021-12-31", "bucket": "quarter"}
+            ),
+        ),
+        ("ix_companies_user_id", "ix_tenders_company_id_session_date"),
+    ),
+    "top_public_bodies": (
+        lambda session, seeded: AnalyticsService(session).top_public_bodies(
+            seeded.company.user_id, TopPublicBodiesFilterSchema(year=2021)
+        ),
+        ("ix_companies_user_id", "public_body_stats_pkey", "public_bodies_pkey"),
+    ),
+    "company_list": (
+        lambda session, seeded: CompanyService(session).list(
+            seeded.company.user_id, FilterCompanySchema()
+        ),
+        ("ix_companies_user_id",),
+    ),
+    "company_get_owned": (
+        lambda session, seeded: CompanyService(session).get_owned(
+            seeded.company.id, seeded.company.user_id
+        ),
+        ("companies_pkey",),
+    ),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", HOT_PATHS)
+async def test_query_plan_hot_path_uses_its_indexes(
+    session, capture_statements, seeded, path
+):
+    action, indexes = HOT_PATHS[path]
+    existing = set(
+        await session.scalars(
+            text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()")
+        )
+    )
+    missing = set(indexes) - existing
+    # The trigram indexes are only created where pg_trgm is available;
+    # every other index must exist.
+    assert all(index.endswith("_trgm") for index in missing), sorted(missing)
+    if missing:
+        pytest.skip(f"{', '.join(sorted(missing))} not created on this server")
+
+    plans = await explain_queries(
+        session, capture_statements, lambda: action(session, seeded)
+    )
+
+    assert plans
+    report = "\n\n".join(plans)
+    for index in indexes:
+        assert any(f"using {index}" in plan for plan in plans), report
+    for plan in plans:
+        for table in HOT_TABLES:
+            assert f"Seq Scan on {table}" not in plan, report
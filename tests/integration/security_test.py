@@ -1,8 +1,11 @@
+# pylint: disable=W0613:unused-argument
+
 from http import HTTPStatus
 
 from jwt import decode
 
-from src.security import create_access_token, settings
+from src.security import create_access_token, principal_cache, settings
+from tests.factories import CompanyFactory, TenderFactory
 
 
 async def test_security_create_access_token_returns_valid_jwt():
@@ -22,3 +25,53 @@ async def test_security_access_with_invalid_token_returns_unauthorized(client):
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
     assert response.json() == {"detail": "Could not validate credentials"}
+
+
+async def test_security_authenticated_request_loads_only_the_principal(
+    client, session, capture_statements, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(TenderFactory.create_batch(20, company_id=company.id))
+    await session.commit()
+    session.expunge_all()
+
+    with capture_statements() as statements:
+        response = await client.post(
+            "/auth/refresh_token",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(statements) == 1
+    assert statements[0].rowcount == 1
+    assert "companies" not in statements[0].statement
+    assert "tenders" not in statements[0].statement
+
+
+async def test_security_warm_principal_cache_skips_database(
+    client, capture_statements, user, token
+):
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.get("/companies/", headers=headers)
+
+    with capture_statements() as statements:
+        response = await client.post("/auth/refresh_token", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert not statements
+    assert principal_cache.stats.hits == 1
+
+
+async def test_security_user_update_invalidates_cached_principal(client, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.get("/companies/", headers=headers)
+
+    response = await client.patch(
+        f"/users/{user.id}", headers=headers, json={"email": "new@example.com"}
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = await client.get("/companies/", headers=headers)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -0,0 +1,65 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.infra.entities import ParticipationResult, TenderStatus
+from src.services.analytics.columnar import CURRENT, Snapshot, write_snapshot
+from src.services.analytics.snapshot_metrics import snapshot_metrics
+from src.services.dashboard_service import DashboardService
+from tests.factories import CompanyFactory, TenderFactory
+
+
+@pytest.mark.asyncio
+async def test_snapshot_metrics_match_the_dashboard_service(
+    session, user, other_user, tmp_path
+):
+    companies = [
+        CompanyFactory(user_id=owner.id) for owner in (user, other_user, user, user)
+    ]
+    session.add_all(companies)
+    await session.commit()
+    for company in companies[:3]:
+        session.add_all(
+            TenderFactory.create_batch(15, company_id=company.id, tender_year=2024)
+            + TenderFactory.create_batch(5, company_id=company.id, tender_year=2023)
+        )
+    session.add(
+        TenderFactory(
+            company_id=companies[0].id,
+            tender_year=2024,
+            session_date=datetime(2024, 5, 1),
+            status=TenderStatus.FINISHED,
+            participation_result=ParticipationResult.WON,
+            awarded_value=Decimal("1234.56"),
+        )
+    )
+    await session.commit()
+
+    await write_snapshot(session, tmp_path)
+    breakdowns = ("modality", "format", "status")
+    expected = await DashboardService(session).get_metrics(user.id, 2024, breakdowns)
+
+    with Snapshot(tmp_path) as snapshot:
+        result = snapshot_metrics(snapshot, user.id, 2024, breakdowns)
+        assert snapshot.manifest["tables"]["tenders"]["rows"] == 61
+
+    assert result == expected
+    assert result["companies"][0]["total_awarded_value"] >= Decimal("1234.56")
+    assert result["companies"][2]["total_tenders"] == 0
+
+
+@pytest.mark.asyncio
+async def test_snapshot_publish_swaps_current_and_prunes_old_ones(
+    session, user, tmp_path
+):
+    session.add(CompanyFactory(user_id=user.id))
+    await session.commit()
+
+    written = [await write_snapshot(session, tmp_path) for _ in range(3)]
+
+    assert (tmp_path / CURRENT).resolve() == written[-1]
+    assert not written[0].exists()
+    with Snapshot(tmp_path) as snapshot:
+        assert snapshot.manifest["tables"]["tenders"]["rows"] == 0
+        assert list(snapshot.companies["user_id"]) == [user.id]
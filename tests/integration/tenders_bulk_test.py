@@ -0,0 +1,146 @@
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import select
+
+from src.infra.entities import TenderEntity
+from tests.factories import CompanyFactory, TenderFactory
+
+
+@pytest.mark.asyncio
+async def test_tender_bulk_update_by_ids_patches_only_owned_rows(
+    session, client, user, other_user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    foreign = CompanyFactory(user_id=other_user.id)
+    session.add_all([company, foreign])
+    await session.commit()
+    owned = TenderFactory.create_batch(3, company_id=company.id, status="analysis")
+    stranger = TenderFactory(company_id=foreign.id, status="analysis")
+    session.add_all([*owned, stranger])
+    await session.commit()
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "ids": [t.id for t in owned[:2]] + [stranger.id],
+            "action": "update",
+            "patch": {"status": "in_progress"},
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "action": "update",
+        "affected": 2,
+        "ids": sorted(t.id for t in owned[:2]),
+        "not_found": [stranger.id],
+    }
+    statuses = {
+        t.id: t.status for t in (await session.scalars(select(TenderEntity))).all()
+    }
+    assert statuses[owned[0].id] == "in_progress"
+    assert statuses[owned[2].id] == "analysis"
+    assert statuses[stranger.id] == "analysis"
+
+
+@pytest.mark.asyncio
+async def test_tender_bulk_update_breaking_rules_rolls_back(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(
+        [
+            TenderFactory(
+                company_id=company.id,
+                status="finished",
+                participation_result="won",
+                awarded_value=Decimal("100"),
+            ),
+            TenderFactory(company_id=company.id, status="finished"),
+        ]
+    )
+    await session.commit()
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "filters": {"status": "finished"},
+            "action": "update",
+            "patch": {"status": "canceled"},
+        },
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert [v["code"] for v in response.json()["detail"]] == ["value_for_status"]
+    statuses = (await session.scalars(select(TenderEntity.status))).all()
+    assert set(statuses) == {"finished"}
+
+
+@pytest.mark.asyncio
+async def test_tender_bulk_delete_by_filters_uses_one_statement(
+    session, capture_statements, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(
+        TenderFactory.create_batch(
+            4, company_id=company.id, tender_year=2023, status="rejected"
+        )
+        + TenderFactory.create_batch(2, company_id=company.id, tender_year=2024)
+    )
+    await session.commit()
+
+    with capture_statements() as statements:
+        response = await client.post(
+            f"/companies/{company.id}/tenders/bulk",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "filters": {"tender_year": 2023, "status": "rejected"},
+                "action": "delete",
+            },
+        )
+    deletes = [
+        executed
+        for executed in statements
+        if executed.statement.lstrip().upper().startswith("DELETE")
+    ]
+
+    assert response.json()["affected"] == 4
+    assert len(deletes) == 1
+    remaining = (await session.scalars(select(TenderEntity.tender_year))).all()
+    assert remaining == [2024, 2024]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"action": "delete"},
+        {"ids": [1], "filters": {}, "action": "delete"},
+        {"ids": [1], "action": "update"},
+        {"ids": [1], "action": "update", "patch": {"tender_number": 2}},
+        {"ids": [1], "action": "update", "patch": {"status": None}},
+        {"ids": [1], "action": "delete", "patch": {"status": "finished"}},
+    ],
+)
+async def test_tender_bulk_with_invalid_payload_returns_unprocessable(
+    session, client, user, token, payload
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json=payload,
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
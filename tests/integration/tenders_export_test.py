@@ -0,0 +1,124 @@
+# pylint: disable=W0613:unused-argument
+
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+
+from src.infra.entities import TenderModality
+from tests.factories import CompanyFactory, TenderFactory
+
+
+@pytest.fixture(params=[True, False], ids=["copy", "cursor"])
+def export_path(request, monkeypatch):
+    """Runs the test once through COPY and once through a server cursor."""
+    monkeypatch.setattr(
+        "src.services.tender_service.settings.TENDER_EXPORT_COPY", request.param
+    )
+
+
+@pytest.mark.asyncio
+async def test_tender_export_csv_streams_filtered_rows(
+    session, client, user, token, export_path
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(
+        TenderFactory.create_batch(
+            3,
+            company_id=company.id,
+            status="finished",
+            awarded_value=Decimal("1500.50"),
+            object_description='Obra, "ponte"\nnova',
+        )
+        + TenderFactory.create_batch(2, company_id=company.id, status="monitoring")
+    )
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/export",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"file_format": "csv", "status": "finished", "order": "desc"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 3
+    assert [int(r["id"]) for r in rows] == sorted(
+        (int(r["id"]) for r in rows), reverse=True
+    )
+    assert rows[0]["status"] == "finished"
+    assert rows[0]["awarded_value"] == "1500.50"
+    assert rows[0]["object_description"] == 'Obra, "ponte"\nnova'
+    assert datetime.fromisoformat(rows[0]["session_date"])
+
+
+@pytest.mark.asyncio
+async def test_tender_export_copy_and_cursor_paths_produce_same_csv(
+    session, client, user, token, monkeypatch
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(TenderFactory.create_batch(5, company_id=company.id))
+    await session.commit()
+
+    outputs = []
+    for use_copy in (True, False):
+        monkeypatch.setattr(
+            "src.services.tender_service.settings.TENDER_EXPORT_COPY", use_copy
+        )
+        response = await client.get(
+            f"/companies/{company.id}/tenders/export",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        outputs.append(response.text)
+
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.asyncio
+async def test_tender_export_ndjson_returns_one_object_per_line(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(TenderFactory.create_batch(4, company_id=company.id))
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/export",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"file_format": "ndjson", "sort": "session_date"},
+    )
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 4
+    assert {line["modality"] for line in lines} <= {m.value for m in TenderModality}
+    assert [line["session_date"] for line in lines] == sorted(
+        line["session_date"] for line in lines
+    )
+
+
+@pytest.mark.asyncio
+async def test_tender_export_from_foreign_company_returns_not_found(
+    session, client, other_user, token
+):
+    company = CompanyFactory(user_id=other_user.id)
+    session.add(company)
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/export",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
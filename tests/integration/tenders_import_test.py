@@ -0,0 +1,128 @@
+import json
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+
+from src.infra.entities import TenderEntity
+from tests.factories import CompanyFactory, TenderFactory
+
+IMPORT_CSV_HEADER = (
+    "tender_number;tender_year;object_description;public_body_name;"
+    "modality;format;status;participation_result;awarded_value;session_date\n"
+)
+
+
+@pytest.mark.asyncio
+async def test_tender_import_csv_reports_every_row(session, client, user, token):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add(
+        TenderFactory(
+            company_id=company.id,
+            tender_number=9,
+            tender_year=2025,
+            public_body_name="Prefeitura B",
+            modality="auction",
+            format="in_person",
+        )
+    )
+    await session.commit()
+
+    body = IMPORT_CSV_HEADER + (
+        "1;2025;Obra de pavimentação;Prefeitura A;trading_session;electronic"
+        ";finished;won;1500.50;2025-03-01T10:00:00\n"
+        "2;2025;Compra de materiais;Prefeitura A;auction;in_person;;;;\n"
+        "1;2025;Obra repetida;Prefeitura A;trading_session;electronic;;;;\n"
+        "9;2025;Já cadastrada;Prefeitura B;auction;in_person;;;;\n"
+        "3;1990;Ano inválido;Prefeitura A;auction;in_person;;;;\n"
+        "4;2025;Valor sem vitória;Prefeitura A;auction;in_person;monitoring;;10;\n"
+    )
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/import",
+        headers={"Authorization": f"Bearer {token}"},
+        files={"file": ("tenders.csv", body.encode(), "text/csv")},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    report = response.json()
+    assert (report["created"], report["duplicates"], report["invalid"]) == (2, 2, 2)
+    assert [row["status"] for row in report["rows"]] == [
+        "created",
+        "created",
+        "duplicate",
+        "duplicate",
+        "invalid",
+        "invalid",
+    ]
+    assert report["rows"][2]["errors"] == ["Same tender as row 1."]
+    assert report["rows"][4]["errors"][0].startswith("tender_year:")
+
+    tender = await session.get(TenderEntity, report["rows"][0]["id"])
+    assert tender.company_id == company.id
+    assert tender.awarded_value == Decimal("1500.50")
+    assert tender.status == "finished"
+
+
+@pytest.mark.asyncio
+async def test_tender_import_ndjson_writes_rows_in_few_statements(
+    session, capture_statements, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    lines = [
+        json.dumps(
+            {
+                "tender_number": number,
+                "tender_year": 2025,
+                "object_description": f"Objeto {number}",
+                "public_body_name": "Prefeitura Municipal",
+                "modality": "trading_session",
+                "format": "electronic",
+            }
+        )
+        for number in range(1, 2501)
+    ]
+    body = "\n".join(lines[:10] + ["{not json"] + lines[10:]) + "\n"
+
+    with capture_statements() as statements:
+        response = await client.post(
+            f"/companies/{company.id}/tenders/import",
+            headers={"Authorization": f"Bearer {token}"},
+            params={"file_format": "ndjson"},
+            files={"file": ("tenders.ndjson", body.encode(), "application/x-ndjson")},
+        )
+    inserts = [
+        executed
+        for executed in statements
+        if executed.statement.lstrip().upper().startswith("INSERT")
+    ]
+
+    report = response.json()
+    assert report["created"] == 2500
+    assert report["invalid"] == 1
+    assert report["rows"][10]["row"] == 11
+    assert report["rows"][10]["errors"][0].startswith("Invalid JSON")
+    # One per batch of tenders, plus one interning the public body.
+    assert len(inserts) == 4
+
+
+@pytest.mark.asyncio
+async def test_tender_import_into_foreign_company_returns_not_found(
+    session, client, other_user, token
+):
+    company = CompanyFactory(user_id=other_user.id)
+    session.add(company)
+    await session.commit()
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/import",
+        headers={"Authorization": f"Bearer {token}"},
+        files={"file": ("tenders.csv", IMPORT_CSV_HEADER.encode(), "text/csv")},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.factories import CompanyFactory, TenderFactory
+
+
+@pytest.mark.asyncio
+async def test_tender_search_ranks_stemmed_matches_with_highlights(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    session.add_all(
+        [
+            TenderFactory(
+                company_id=company.id,
+                object_description="Aquisição de material de escritório",
+                public_body_name="Prefeitura de Campinas",
+            ),
+            TenderFactory(
+                company_id=company.id,
+                object_description="Pavimentação asfáltica e recapeamento",
+                public_body_name="Secretaria de Obras",
+            ),
+            TenderFactory(
+                company_id=company.id,
+                object_description="Reforma do hospital",
+                public_body_name="Departamento de Pavimentação",
+            ),
+        ]
+    )
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/search",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"q": "pavimentar"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    results = response.json()["results"]
+    assert [hit["tender"]["public_body_name"] for hit in results] == [
+        "Secretaria de Obras",
+        "Departamento de Pavimentação",
+    ]
+    assert results[0]["rank"] > results[1]["rank"]
+    assert results[0]["highlights"]["object_description"].startswith(
+        "<mark>Pavimentação</mark>"
+    )
+    assert "<mark>Pavimentação</mark>" in results[1]["highlights"]["public_body_name"]
+
+
+@pytest.mark.asyncio
+async def test_tender_search_matches_partial_public_body_name_and_filters(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    other_company = CompanyFactory(user_id=user.id)
+    session.add_all([company, other_company])
+    await session.commit()
+
+    session.add_all(
+        [
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2025,
+                public_body_name="Prefeitura de Campinas",
+            ),
+            TenderFactory(
+                company_id=company.id,
+                tender_year=2024,
+                public_body_name="Prefeitura de Campinas",
+            ),
+            TenderFactory(
+                company_id=other_company.id,
+                tender_year=2025,
+                public_body_name="Prefeitura de Campinas",
+            ),
+        ]
+    )
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/search",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"q": "campin", "tender_year": 2025},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    results = response.json()["results"]
+    assert len(results) == 1
+    assert results[0]["tender"]["tender_year"] == 2025
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 from http import HTTPStatus
 
 import pytest
@@ -116,6 +117,175 @@ async def test_tender_list_returns_only_owned_company_tenders(
     assert len(data["tenders"]) == 3
 
 
+@pytest.mark.asyncio
+async def test_tender_list_with_cursor_walks_every_page_in_sort_order(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    base = datetime(2025, 1, 1)
+    session.add_all(
+        TenderFactory(company_id=company.id, session_date=base + timedelta(days=i % 3))
+        for i in range(7)
+    )
+    await session.commit()
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3, "sort": "session_date", "order": "desc"}
+        if cursor:
+            params["cursor"] = cursor
+
+        response = await client.get(
+            f"/companies/{company.id}/tenders/",
+            headers={"Authorization": f"Bearer {token}"},
+            params=params,
+        )
+        assert response.status_code == HTTPStatus.OK
+
+        data = response.json()
+        seen.extend(data["tenders"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    keys = [(t["session_date"], t["id"]) for t in seen]
+    assert len(seen) == 7
+    assert len({t["id"] for t in seen}) == 7
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_tender_list_with_cursor_from_other_sort_returns_bad_request(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(TenderFactory.create_batch(3, company_id=company.id))
+    await session.commit()
+
+    first = await client.get(
+        f"/companies/{company.id}/tenders/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"limit": 1},
+    )
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={
+            "limit": 1,
+            "sort": "created_at",
+            "cursor": first.json()["next_cursor"],
+        },
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params", [{"limit": 201}, {"cursor": "abc", "offset": 1}, {"sort": "status"}]
+)
+async def test_tender_list_with_invalid_page_params_returns_unprocessable(
+    session, client, user, token, params
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/",
+        headers={"Authorization": f"Bearer {token}"},
+        params=params,
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_tender_list_with_exact_counts_returns_total_and_facets(
+    session, client, user, token
+):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    session.add_all(
+        TenderFactory.create_batch(
+            3, company_id=company.id, status="finished", format="electronic"
+        )
+        + TenderFactory.create_batch(
+            2, company_id=company.id, status="monitoring", format="electronic"
+        )
+    )
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"limit": 2, "counts": "exact", "format": "electronic"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert len(data["tenders"]) == 2
+    assert data["total"] == 5
+    assert data["total_is_estimate"] is False
+    assert data["facets"]["status"] == [
+        {"value": "finished", "count": 3},
+        {"value": "monitoring", "count": 2},
+    ]
+    assert data["facets"]["format"] == [{"value": "electronic", "count": 5}]
+    assert sum(b["count"] for b in data["facets"]["modality"]) == 5
+    assert sum(b["count"] for b in data["facets"]["participation_result"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_tender_list_with_approximate_counts_uses_planner_estimate(
+    session, client, user, token, monkeypatch
+):
+    monkeypatch.setattr(
+        "src.services.tender_service.settings.TENDER_EXACT_COUNT_LIMIT", 0
+    )
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(TenderFactory.create_batch(3, company_id=company.id))
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"counts": "approximate"},
+    )
+
+    data = response.json()
+    assert data["total_is_estimate"] is True
+    assert data["total"] >= 1
+    assert data["facets"] is None
+
+
+@pytest.mark.asyncio
+async def test_tender_list_without_counts_omits_totals(session, client, user, token):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    response = await client.get(
+        f"/companies/{company.id}/tenders/",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    data = response.json()
+    assert data["total"] is None
+    assert data["facets"] is None
+
+
 @pytest.mark.asyncio
 async def test_tender_list_with_nonexistent_company_returns_not_found(client, token):
     response = await client.get(
@@ -24,13 +24,13 @@ async def test_user_list_returns_authenticated_user(client, user, token):
     user_schema = UserPublicSchema.model_validate(user).model_dump()
     response = await client.get("/users/", headers={"Authorization": f"Bearer {token}"})
     assert response.status_code == HTTPStatus.OK
-    assert response.json() == {"users": [user_schema]}
+    assert response.json() == {"users": [user_schema], "next_cursor": None}
 
 
 async def test_user_list_when_users_exist_returns_user_list(client, user, token):
     user_schema = UserPublicSchema.model_validate(user).model_dump()
     response = await client.get("/users/", headers={"Authorization": f"Bearer {token}"})
-    assert response.json() == {"users": [user_schema]}
+    assert response.json() == {"users": [user_schema], "next_cursor": None}
 
 
 async def test_user_list_unauthorized_returns_unauthorized(client):
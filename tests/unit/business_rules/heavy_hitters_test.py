@@ -0,0 +1,54 @@
+import random
+from collections import Counter as ExactCounter
+
+import pytest
+
+from src.services.analytics.heavy_hitters import SpaceSaving
+
+
+def test_space_saving_under_capacity_counts_exactly():
+    sketch = SpaceSaving(capacity=3)
+    for key in "abacab":
+        sketch.offer(key, won=key == "a")
+
+    assert {key: c.weight for key, c in sketch.counters.items()} == {
+        "a": 3,
+        "b": 2,
+        "c": 1,
+    }
+    assert sketch.counters["a"].won == 3
+    assert all(c.error == 0 for c in sketch.counters.values())
+
+
+def test_space_saving_keeps_heavy_hitters_with_bounded_memory():
+    rng = random.Random(7)
+    stream = ["hot"] * 500 + ["warm"] * 200
+    stream += [f"rare-{rng.randrange(5000)}" for _ in range(3000)]
+    rng.shuffle(stream)
+
+    sketch = SpaceSaving(capacity=50)
+    for key in stream:
+        sketch.offer(key)
+
+    exact = ExactCounter(stream)
+    assert len(sketch) == 50
+    for key in ("hot", "warm"):
+        counter = sketch.counters[key]
+        assert counter.weight - counter.error <= exact[key] <= counter.weight
+    assert sketch.total == len(stream)
+
+
+def test_space_saving_weightless_items_do_not_displace_tracked_keys():
+    sketch = SpaceSaving(capacity=1)
+    sketch.offer("a", 10)
+    sketch.offer("b", 0)
+    sketch.offer("a", 0, won=True)
+
+    assert list(sketch.counters) == ["a"]
+    assert sketch.counters["a"].tenders == 2
+    assert sketch.counters["a"].won == 1
+
+
+def test_space_saving_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        SpaceSaving(capacity=0)
@@ -0,0 +1,32 @@
+from src.services.search.public_body_index import PublicBodyIndex
+
+
+def make_index():
+    return PublicBodyIndex(
+        [
+            (1, "prefeitura de sao paulo", "Prefeitura de São Paulo", 4),
+            (2, "prefeitura de santos", "Prefeitura de Santos", 7),
+            (3, "camara de sao paulo", "Câmara de São Paulo", 1),
+        ]
+    )
+
+
+def test_public_body_index_matches_any_word_prefix_most_used_first():
+    index = make_index()
+
+    assert [s["id"] for s in index.suggest("Pref", limit=10)] == [2, 1]
+    assert [s["id"] for s in index.suggest("são  p", limit=10)] == [1, 3]
+    assert [s["id"] for s in index.suggest("s", limit=2)] == [2, 1]
+    assert index.suggest("de", limit=10)[0] == {
+        "id": 2,
+        "name": "Prefeitura de Santos",
+        "tender_count": 7,
+    }
+
+
+def test_public_body_index_without_matches_returns_nothing():
+    index = make_index()
+
+    assert index.suggest("recife", limit=10) == []
+    assert index.suggest("   ", limit=10) == []
+    assert PublicBodyIndex([]).suggest("sao", limit=10) == []
@@ -0,0 +1,100 @@
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import func, select
+
+from src.infra.entities import PublicBodyEntity, TenderEntity
+from src.services.public_body_service import (
+    PublicBodyService,
+    normalize_public_body_name,
+    public_body_cache,
+)
+from tests.factories import CompanyFactory, TenderFactory
+
+
+def test_normalize_public_body_name_folds_case_accents_and_spaces():
+    assert normalize_public_body_name("  Prefeitura de  SÃO Paulo ") == (
+        "prefeitura de sao paulo"
+    )
+    assert normalize_public_body_name("Secretaria da Saúde") == (
+        normalize_public_body_name("SECRETARIA DA SAUDE")
+    )
+    assert normalize_public_body_name("Straße") == "strasse"
+
+
+@pytest.mark.asyncio
+async def test_public_body_service_interns_spelling_variants_once(
+    session, capture_statements
+):
+    service = PublicBodyService(session)
+
+    ids = await service.resolve_ids(["Câmara Municipal", "CAMARA MUNICIPAL", "Porto"])
+    await session.commit()
+
+    assert ids["Câmara Municipal"] == ids["CAMARA MUNICIPAL"] != ids["Porto"]
+    bodies = await session.scalars(
+        select(PublicBodyEntity).order_by(PublicBodyEntity.id)
+    )
+    assert [(b.normalized_name, b.name) for b in bodies] == [
+        ("camara municipal", "Câmara Municipal"),
+        ("porto", "Porto"),
+    ]
+
+    with capture_statements() as statements:
+        again = await service.resolve_ids(["camara  municipal"])
+
+    assert again == {"camara  municipal": ids["Câmara Municipal"]}
+    assert not statements
+
+
+@pytest.mark.asyncio
+async def test_public_body_service_caches_ids_only_after_commit(session):
+    service = PublicBodyService(session)
+
+    await service.resolve_ids(["Autarquia Rolada"])
+    await session.rollback()
+
+    assert public_body_cache.get("autarquia rolada") is None
+    ids = await service.resolve_ids(["Autarquia Rolada"])
+    await session.commit()
+    assert public_body_cache.get("autarquia rolada") == ids["Autarquia Rolada"]
+    assert await session.scalar(select(func.count(PublicBodyEntity.id))) == 1
+
+
+@pytest.mark.asyncio
+async def test_tenders_point_at_the_body_of_their_name(session, client, user, token):
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    factory_tender = TenderFactory(
+        company_id=company.id, public_body_name="Prefeitura de Itu"
+    )
+    session.add(factory_tender)
+    await session.commit()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.post(
+        f"/companies/{company.id}/tenders/",
+        headers=headers,
+        json={
+            "tender_number": factory_tender.tender_number + 1,
+            "tender_year": 2025,
+            "object_description": "Interned body",
+            "public_body_name": "PREFEITURA DE ITÚ",
+            "modality": "public_tender",
+            "format": "electronic",
+        },
+    )
+    created = response.json()
+    assert created["public_body_id"] == factory_tender.public_body_id
+
+    response = await client.patch(
+        f"/companies/{company.id}/tenders/{created['id']}",
+        headers=headers,
+        json={"public_body_name": "Câmara de Itu"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    moved = await session.get(TenderEntity, created["id"], populate_existing=True)
+    body = await session.get(PublicBodyEntity, moved.public_body_id)
+    assert response.json()["public_body_id"] == body.id
+    assert body.normalized_name == "camara de itu"
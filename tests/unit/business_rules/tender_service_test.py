@@ -1,3 +1,5 @@
+# pylint: disable=W0613:unused-argument
+
 from decimal import Decimal
 from http import HTTPStatus
 from types import SimpleNamespace
@@ -8,7 +10,12 @@ from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 
 from src.infra.entities import ParticipationResult, TenderStatus
-from src.schemas.tender import TenderCreateSchema, TenderUpdateSchema
+from src.schemas.tender import (
+    FilterTenderSchema,
+    TenderCreateSchema,
+    TenderUpdateSchema,
+)
+from src.services.public_body_service import PublicBodyService
 from src.services.tender_service import TenderService
 from tests.factories import CompanyFactory, TenderFactory
 
@@ -225,11 +232,16 @@ async def test_tender_service_list_with_filters_returns_matching_tenders(session
         session_date=tender.session_date,
         offset=0,
         limit=10,
+        cursor=None,
+        sort="id",
+        order="asc",
+        counts="none",
     )
 
     result = await service.list(company.id, filters)
-    assert len(result) == 1
-    assert result[0].id == tender.id
+    assert len(result.items) == 1
+    assert result.items[0].id == tender.id
+    assert result.next_cursor is None
 
 
 @pytest.mark.parametrize("status", list(TenderStatus))
@@ -357,3 +369,93 @@ async def test_tender_service_uniqueness_check_with_different_key_fields_passes(
 
     created = await service.create(company_id=company.id, data=data)
     assert created.id is not None
+
+
+@pytest.mark.asyncio
+async def test_tender_service_create_issues_a_single_statement(
+    session, capture_statements, user
+):
+    service = TenderService(session)
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    data = TenderCreateSchema(
+        tender_number=1,
+        tender_year=2026,
+        object_description="Valid object description",
+        public_body_name="City Hall",
+        modality="trading_session",
+        format="electronic",
+    )
+    # Interning a new public body costs two more statements, once.
+    await PublicBodyService(session).resolve_ids(["City Hall"])
+    await session.commit()
+    with capture_statements() as statements:
+        tender = await service.create(company.id, data)
+        with pytest.raises(HTTPException) as exc:
+            await service.create(company.id, data)
+
+    assert tender.id is not None
+    assert tender.created_at is not None
+    assert len(statements) == 2
+    assert all("ON CONFLICT" in executed.statement for executed in statements)
+    assert exc.value.status_code == HTTPStatus.CONFLICT
+    assert exc.value.detail == (
+        "A tender with these details is already registered for this company."
+    )
+
+
+@pytest.mark.asyncio
+async def test_tender_service_update_into_existing_identity_raises_conflict(
+    session, user
+):
+    service = TenderService(session)
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+
+    existing = TenderFactory(company_id=company.id, tender_number=1)
+    tender = TenderFactory(
+        company_id=company.id,
+        tender_number=2,
+        tender_year=existing.tender_year,
+        public_body_name=existing.public_body_name,
+        modality=existing.modality,
+        format=existing.format,
+    )
+    session.add_all([existing, tender])
+    await session.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        await service.update(tender.id, company.id, TenderUpdateSchema(tender_number=1))
+
+    assert exc.value.status_code == HTTPStatus.CONFLICT
+    assert exc.value.detail == (
+        "A tender with these details is already registered for this company."
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offset, page_size", [(0, 2), (10, 0)])
+async def test_tender_service_list_reads_page_and_counts_in_one_statement(
+    session, capture_statements, user, offset, page_size
+):
+    service = TenderService(session)
+    company = CompanyFactory(user_id=user.id)
+    session.add(company)
+    await session.commit()
+    session.add_all(
+        TenderFactory.create_batch(3, company_id=company.id, status="finished")
+    )
+    await session.commit()
+
+    with capture_statements() as statements:
+        page = await service.list(
+            company.id, FilterTenderSchema(limit=2, offset=offset, counts="exact")
+        )
+
+    assert len(statements) == 1
+    assert len(page.items) == page_size
+    assert page.totals["total"] == 3
+    assert page.totals["facets"]["status"] == [{"value": "finished", "count": 3}]
@@ -58,3 +58,38 @@ def test_tender_validator_valid_data_passes_validation():
         awarded_value=Decimal("1500.00"),
         status=TenderStatus.FINISHED,
     )
+
+
+def test_tender_validator_batch_returns_first_violation_per_record():
+    violations = TenderValidator.validate_batch(
+        participation_results=[
+            ParticipationResult.WON,
+            ParticipationResult.LOST,
+            ParticipationResult.WON,
+            ParticipationResult.PENDING,
+            None,
+        ],
+        awarded_values=[Decimal("10"), Decimal("5"), None, Decimal("5"), None],
+        statuses=[
+            TenderStatus.FINISHED,
+            TenderStatus.MONITORING,
+            TenderStatus.FINISHED,
+            TenderStatus.CANCELED,
+            None,
+        ],
+    )
+
+    assert [(v.index, v.code) for v in violations] == [
+        (1, "lost_with_value"),
+        (2, "won_without_value"),
+        (3, "value_for_status"),
+    ]
+    assert (
+        violations[2].message
+        == "Value cannot be greater than zero for status: canceled"
+    )
+
+
+def test_tender_validator_batch_with_mismatched_columns_raises_value_error():
+    with pytest.raises(ValueError):
+        TenderValidator.validate_batch([None], [], [None])
@@ -0,0 +1,34 @@
+import time
+
+import pytest
+
+from src.infra.revocation import RevocationList
+from src.services.token_service import TokenService
+
+
+@pytest.mark.asyncio
+async def test_token_service_sync_loads_persisted_revocations(session, user):
+    service = TokenService(session)
+    await service.revoke("live", user.id, time.time() + 600)
+    await service.revoke("expired", user.id, time.time() - 600)
+
+    await service.prune_expired()
+    revocations = RevocationList()
+    synced_until = await service.sync(revocations)
+
+    assert revocations.is_revoked("live")
+    assert len(revocations) == 1
+    assert synced_until is not None
+
+
+@pytest.mark.asyncio
+async def test_token_service_revoke_twice_is_idempotent(session, user):
+    service = TokenService(session)
+    expires_at = time.time() + 600
+
+    await service.revoke("same", user.id, expires_at)
+    await service.revoke("same", user.id, expires_at)
+
+    revocations = RevocationList()
+    await service.sync(revocations)
+    assert revocations.is_revoked("same")
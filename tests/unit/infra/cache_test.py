@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from freezegun import freeze_time
+
+from src.infra.cache import SingleFlight, TTLCache
+
+
+def test_cache_get_after_set_returns_value_and_counts_hit():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_cache_entry_expires_at_the_earliest_deadline():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+
+    with freeze_time("2024-01-01 12:00:00") as frozen:
+        cache.set("a", 1, expires_at=frozen().timestamp() + 10)
+        frozen.tick(11)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+def test_cache_over_capacity_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+
+def test_cache_invalidate_group_drops_only_that_group():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1, group=1)
+    cache.set("b", 2, group=1)
+    cache.set("c", 3, group=2)
+
+    cache.invalidate_group(1)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats.invalidations == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_runs_one_loader_for_concurrent_callers():
+    flights = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(flights.do("key", load) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert calls == 1
+    assert flights.coalesced == 4
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_the_loader_error_and_then_retries():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+    async def load():
+        return 1
+
+    assert await flights.do("key", load) == 1
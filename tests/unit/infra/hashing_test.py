@@ -0,0 +1,60 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infra.hashing import (
+    HashPoolSaturatedError,
+    PasswordHashPool,
+    calibrate_argon2,
+)
+
+
+async def test_hash_pool_hash_and_verify_round_trip():
+    pool = PasswordHashPool(workers=1, queue_size=0)
+
+    hashed = await pool.hash("secret")
+
+    assert await pool.verify("secret", hashed)
+    assert not await pool.verify("other", hashed)
+    assert pool.latency["hash"].count == 1
+    assert pool.latency["verify"].count == 2
+    pool.shutdown()
+
+
+async def test_hash_pool_when_full_rejects_without_queueing():
+    pool = PasswordHashPool(workers=1, queue_size=1)
+    release = threading.Event()
+
+    first = asyncio.create_task(pool.run("hash", release.wait))
+    second = asyncio.create_task(pool.run("hash", release.wait))
+    await asyncio.sleep(0)
+
+    assert pool.in_flight == 2
+    assert pool.queue_depth == 1
+
+    with pytest.raises(HashPoolSaturatedError):
+        await pool.run("hash", release.wait)
+
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert pool.rejected == 1
+    assert pool.in_flight == 0
+    pool.shutdown()
+
+
+def test_calibrate_argon2_returns_parameters_within_target():
+    result = calibrate_argon2(
+        target_ms=10_000, memory_costs=[64, 128], parallelism=1, max_time_cost=2
+    )
+
+    assert result.memory_cost == 128
+    assert result.time_cost == 2
+    assert result.elapsed_ms <= 10_000
+
+
+def test_calibrate_argon2_with_unreachable_target_returns_none():
+    result = calibrate_argon2(target_ms=0, memory_costs=[64], parallelism=1)
+
+    assert result is None
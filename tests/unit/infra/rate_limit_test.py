@@ -0,0 +1,33 @@
+from freezegun import freeze_time
+
+from src.infra.rate_limit import BucketPolicy, InMemoryRateLimitStore, LoginThrottle
+
+
+async def test_rate_limit_store_rejects_when_bucket_is_empty_then_refills():
+    store = InMemoryRateLimitStore()
+    policy = BucketPolicy(capacity=2, refill_per_second=1)
+
+    with freeze_time("2024-01-01 12:00:00") as frozen:
+        assert (await store.consume("k", policy)).allowed
+        assert (await store.consume("k", policy)).allowed
+
+        decision = await store.consume("k", policy)
+        assert not decision.allowed
+        assert decision.retry_after == 1
+
+        frozen.tick(1)
+        assert (await store.consume("k", policy)).allowed
+
+
+async def test_login_throttle_counts_rejections_per_key_kind():
+    throttle = LoginThrottle(
+        store=InMemoryRateLimitStore(),
+        email_policy=BucketPolicy(capacity=1, refill_per_second=0.01),
+        ip_policy=BucketPolicy(capacity=10, refill_per_second=0.01),
+    )
+
+    assert (await throttle.check("a@test.com", "1.1.1.1")).allowed
+    assert not (await throttle.check("A@test.com", "1.1.1.1")).allowed
+    assert (await throttle.check("b@test.com", "1.1.1.1")).allowed
+
+    assert throttle.snapshot() == {"allowed": 2, "rejected": {"email": 1, "ip": 0}}
@@ -0,0 +1,27 @@
+from freezegun import freeze_time
+
+from src.infra.revocation import RevocationList
+
+
+def test_revocation_list_reports_revoked_jti_until_it_expires():
+    revocations = RevocationList()
+
+    with freeze_time("2024-01-01 12:00:00") as frozen:
+        revocations.add("abc", frozen().timestamp() + 60)
+
+        assert revocations.is_revoked("abc")
+        assert not revocations.is_revoked("other")
+
+        frozen.tick(61)
+
+        assert not revocations.is_revoked("abc")
+        assert len(revocations) == 0
+
+
+def test_revocation_list_ignores_already_expired_entries():
+    revocations = RevocationList()
+
+    with freeze_time("2024-01-01 12:00:00") as frozen:
+        revocations.load([("abc", frozen().timestamp() - 1)])
+
+    assert len(revocations) == 0